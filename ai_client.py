@@ -15,9 +15,14 @@ Install:
 """
 
 import os
+import re
 import json
 import time
 import logging
+import threading
+
+from config import RATE_LIMIT_MAX_WAIT
+from rate_limit import acquire, get_limiter, retry_after
 
 log = logging.getLogger("AIClient")
 
@@ -30,6 +35,127 @@ GROQ_MODEL   = "llama-3.3-70b-versatile"   # Best free Groq model
 GEMINI_MODEL = "gemini-1.5-flash-latest"   # Stable free model           # Free Gemini tier
 
 
+_RETRY_HINT = re.compile(r"(?:try again in|retry in|retry_delay \{\s*seconds:)\s*([\d.]+)")
+
+
+def _backoff_from_error(provider: str, err: Exception) -> float | None:
+    """
+    If `err` is a rate-limit error, block `provider` in the shared limiter for as long as
+    the server asked (Retry-After header, else the "try again in Ns" hint, else 60s).
+    Returns that wait, or None for other errors.
+    """
+    resp   = getattr(err, "response", None)
+    status = getattr(err, "status_code", None) or getattr(resp, "status_code", None)
+    text   = str(err).lower()
+    if status != 429 and not any(s in text for s in ("429", "rate limit", "quota")):
+        return None
+    wait = retry_after(getattr(resp, "headers", None))
+    if wait is None:
+        m = _RETRY_HINT.search(text)
+        wait = float(m.group(1)) if m else 60.0
+    get_limiter().penalize(provider, wait)
+    return wait
+
+
+# ─── Conversion caches ─────────────────────────────────────────────────────────
+# Tool schemas are converted once per tool list, and a conversation's messages once each:
+# run_agent only ever appends to its message list, so each turn converts just the new tail.
+MODEL_CACHE_SIZE = 16
+_tool_cache      = {}    # (provider, id(tools)) -> (tools, converted)
+_tool_cache_lock = threading.Lock()
+
+def _cached_tools(tools: list, provider: str, convert):
+    if not tools:
+        return None
+    key = (provider, id(tools))
+    with _tool_cache_lock:
+        hit = _tool_cache.get(key)
+        if hit and hit[0] is tools:     # holding `tools` keeps its id from being reused
+            return hit[1]
+        converted = convert(tools)
+        if len(_tool_cache) >= MODEL_CACHE_SIZE:
+            _tool_cache.clear()
+        _tool_cache[key] = (tools, converted)
+        return converted
+
+
+class _Conversion:
+    """Provider-format copy of one growing message list."""
+
+    def __init__(self):
+        self.source, self.key, self.count, self.out = None, None, 0, []
+
+    def convert(self, messages: list, key, convert_one, prefix: list = ()) -> list:
+        if self.source is not messages or self.key != key or len(messages) < self.count:
+            self.source, self.key, self.count, self.out = messages, key, 0, list(prefix)
+        for msg in messages[self.count:]:
+            self.out.extend(convert_one(msg))
+        self.count = len(messages)
+        return self.out
+
+
+_local = threading.local()   # per thread and provider — concurrent callers don't trample it
+
+def _conversions(provider: str) -> _Conversion:
+    if not hasattr(_local, "conversions"):
+        _local.conversions = {}
+    return _local.conversions.setdefault(provider, _Conversion())
+
+
+def _groq_tools(tools: list) -> list:
+    return [
+        {
+            "type": "function",
+            "function": {
+                "name":        tool["name"],
+                "description": tool["description"],
+                "parameters":  tool["input_schema"]
+            }
+        }
+        for tool in tools
+    ]
+
+
+def _groq_messages(msg: dict) -> list:
+    """One of our messages → the OpenAI-style message(s) Groq expects."""
+    if isinstance(msg.get("content"), list) and msg["role"] != "assistant":
+        # Handle tool result messages
+        return [
+            {
+                "role": "tool",
+                "tool_call_id": block["tool_use_id"],
+                "content": str(block["content"])
+            }
+            for block in msg["content"] if block.get("type") == "tool_result"
+        ]
+
+    role    = msg["role"]
+    content = msg.get("content", "")
+
+    # Handle assistant messages with tool calls
+    if role == "assistant" and isinstance(content, list):
+        tool_calls = []
+        text_parts = []
+        for block in content:
+            if isinstance(block, dict):
+                if block.get("type") == "tool_use":
+                    tool_calls.append({
+                        "id": block["id"],
+                        "type": "function",
+                        "function": {
+                            "name": block["name"],
+                            "arguments": json.dumps(block["input"])
+                        }
+                    })
+                elif block.get("type") == "text":
+                    text_parts.append(block["text"])
+        msg_out = {"role": "assistant", "content": " ".join(text_parts)}
+        if tool_calls:
+            msg_out["tool_calls"] = tool_calls
+        return [msg_out]
+    return [{"role": role, "content": str(content)}]
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # GROQ CLIENT
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -55,70 +181,26 @@ class GroqClient:
           "stop_reason": str       # "end_turn" | "tool_use"
         }
         """
-        # Groq uses OpenAI-compatible format
-        groq_messages = []
-
-        if system:
-            groq_messages.append({"role": "system", "content": system})
-
-        for msg in messages:
-            if isinstance(msg.get("content"), list):
-                # Handle tool result messages
-                for block in msg["content"]:
-                    if block.get("type") == "tool_result":
-                        groq_messages.append({
-                            "role": "tool",
-                            "tool_call_id": block["tool_use_id"],
-                            "content": str(block["content"])
-                        })
-            else:
-                role    = msg["role"]
-                content = msg.get("content", "")
-
-                # Handle assistant messages with tool calls
-                if role == "assistant" and isinstance(content, list):
-                    tool_calls = []
-                    text_parts = []
-                    for block in content:
-                        if isinstance(block, dict):
-                            if block.get("type") == "tool_use":
-                                tool_calls.append({
-                                    "id": block["id"],
-                                    "type": "function",
-                                    "function": {
-                                        "name": block["name"],
-                                        "arguments": json.dumps(block["input"])
-                                    }
-                                })
-                            elif block.get("type") == "text":
-                                text_parts.append(block["text"])
-                    msg_out = {"role": "assistant", "content": " ".join(text_parts)}
-                    if tool_calls:
-                        msg_out["tool_calls"] = tool_calls
-                    groq_messages.append(msg_out)
-                else:
-                    groq_messages.append({"role": role, "content": str(content)})
-
-        # Convert tools to Groq/OpenAI format
-        groq_tools = []
-        for tool in tools:
-            groq_tools.append({
-                "type": "function",
-                "function": {
-                    "name":        tool["name"],
-                    "description": tool["description"],
-                    "parameters":  tool["input_schema"]
-                }
-            })
-
-        response = self.client.chat.completions.create(
-            model=GROQ_MODEL,
-            messages=groq_messages,
-            tools=groq_tools if groq_tools else None,
-            tool_choice="auto",
-            max_tokens=4096,
-            temperature=0.1
+        # Groq uses OpenAI-compatible format — only messages added since the last turn are converted
+        groq_messages = _conversions("groq").convert(
+            messages, ("groq", system), _groq_messages,
+            prefix=[{"role": "system", "content": system}] if system else []
         )
+        groq_tools = _cached_tools(tools, "groq", _groq_tools)
+
+        acquire("groq")
+        try:
+            response = self.client.chat.completions.create(
+                model=GROQ_MODEL,
+                messages=list(groq_messages),
+                tools=groq_tools if groq_tools else None,
+                tool_choice="auto",
+                max_tokens=4096,
+                temperature=0.1
+            )
+        except Exception as e:
+            _backoff_from_error("groq", e)
+            raise
 
         choice  = response.choices[0]
         message = choice.message
@@ -165,6 +247,45 @@ class GeminiClient:
             self.available = True
         except ImportError:
             raise ImportError("Run: pip install google-generativeai")
+        self._models = {}   # (model, system prompt, id(tools)) -> (tools, GenerativeModel)
+
+    def _model(self, tools: list, system: str):
+        """The GenerativeModel for this system prompt + tool set, built once and reused."""
+        key = (GEMINI_MODEL, system, id(tools) if tools else None)
+        hit = self._models.get(key)
+        if hit and (not tools or hit[0] is tools):
+            return hit[1]
+        model = self.genai.GenerativeModel(
+            model_name=GEMINI_MODEL,
+            system_instruction=system,
+            tools=_cached_tools(tools, "gemini", self._build_tools)
+        )
+        if len(self._models) >= MODEL_CACHE_SIZE:
+            self._models.clear()
+        self._models[key] = (tools or None, model)
+        return model
+
+    def _content(self, msg: dict) -> list:
+        """One of our messages → a Gemini Content."""
+        protos  = self.genai.protos
+        role    = msg["role"]
+        content = msg.get("content", "")
+
+        if isinstance(content, list):
+            # Tool results
+            parts = [
+                protos.Part(
+                    function_response=protos.FunctionResponse(
+                        name=block.get("tool_use_id", "tool"),
+                        response={"result": str(block["content"])}
+                    )
+                )
+                for block in content if block.get("type") == "tool_result"
+            ]
+            return [protos.Content(role="user", parts=parts)]
+
+        gemini_role = "model" if role == "assistant" else "user"
+        return [protos.Content(role=gemini_role, parts=[protos.Part(text=str(content))])]
 
     def _build_tools(self, tools: list):
         """Convert our tool format to Gemini function declarations."""
@@ -185,58 +306,32 @@ class GeminiClient:
 
     def chat(self, messages: list, tools: list, system: str = "") -> dict:
         """Send messages to Gemini and return normalized response."""
-        gemini_tools = self._build_tools(tools) if tools else None
-
-        model = self.genai.GenerativeModel(
-            model_name=GEMINI_MODEL,
-            system_instruction=system,
-            tools=gemini_tools
+        model = self._model(tools, system)
+
+        # Convert messages to Gemini format — only those added since the last turn
+        history   = _conversions("gemini").convert(messages, ("gemini", system), self._content)
+        last_user = next(
+            (m.get("content") for m in reversed(messages)
+             if m["role"] == "user" and not isinstance(m.get("content"), list)),
+            None
         )
 
-        # Convert messages to Gemini format
-        history   = []
-        last_user = None
-
-        for msg in messages:
-            role    = msg["role"]
-            content = msg.get("content", "")
-
-            if isinstance(content, list):
-                # Tool results
-                parts = []
-                for block in content:
-                    if block.get("type") == "tool_result":
-                        parts.append(
-                            self.genai.protos.Part(
-                                function_response=self.genai.protos.FunctionResponse(
-                                    name=block.get("tool_use_id", "tool"),
-                                    response={"result": str(block["content"])}
-                                )
-                            )
-                        )
-                history.append({"role": "user", "parts": parts})
-            else:
-                gemini_role = "model" if role == "assistant" else "user"
-                history.append({"role": gemini_role, "parts": [str(content)]})
-                if gemini_role == "user":
-                    last_user = str(content)
-
         # Extract the last user message to send
-        send_message = last_user or "Continue."
+        send_message = str(last_user) if last_user is not None else "Continue."
         chat_history = history[:-1] if history else []
 
         chat = model.start_chat(history=chat_history)
-        # Retry once on rate limit
+        # Retry once on rate limit, if the server's back-off is short enough to wait out
+        acquire("gemini")
         try:
             response = chat.send_message(send_message)
         except Exception as rate_err:
-            if "429" in str(rate_err) or "quota" in str(rate_err).lower():
-                import time
-                log.warning("Gemini rate limit — waiting 60s then retrying...")
-                time.sleep(60)
-                response = chat.send_message(send_message)
-            else:
+            wait = _backoff_from_error("gemini", rate_err)
+            if wait is None or wait > RATE_LIMIT_MAX_WAIT:
                 raise
+            log.warning(f"Gemini rate limit — waiting {wait:.0f}s then retrying...")
+            acquire("gemini")
+            response = chat.send_message(send_message)
 
         # Parse response
         candidate = response.candidates[0]
@@ -7,13 +7,17 @@ ai_tools.py — Claude-Powered Career Tools
 • Interview Prep        — Generate likely interview questions + answers
 """
 
-import anthropic
 import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from config import RESUME_FILE
+from job_store import get_store
+from llm_cache import cached_completion
 
-client = anthropic.Anthropic()
-RESUME_FILE       = "my_resume.txt"
+MODEL             = "claude-opus-4-6"
 COVER_LETTERS_DIR = "cover_letters"
 INTERVIEW_DIR     = "interview_prep"
 
@@ -39,6 +43,41 @@ def header(title):
     print(f"{bold(C.BLUE + '═' * 62 + C.RESET)}\n")
 
 
+# ─── Model Calls ───────────────────────────────────────────────────────────────
+# The SDK import and client are deferred to the first model call — opening a menu
+# shouldn't pay for them, or fail because ANTHROPIC_API_KEY isn't set yet
+_anthropic      = None
+_anthropic_lock = threading.Lock()
+
+def get_anthropic():
+    """Get or create the shared Anthropic client (also used by reminders.py)."""
+    global _anthropic
+    if _anthropic is None:
+        with _anthropic_lock:       # "Do ALL" calls this from several threads at once
+            if _anthropic is None:
+                import anthropic
+                _anthropic = anthropic.Anthropic()
+    return _anthropic
+
+# Bump a template's version whenever its prompt text changes — old cached answers stop matching
+PROMPT_VERSIONS = {"match_score": 1, "tailor_resume": 1, "cover_letter": 1, "interview_prep": 1}
+
+def ask(template: str, prompt: str, max_tokens: int, resume: str, jd: str,
+        options: dict = None, refresh: bool = False) -> str:
+    """Run `prompt` through the cache — same resume, JD and options return the saved answer."""
+    def generate():
+        response = get_anthropic().messages.create(
+            model=MODEL,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}]
+        )
+        return response.content[0].text.strip()
+
+    options = {**(options or {}), "max_tokens": max_tokens}
+    return cached_completion(template, PROMPT_VERSIONS[template], MODEL, generate,
+                             resume=resume, jd=jd, options=options, refresh=refresh)
+
+
 # ─── Resume Loader ─────────────────────────────────────────────────────────────
 def load_resume() -> str:
     """Load resume from file, or prompt user to paste it."""
@@ -88,21 +127,8 @@ def get_job_description(job: dict) -> str:
 
 
 # ─── 1. JOB MATCH SCORER ──────────────────────────────────────────────────────
-def score_job_match(job: dict) -> dict:
-    """
-    Use Claude to score how well the user's resume matches a job.
-    Returns score, matched keywords, missing skills, recommendation.
-    """
-    clear()
-    header(f"Job Match Scorer — {job['title']} @ {job['company']}")
-
-    resume = ensure_resume()
-    print(f"\n  {cyan('Paste the job description for this role:')}")
-    jd = get_job_description(job)
-
-    print(f"\n  {gray('🤖 Analysing match...')}\n")
-
-    prompt = f"""You are an expert ATS (Applicant Tracking System) and career coach.
+def match_prompt(resume: str, jd: str) -> str:
+    return f"""You are an expert ATS (Applicant Tracking System) and career coach.
 
 Analyse how well this resume matches the job description and return a JSON object ONLY (no other text).
 
@@ -124,13 +150,10 @@ Return this exact JSON structure:
   "recommendation": "<2-3 sentence actionable advice>"
 }}"""
 
-    response = client.messages.create(
-        model="claude-opus-4-6",
-        max_tokens=1024,
-        messages=[{"role": "user", "content": prompt}]
-    )
 
-    raw = response.content[0].text.strip()
+def run_match(resume: str, jd: str, refresh: bool = False) -> dict:
+    """Score the match without any prompting or output — shared by the menu and batch mode."""
+    raw = ask("match_score", match_prompt(resume, jd), 1024, resume, jd, refresh=refresh)
     # Strip markdown fences if present
     if raw.startswith("```"):
         raw = raw.split("```")[1]
@@ -144,7 +167,12 @@ Return this exact JSON structure:
         result = {"score": 0, "grade": "?", "verdict": raw, "matched_keywords": [],
                   "missing_skills": [], "strengths": [], "weaknesses": [], "recommendation": raw}
 
-    # Display results
+    result["scored_at"] = datetime.now().isoformat()
+    result["job_description"] = jd
+    return result
+
+
+def show_match(result: dict):
     score = result.get("score", 0)
     grade = result.get("grade", "?")
 
@@ -188,30 +216,31 @@ Return this exact JSON structure:
         print(f"  {bold('💡 Recommendation:')}")
         print(f"  {result['recommendation']}\n")
 
-    # Save score to job
-    result["scored_at"] = datetime.now().isoformat()
-    result["job_description"] = jd
 
-    pause()
-    return result
-
-
-# ─── 2. RESUME TAILOR ─────────────────────────────────────────────────────────
-def tailor_resume(job: dict) -> str:
+def score_job_match(job: dict, refresh: bool = False) -> dict:
     """
-    Use Claude to rewrite resume bullet points to better match this job.
-    Returns the tailored resume as a string.
+    Use Claude to score how well the user's resume matches a job.
+    Returns score, matched keywords, missing skills, recommendation.
     """
     clear()
-    header(f"Resume Tailor — {job['title']} @ {job['company']}")
+    header(f"Job Match Scorer — {job['title']} @ {job['company']}")
 
     resume = ensure_resume()
-    print(f"\n  {cyan('Paste the job description:')}")
+    print(f"\n  {cyan('Paste the job description for this role:')}")
     jd = get_job_description(job)
 
-    print(f"\n  {gray('🤖 Tailoring your resume...')}\n")
+    print(f"\n  {gray('🤖 Analysing match...')}\n")
+
+    result = run_match(resume, jd, refresh)
+    show_match(result)
+
+    pause()
+    return result
 
-    prompt = f"""You are an expert resume writer and career coach.
+
+# ─── 2. RESUME TAILOR ─────────────────────────────────────────────────────────
+def tailor_prompt(resume: str, jd: str) -> str:
+    return f"""You are an expert resume writer and career coach.
 
 Rewrite the resume below to better match the job description. Follow these rules:
 1. Keep all the same jobs, companies, dates and education — do NOT invent anything
@@ -229,15 +258,11 @@ JOB DESCRIPTION:
 
 Output the full tailored resume only. No explanations, no preamble."""
 
-    response = client.messages.create(
-        model="claude-opus-4-6",
-        max_tokens=4096,
-        messages=[{"role": "user", "content": prompt}]
-    )
 
-    tailored = response.content[0].text.strip()
+def run_tailor(job: dict, resume: str, jd: str, refresh: bool = False) -> tuple:
+    """Generate and save the tailored resume. Returns (text, filename)."""
+    tailored = ask("tailor_resume", tailor_prompt(resume, jd), 4096, resume, jd, refresh=refresh)
 
-    # Save to file
     os.makedirs("tailored_resumes", exist_ok=True)
     safe_company = "".join(c for c in job["company"] if c.isalnum() or c in " _-").strip()
     filename = f"tailored_resumes/resume_{safe_company}_{datetime.now().strftime('%Y%m%d')}.txt"
@@ -248,6 +273,25 @@ Output the full tailored resume only. No explanations, no preamble."""
         f.write("=" * 60 + "\n\n")
         f.write(tailored)
 
+    return tailored, filename
+
+
+def tailor_resume(job: dict, refresh: bool = False) -> str:
+    """
+    Use Claude to rewrite resume bullet points to better match this job.
+    Returns the tailored resume as a string.
+    """
+    clear()
+    header(f"Resume Tailor — {job['title']} @ {job['company']}")
+
+    resume = ensure_resume()
+    print(f"\n  {cyan('Paste the job description:')}")
+    jd = get_job_description(job)
+
+    print(f"\n  {gray('🤖 Tailoring your resume...')}\n")
+
+    tailored, filename = run_tailor(job, resume, jd, refresh)
+
     print(f"  {bold('📄 Tailored Resume Preview:')}\n")
     print(f"  {gray('─' * 55)}")
     # Show first 40 lines
@@ -264,28 +308,19 @@ Output the full tailored resume only. No explanations, no preamble."""
 
 
 # ─── 3. COVER LETTER GENERATOR ────────────────────────────────────────────────
-def generate_cover_letter(job: dict) -> str:
-    """
-    Generate a personalized cover letter for a specific job.
-    """
-    clear()
-    header(f"Cover Letter — {job['title']} @ {job['company']}")
-
-    resume = ensure_resume()
-    print(f"\n  {cyan('Paste the job description:')}")
-    jd = get_job_description(job)
-
-    # Get user name from resume or ask
+def ask_cover_letter_details() -> dict:
+    """Name, hiring manager and tone for the cover letter."""
     print(f"\n  {gray('A few quick questions for personalization:')}\n")
     user_name    = input(f"  {bold('→')} Your full name: ").strip()
     hiring_mgr   = input(f"  {bold('→')} Hiring manager name (or press Enter for 'Hiring Team'): ").strip() or "Hiring Team"
     tone_choice  = input(f"  {bold('→')} Tone — [1] Professional  [2] Enthusiastic  [3] Concise: ").strip()
     tone_map     = {"1": "professional and formal", "2": "enthusiastic and energetic", "3": "concise and direct"}
     tone         = tone_map.get(tone_choice, "professional and formal")
+    return {"user_name": user_name, "hiring_mgr": hiring_mgr, "tone": tone}
 
-    print(f"\n  {gray('🤖 Writing your cover letter...')}\n")
 
-    prompt = f"""Write a compelling, personalized cover letter for this job application.
+def cover_letter_prompt(resume: str, jd: str, user_name: str, hiring_mgr: str, tone: str) -> str:
+    return f"""Write a compelling, personalized cover letter for this job application.
 
 Applicant Name: {user_name}
 Hiring Manager: {hiring_mgr}
@@ -309,21 +344,37 @@ Instructions:
 
 Write the cover letter only. No explanations."""
 
-    response = client.messages.create(
-        model="claude-opus-4-6",
-        max_tokens=1024,
-        messages=[{"role": "user", "content": prompt}]
-    )
 
-    letter = response.content[0].text.strip()
+def run_cover_letter(job: dict, resume: str, jd: str, details: dict, refresh: bool = False) -> tuple:
+    """Generate and save the cover letter. Returns (text, filename)."""
+    letter = ask("cover_letter", cover_letter_prompt(resume, jd, **details), 1024, resume, jd,
+                 options=details, refresh=refresh)
 
-    # Save to file
     os.makedirs(COVER_LETTERS_DIR, exist_ok=True)
     safe_company = "".join(c for c in job["company"] if c.isalnum() or c in " _-").strip()
     filename = f"{COVER_LETTERS_DIR}/cover_{safe_company}_{datetime.now().strftime('%Y%m%d')}.txt"
 
     with open(filename, "w") as f:
         f.write(letter)
+    return letter, filename
+
+
+def generate_cover_letter(job: dict, refresh: bool = False) -> str:
+    """
+    Generate a personalized cover letter for a specific job.
+    """
+    clear()
+    header(f"Cover Letter — {job['title']} @ {job['company']}")
+
+    resume = ensure_resume()
+    print(f"\n  {cyan('Paste the job description:')}")
+    jd = get_job_description(job)
+
+    details = ask_cover_letter_details()
+
+    print(f"\n  {gray('🤖 Writing your cover letter...')}\n")
+
+    letter, filename = run_cover_letter(job, resume, jd, details, refresh)
 
     # Display
     print(f"  {bold('✉️  Your Cover Letter:')}\n")
@@ -337,20 +388,8 @@ Write the cover letter only. No explanations."""
 
 
 # ─── 4. INTERVIEW PREP ────────────────────────────────────────────────────────
-def generate_interview_prep(job: dict) -> str:
-    """
-    Generate likely interview questions + suggested answers for a job.
-    """
-    clear()
-    header(f"Interview Prep — {job['title']} @ {job['company']}")
-
-    resume = ensure_resume()
-    print(f"\n  {cyan('Paste the job description:')}")
-    jd = get_job_description(job)
-
-    print(f"\n  {gray('🤖 Generating interview questions and answers...')}\n")
-
-    prompt = f"""You are an expert interview coach preparing a candidate for a job interview.
+def interview_prep_prompt(job: dict, resume: str, jd: str) -> str:
+    return f"""You are an expert interview coach preparing a candidate for a job interview.
 
 Generate a comprehensive interview preparation guide for this role.
 
@@ -388,15 +427,12 @@ Things in this role/company description that might be worth clarifying.
 
 Be specific to THIS role and company. Not generic advice."""
 
-    response = client.messages.create(
-        model="claude-opus-4-6",
-        max_tokens=4096,
-        messages=[{"role": "user", "content": prompt}]
-    )
 
-    prep = response.content[0].text.strip()
+def run_interview_prep(job: dict, resume: str, jd: str, refresh: bool = False) -> tuple:
+    """Generate and save the interview prep guide. Returns (text, filename)."""
+    prep = ask("interview_prep", interview_prep_prompt(job, resume, jd), 4096, resume, jd,
+               options={"company": job["company"], "title": job["title"]}, refresh=refresh)
 
-    # Save to file
     os.makedirs(INTERVIEW_DIR, exist_ok=True)
     safe_company = "".join(c for c in job["company"] if c.isalnum() or c in " _-").strip()
     filename = f"{INTERVIEW_DIR}/prep_{safe_company}_{datetime.now().strftime('%Y%m%d')}.txt"
@@ -406,6 +442,23 @@ Be specific to THIS role and company. Not generic advice."""
         f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n")
         f.write("=" * 60 + "\n\n")
         f.write(prep)
+    return prep, filename
+
+
+def generate_interview_prep(job: dict, refresh: bool = False) -> str:
+    """
+    Generate likely interview questions + suggested answers for a job.
+    """
+    clear()
+    header(f"Interview Prep — {job['title']} @ {job['company']}")
+
+    resume = ensure_resume()
+    print(f"\n  {cyan('Paste the job description:')}")
+    jd = get_job_description(job)
+
+    print(f"\n  {gray('🤖 Generating interview questions and answers...')}\n")
+
+    prep, filename = run_interview_prep(job, resume, jd, refresh)
 
     # Show preview
     print(f"  {bold('🎤 Interview Prep Guide Preview:')}\n")
@@ -426,9 +479,72 @@ Be specific to THIS role and company. Not generic advice."""
     return prep
 
 
+# ─── 5. ALL TOOLS AT ONCE ─────────────────────────────────────────────────────
+BATCH_LABELS = {"match": "🎯 Match score", "tailor": "📄 Tailored resume",
+                "cover": "✉️  Cover letter", "prep": "🎤 Interview prep"}
+
+def run_all_tools(job: dict, refresh: bool = False) -> dict:
+    """
+    Ask for the resume, job description and cover-letter details once, then run all
+    four generations concurrently. Each artifact is saved the moment it's ready,
+    so the whole batch takes about as long as the slowest one.
+    Returns {"match": dict, "tailor" / "cover" / "prep": (text, filename)} for the ones that succeeded.
+    """
+    clear()
+    header(f"All AI Tools — {job['title']} @ {job['company']}")
+
+    resume = ensure_resume()
+    print(f"\n  {cyan('Paste the job description for this role:')}")
+    jd      = get_job_description(job)
+    details = ask_cover_letter_details()
+
+    tasks = {
+        "match":  lambda: run_match(resume, jd, refresh),
+        "tailor": lambda: run_tailor(job, resume, jd, refresh),
+        "cover":  lambda: run_cover_letter(job, resume, jd, details, refresh),
+        "prep":   lambda: run_interview_prep(job, resume, jd, refresh),
+    }
+    print(f"\n  {gray(f'🤖 Running {len(tasks)} generations in parallel...')}\n")
+
+    start, results = time.monotonic(), {}
+    with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+        futures = {pool.submit(fn): name for name, fn in tasks.items()}
+        for done, future in enumerate(as_completed(futures), 1):
+            name    = futures[future]
+            label   = BATCH_LABELS[name]
+            elapsed = f"{time.monotonic() - start:.1f}s"
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                print(f"  [{done}/{len(tasks)}] {red('❌')} {label}  {gray(f'{elapsed} — {e}')}")
+                continue
+            out   = results[name]
+            where = f"→ {out[1]}" if isinstance(out, tuple) else f"{out.get('score', 0)}/100"
+            print(f"  [{done}/{len(tasks)}] {green('✅')} {label}  {gray(f'{elapsed}  {where}')}")
+
+    if "match" in results:
+        print()
+        show_match(results["match"])
+    ok = len(results) == len(tasks)
+    print(green("\n  ✅ All AI tools complete! Check your folders for saved files.") if ok
+          else yellow(f"\n  ⚠  {len(results)}/{len(tasks)} tools finished — see errors above."))
+    pause()
+    return results
+
+
 # ─── AI Tools Menu ─────────────────────────────────────────────────────────────
-def ai_tools_menu(job: dict, jobs: list) -> list:
-    """Sub-menu for all AI career tools for a specific job."""
+def _match_fields(result: dict) -> dict:
+    """The job fields a match-score result sets."""
+    return {
+        "match_score":      result.get("score"),
+        "match_grade":      result.get("grade"),
+        "matched_keywords": result.get("matched_keywords", []),
+        "missing_skills":   result.get("missing_skills", []),
+    }
+
+
+def ai_tools_menu(job: dict) -> dict:
+    """Sub-menu for all AI career tools for a specific job. Returns the updated job."""
     while True:
         clear()
         header(f"AI Tools — {job['title']} @ {job['company']}")
@@ -444,56 +560,44 @@ def ai_tools_menu(job: dict, jobs: list) -> list:
         print(f"  {bold('[3]')} ✉️  Generate cover letter")
         print(f"  {bold('[4]')} 🎤 Generate interview prep")
         print(f"  {bold('[5]')} 📋 Do ALL of the above")
+        print(f"  {bold('[R#]')} 🔄 Regenerate, skipping saved answers (e.g. R3)")
         print(f"  {bold('[0]')} Back\n")
 
-        choice = input(f"  {bold('→')} Choose: ").strip()
+        choice  = input(f"  {bold('→')} Choose: ").strip().upper()
+        refresh = choice.startswith("R")
+        choice  = choice.removeprefix("R")
 
+        changes = {}    # just the fields this tool set — the rest of the row is untouched
         if choice == "1":
-            result = score_job_match(job)
-            job["match_score"]      = result.get("score")
-            job["match_grade"]      = result.get("grade")
-            job["matched_keywords"] = result.get("matched_keywords", [])
-            job["missing_skills"]   = result.get("missing_skills", [])
+            result = score_job_match(job, refresh)
+            changes.update(_match_fields(result))
 
         elif choice == "2":
-            tailor_resume(job)
+            tailor_resume(job, refresh)
 
         elif choice == "3":
-            letter = generate_cover_letter(job)
-            job["cover_letter_generated"] = True
+            letter = generate_cover_letter(job, refresh)
+            changes["cover_letter_generated"] = True
 
         elif choice == "4":
-            generate_interview_prep(job)
-            job["interview_prep_generated"] = True
+            generate_interview_prep(job, refresh)
+            changes["interview_prep_generated"] = True
 
         elif choice == "5":
-            print(f"\n  {cyan('Running all AI tools...')}\n")
-            result = score_job_match(job)
-            job["match_score"]      = result.get("score")
-            job["match_grade"]      = result.get("grade")
-            job["matched_keywords"] = result.get("matched_keywords", [])
-            job["missing_skills"]   = result.get("missing_skills", [])
-            tailor_resume(job)
-            generate_cover_letter(job)
-            generate_interview_prep(job)
-            job["cover_letter_generated"]  = True
-            job["interview_prep_generated"] = True
-            print(green("\n  ✅ All AI tools complete! Check your folders for saved files."))
-            pause()
+            batch = run_all_tools(job, refresh)
+            if "match" in batch:
+                changes.update(_match_fields(batch["match"]))
+            if "cover" in batch:
+                changes["cover_letter_generated"]  = True
+            if "prep" in batch:
+                changes["interview_prep_generated"] = True
 
         elif choice == "0":
             break
 
-        # Save updated job back to list
-        for i, j in enumerate(jobs):
-            if j["id"] == job["id"]:
-                jobs[i] = job
-                break
-
-        # Persist — local import to avoid circular dependency
-        import json
-        with open('saved_jobs.json', 'w') as _f:
-            for idx, _j in enumerate(jobs): _j['id'] = idx + 1
-            json.dump(jobs, _f, indent=2)
+        # Keep the caller's `job` dict in step and write only what changed
+        if changes:
+            job.update(changes)
+            get_store().update_job(job["id"], changes)
 
-    return jobs
+    return job
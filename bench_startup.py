@@ -0,0 +1,79 @@
+"""
+bench_startup.py — Time-to-First-Menu Benchmark
+================================================
+• Starts `python launch.py` (or job_manager.py) and times it until the menu
+  prompt is on screen — splash, quick stats, reminder count, menu — then quits it
+• Best of STARTUP_RUNS runs, checked against STARTUP_BUDGET_MS; exits 1 when over
+  budget, so it can run in CI
+• Lists the slowest imports on the way to the menu (python -X importtime), so a
+  regression points straight at the module that caused it
+
+Run:  python bench_startup.py                  — time launch.py
+      python bench_startup.py job_manager.py   — time the job manager
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+from config import STARTUP_BUDGET_MS, STARTUP_RUNS
+
+# The prompt each script shows once its first menu is drawn, and the key that quits it
+PROMPTS = {
+    "launch.py":      (b"Choose:", "Q"),
+    "job_manager.py": (b"Command:", "Q"),
+}
+
+
+def time_to_menu(script: str, *flags) -> tuple:
+    """(seconds until the menu prompt appeared, stderr) for one run of `script`."""
+    prompt, quit_key = PROMPTS[script]
+    env   = {**os.environ, "TERM": os.environ.get("TERM", "dumb")}
+    start = time.perf_counter()
+    proc  = subprocess.Popen([sys.executable, *flags, script], stdin=subprocess.PIPE,
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+    seen = b""
+    while prompt not in seen:
+        chunk = os.read(proc.stdout.fileno(), 65536)
+        if not chunk:
+            proc.wait()
+            raise RuntimeError(f"{script} exited before showing its menu (exit code {proc.returncode})")
+        seen = seen[-len(prompt):] + chunk
+    elapsed = time.perf_counter() - start
+    _, err = proc.communicate(f"{quit_key}\n".encode(), timeout=30)
+    return elapsed, err.decode(errors="replace")
+
+
+def slowest_imports(script: str, n: int = 5) -> list:
+    """[(cumulative ms, top-level module)] for the costliest imports before the menu."""
+    _, err = time_to_menu(script, "-X", "importtime")
+    costs = []
+    for line in err.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.startswith("  ") or not cumulative.strip().isdigit():   # nested import — counted in its parent
+            continue
+        costs.append((int(cumulative) / 1000, name.strip()))
+    return sorted(costs, reverse=True)[:n]
+
+
+if __name__ == "__main__":
+    script = sys.argv[1] if len(sys.argv) > 1 else "launch.py"
+    if script not in PROMPTS:
+        sys.exit(f"Don't know how to benchmark {script} — one of: {', '.join(PROMPTS)}")
+
+    times = [time_to_menu(script)[0] * 1000 for _ in range(STARTUP_RUNS)]
+    best  = min(times)
+    print(f"{script}: first menu in {best:.0f} ms "
+          f"(best of {len(times)}, median {sorted(times)[len(times) // 2]:.0f} ms, budget {STARTUP_BUDGET_MS:.0f} ms)")
+
+    print("\nSlowest imports:")
+    for ms, name in slowest_imports(script):
+        print(f"  {ms:7.1f} ms  {name}")
+
+    if best > STARTUP_BUDGET_MS:
+        print(f"\n❌ Over budget by {best - STARTUP_BUDGET_MS:.0f} ms")
+        sys.exit(1)
+    print("\n✅ Within budget")
@@ -0,0 +1,172 @@
+"""
+bulk_score.py — Score the Whole Saved-Jobs Backlog Against Your Resume
+=======================================================================
+• Streams unscored jobs from the store a page at a time — never loads the backlog
+• Packs several jobs into one LLM request (up to BULK_SCORE_BATCH, within
+  BULK_SCORE_CHARS of prompt) with the resume sent once per request
+• Goes through the shared AI client, so every request waits on the Groq / Gemini
+  rate limiter like the agent does
+• Writes match_score / match_grade / matched_keywords back one transaction per batch
+• Checkpoints the last job id it got to in the store — a stopped run picks up
+  where it left off; jobs the model skipped are retried with --restart
+
+Run:  python bulk_score.py             — score until done (or BULK_SCORE_MAX_JOBS)
+      python bulk_score.py --restart   — start again from the first unscored job
+Scheduled nightly by cloud_runner.py at BULK_SCORE_AT.
+"""
+
+import json
+import logging
+import os
+import re
+import sys
+from datetime import datetime
+
+from config import (
+    RESUME_FILE, BULK_SCORE_BATCH, BULK_SCORE_CHARS, BULK_SCORE_JD_CHARS, BULK_SCORE_MAX_JOBS,
+)
+from job_store import get_store
+
+log = logging.getLogger("BulkScore")
+
+# Store meta key holding the id of the last job a run got through
+CHECKPOINT_KEY = "bulk_score.cursor"
+PAGE_SIZE      = 200
+
+SYSTEM = """You are an expert ATS (Applicant Tracking System) and career coach.
+You score how well a candidate's resume matches each job you are given.
+Reply with a JSON array ONLY (no other text), one object per job:
+[{"id": <job id>, "score": <integer 0-100>, "grade": "<A/B/C/D/F>", "matched_keywords": ["keyword1", ...]}]"""
+
+_JSON_ARRAY = re.compile(r"\[.*\]", re.S)
+
+
+# ─── Prompt ────────────────────────────────────────────────────────────────────
+def describe(job: dict) -> str:
+    """One job as it appears in the prompt."""
+    lines = [f"### JOB {job['id']}", f"{job['title']} at {job['company']}"]
+    if job.get("location"):
+        lines.append(f"Location: {job['location']}")
+    if job.get("tags"):
+        lines.append(f"Tags: {', '.join(job['tags'])}")
+    jd = (job.get("description") or job.get("notes") or "").strip()
+    if jd:
+        lines.append(jd[:BULK_SCORE_JD_CHARS])
+    return "\n".join(lines)
+
+
+def pack(jobs, resume: str):
+    """Group jobs into batches that fit BULK_SCORE_BATCH and the prompt budget."""
+    batch, used = [], len(resume) + len(SYSTEM)
+    for job in jobs:
+        text = describe(job)
+        if batch and (len(batch) >= BULK_SCORE_BATCH or used + len(text) > BULK_SCORE_CHARS):
+            yield batch
+            batch, used = [], len(resume) + len(SYSTEM)
+        batch.append((job, text))
+        used += len(text)
+    if batch:
+        yield batch
+
+
+def parse_scores(content: str) -> dict:
+    """{job id: {"score", "grade", "matched_keywords"}} from the model's reply."""
+    m = _JSON_ARRAY.search(content or "")
+    if not m:
+        return {}
+    try:
+        items = json.loads(m.group(0))
+    except json.JSONDecodeError:
+        return {}
+    scores = {}
+    for item in items:
+        try:
+            job_id = int(item["id"])
+            score  = max(0, min(100, int(item["score"])))
+        except (KeyError, TypeError, ValueError):
+            continue
+        scores[job_id] = {
+            "score":            score,
+            "grade":            str(item.get("grade") or "?")[:1],
+            "matched_keywords": [str(k) for k in item.get("matched_keywords") or []][:20],
+        }
+    return scores
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════════════════════════════
+def stream_unscored(store, after_id: int):
+    """Yield unscored jobs from `after_id` on, a page at a time."""
+    while True:
+        page = store.unscored_jobs(after_id, PAGE_SIZE)
+        if not page:
+            return
+        yield from page
+        after_id = page[-1]["id"]
+
+
+def score_batch(client, resume: str, batch: list) -> dict:
+    prompt = (
+        f"RESUME:\n{resume}\n\n"
+        f"Score the resume against each of these {len(batch)} jobs:\n\n"
+        + "\n\n".join(text for _, text in batch)
+    )
+    reply = client.chat([{"role": "user", "content": prompt}], [], SYSTEM)
+    return parse_scores(reply.get("content", ""))
+
+
+def run(max_jobs: int = BULK_SCORE_MAX_JOBS, restart: bool = False) -> dict:
+    """
+    Score unscored jobs until none are left, `max_jobs` have been tried (0 = no cap)
+    or the AI providers give out. Returns {"scored", "skipped", "requests", "stopped"}.
+    """
+    stats = {"scored": 0, "skipped": 0, "requests": 0, "stopped": ""}
+    if not os.path.exists(RESUME_FILE):
+        stats["stopped"] = f"no resume at {RESUME_FILE}"
+        return stats
+    with open(RESUME_FILE, "r") as f:
+        resume = f.read().strip()
+
+    from ai_client import get_client
+    client = get_client()
+    store  = get_store()
+    cursor = 0 if restart else int(store.get_meta(CHECKPOINT_KEY, "0"))
+
+    jobs = stream_unscored(store, cursor)
+    for batch in pack(jobs, resume):
+        try:
+            scores = score_batch(client, resume, batch)
+        except Exception as e:
+            stats["stopped"] = str(e).splitlines()[0]     # quota gone — checkpoint holds our place
+            break
+        stats["requests"] += 1
+
+        ids    = {job["id"] for job, _ in batch}
+        scores = {job_id: s for job_id, s in scores.items() if job_id in ids}    # ignore invented ids
+        now    = datetime.now().isoformat()
+        store.update_jobs({
+            job_id: {
+                "match_score":      s["score"],
+                "match_grade":      s["grade"],
+                "matched_keywords": s["matched_keywords"],
+                "scored_at":        now,
+            }
+            for job_id, s in scores.items()
+        })
+        store.set_meta(CHECKPOINT_KEY, batch[-1][0]["id"])
+
+        stats["scored"]  += len(scores)
+        stats["skipped"] += len(batch) - len(scores)
+        log.info(f"Scored {stats['scored']} job(s) in {stats['requests']} request(s)")
+        if max_jobs and stats["scored"] + stats["skipped"] >= max_jobs:
+            stats["stopped"] = f"reached {max_jobs} jobs"
+            break
+    return stats
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s", datefmt="%H:%M:%S")
+    result = run(restart="--restart" in sys.argv[1:])
+    print(f"✅ {result['scored']} scored, {result['skipped']} skipped, {result['requests']} request(s)"
+          + (f" — stopped: {result['stopped']}" if result["stopped"] else ""))
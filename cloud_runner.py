@@ -7,6 +7,7 @@ It does 3 things on a schedule:
   1. Every 30 min  — Search for new jobs and email alerts
   2. Every morning — Check follow-up reminders
   3. Every Sunday  — Send weekly progress digest
+  4. Every night   — Score unscored saved jobs against the resume (bulk_score.py)
 
 Run locally to test:  python cloud_runner.py
 Deploy to Azure:      docker build + az container create
@@ -15,12 +16,15 @@ All output is logged to stdout (visible in Azure Container logs).
 """
 
 import os
-import json
 import time
 import schedule
 import logging
 from datetime import datetime
 
+from config import USE_LLM_AGENT, BULK_SCORE_AT
+from job_store import get_store, job_key
+from seen_index import get_seen_index
+
 # ─── Logging Setup ─────────────────────────────────────────────────────────────
 logging.basicConfig(
     level=logging.INFO,
@@ -36,51 +40,64 @@ SEARCH_INDUSTRY  = os.environ.get("SEARCH_INDUSTRY",  "tech startup")
 CHECK_INTERVAL   = int(os.environ.get("CHECK_INTERVAL_MINUTES", "30"))
 MAX_DAYS_OLD     = int(os.environ.get("MAX_JOB_AGE_DAYS", "1"))
 
-# Support Azure File Share mount — set DATA_DIR env var to /mnt/azurefile in production
-_DATA_DIR        = os.environ.get("DATA_DIR", ".")
-SAVED_JOBS_FILE  = os.path.join(_DATA_DIR, "saved_jobs.json")
-SEEN_JOBS_FILE   = os.path.join(_DATA_DIR, "seen_jobs.json")
+# Support Azure File Share mount — set DATA_DIR env var to /mnt/azurefile in production.
+# The job store and seen-index live under it (config.JOBS_DB_FILE / config.SEEN_INDEX_FILE).
 
 
-# ─── Helpers ───────────────────────────────────────────────────────────────────
-def load_seen_jobs() -> set:
-    if os.path.exists(SEEN_JOBS_FILE):
-        try:
-            with open(SEEN_JOBS_FILE) as f:
-                return set(json.load(f))
-        except Exception:
-            return set()
-    return set()
-
-def save_seen_jobs(seen: set):
-    with open(SEEN_JOBS_FILE, "w") as f:
-        json.dump(list(seen), f)
-
-def load_saved_jobs() -> list:
-    if not os.path.exists(SAVED_JOBS_FILE):
-        return []
-    try:
-        with open(SAVED_JOBS_FILE) as f:
-            return json.load(f)
-    except Exception:
-        return []
+# Store meta key holding the last job id this runner has looked at
+CURSOR_KEY = "cloud_runner.cursor"
+
 
+# ─── Helpers ───────────────────────────────────────────────────────────────────
 def make_job_key(job: dict) -> str:
     """Create a unique fingerprint for a job to avoid duplicates."""
-    title   = job.get("title", "").lower().strip()
-    company = job.get("company", "").lower().strip()
-    return f"{title}::{company}"
+    return job_key(job)
 
 
 # ─── Job Search ────────────────────────────────────────────────────────────────
 def run_job_search() -> list:
     """
-    Run the agent and return newly found jobs (not seen before).
+    Run a search cycle and return newly found jobs (not seen before).
+    By default this is the direct ingest pipeline; USE_LLM_AGENT=true runs the old agent loop.
     """
-    from job_agent import run_agent
-
     log.info(f"🔍 Searching for: '{SEARCH_KEYWORDS}' in '{SEARCH_LOCATION or 'anywhere'}'")
 
+    # Read the cursor before searching. With none stored yet (first cycle), start from the
+    # current high-water mark — the existing history isn't news
+    store  = get_store()
+    cursor = int(store.get_meta(CURSOR_KEY) or store.last_id())
+
+    if USE_LLM_AGENT:
+        _run_llm_agent()
+    else:
+        try:
+            from ingest import run_cycle
+            result = run_cycle(SEARCH_KEYWORDS, SEARCH_LOCATION, MAX_DAYS_OLD)
+            log.info(f"✅ Ingest complete — {len(result['saved'])} saved")
+            if result["summary"]:
+                log.info(f"📝 {result['summary']}")
+        except Exception as e:
+            log.error(f"Ingest error: {e}")
+
+    # Only rows inserted since the last cycle — a range read from the stored cursor,
+    # checked against the seen-index so a re-saved job isn't announced twice
+    inserted  = store.jobs_since(cursor)
+    seen      = get_seen_index()
+    new_jobs  = [job for job in inserted if make_job_key(job) not in seen]
+    seen.add_many(make_job_key(job) for job in new_jobs)
+    store.set_meta(CURSOR_KEY, inserted[-1]["id"] if inserted else cursor)
+
+    if new_jobs:
+        log.info(f"🎯 Found {len(new_jobs)} NEW job(s)")
+    else:
+        log.info("No new jobs this cycle")
+
+    return new_jobs
+
+
+def _run_llm_agent():
+    from job_agent import run_agent
+
     goal = f"""
     Search for '{SEARCH_KEYWORDS}' jobs posted in the last {MAX_DAYS_OLD} day(s).
     {"Location: " + SEARCH_LOCATION if SEARCH_LOCATION else "Include remote jobs."}
@@ -96,26 +113,6 @@ def run_job_search() -> list:
     except Exception as e:
         log.error(f"Agent error: {e}")
 
-    # Find jobs saved since this run started
-    all_jobs  = load_saved_jobs()
-    seen      = load_seen_jobs()
-    new_jobs  = []
-
-    for job in all_jobs:
-        key = make_job_key(job)
-        if key not in seen:
-            new_jobs.append(job)
-            seen.add(key)
-
-    save_seen_jobs(seen)
-
-    if new_jobs:
-        log.info(f"🎯 Found {len(new_jobs)} NEW job(s)")
-    else:
-        log.info("No new jobs this cycle")
-
-    return new_jobs
-
 
 # ─── Scheduled Tasks ───────────────────────────────────────────────────────────
 def task_check_jobs():
@@ -139,6 +136,9 @@ def task_check_jobs():
         elif new_jobs:
             log.info(f"Found {len(new_jobs)} new jobs (email not configured)")
 
+        from http_client import stats_line
+        log.info(stats_line())
+
     except Exception as e:
         log.error(f"Job check task failed: {e}", exc_info=True)
 
@@ -167,6 +167,21 @@ def task_check_followups():
         log.error(f"Follow-up task failed: {e}", exc_info=True)
 
 
+def task_bulk_score():
+    """Scheduled: score unscored saved jobs against the resume overnight."""
+    log.info("TASK: Bulk resume-match scoring")
+
+    try:
+        from bulk_score import run
+        result = run()
+        log.info(
+            f"🎯 Scored {result['scored']} job(s) in {result['requests']} request(s), "
+            f"{result['skipped']} skipped" + (f" — stopped: {result['stopped']}" if result["stopped"] else "")
+        )
+    except Exception as e:
+        log.error(f"Bulk scoring task failed: {e}", exc_info=True)
+
+
 def task_weekly_digest():
     """Scheduled: send weekly progress summary every Sunday."""
     if datetime.now().weekday() != 6:  # 6 = Sunday
@@ -177,11 +192,13 @@ def task_weekly_digest():
     try:
         from notifications import notify_weekly_digest, check_config
 
-        cfg  = check_config()
-        jobs = load_saved_jobs()
+        cfg   = check_config()
+        stats = get_store().stats("status")
 
-        if jobs and cfg["ready"]:
-            notify_weekly_digest(jobs)
+        if stats["total"] and cfg["ready"]:
+            month_start = datetime.now().strftime("%Y-%m-01")
+            recent = [j for j in get_store().find_jobs(sort="saved", limit=5) if j["saved_at"][:10] >= month_start]
+            notify_weekly_digest(stats, recent)
             log.info("📧 Weekly digest sent")
         elif not cfg["ready"]:
             log.info("Weekly digest skipped (email not configured)")
@@ -193,14 +210,11 @@ def task_weekly_digest():
 # ─── Health Check ──────────────────────────────────────────────────────────────
 def print_status():
     """Print current agent status to logs."""
-    jobs = load_saved_jobs()
-    counts = {}
-    for job in jobs:
-        s = job.get("status", "Saved")
-        counts[s] = counts.get(s, 0) + 1
+    stats  = get_store().stats("status")
+    counts = stats["status"]
 
     log.info(
-        f"STATUS | Saved:{len(jobs)} "
+        f"STATUS | Saved:{stats['total']} "
         f"Applied:{counts.get('Applied',0)} "
         f"Interview:{counts.get('Interview',0)} "
         f"Offer:{counts.get('Offer',0)}"
@@ -245,9 +259,11 @@ def main():
     schedule.every(CHECK_INTERVAL).minutes.do(task_check_jobs)
     schedule.every().day.at("09:00").do(task_check_followups)
     schedule.every().day.at("09:00").do(task_weekly_digest)
+    schedule.every().day.at(BULK_SCORE_AT).do(task_bulk_score)
     schedule.every(6).hours.do(print_status)
 
-    log.info(f"📅 Scheduled: job search every {CHECK_INTERVAL} min, reminders at 9am daily")
+    log.info(f"📅 Scheduled: job search every {CHECK_INTERVAL} min, reminders at 9am daily, "
+             f"match scoring at {BULK_SCORE_AT}")
     log.info("Agent running... (Ctrl+C to stop)\n")
 
     # Keep running forever
@@ -16,3 +16,96 @@ DEFAULT_INDUSTRY         = os.environ.get("SEARCH_INDUSTRY", "tech startup")
 MONITOR_INTERVAL_MINUTES = int(os.environ.get("CHECK_INTERVAL_MINUTES", "30"))
 
 COMPANIES_TO_WATCH = []
+
+# ─── Adzuna crawl (ingest) ─────────────────────────────────────────────────────
+# Countries crawled when no location is given, e.g. "ca,us,gb"
+ADZUNA_COUNTRIES      = [c.strip() for c in os.environ.get("ADZUNA_COUNTRIES", "us").split(",") if c.strip()]
+ADZUNA_MAX_PAGES      = int(os.environ.get("ADZUNA_MAX_PAGES", "5"))        # per country / location
+ADZUNA_PAGE_SIZE      = 50                                                  # Adzuna's maximum
+ADZUNA_CONCURRENCY    = int(os.environ.get("ADZUNA_CONCURRENCY", "4"))      # page fetches in flight
+ADZUNA_RATE_PER_MIN   = int(os.environ.get("ADZUNA_RATE_PER_MIN", "25"))    # free tier: 25 hits / minute
+ADZUNA_RATE_PER_DAY   = int(os.environ.get("ADZUNA_RATE_PER_DAY", "250"))   # free tier: 250 hits / day
+
+# ─── Ingest (monitor / cloud modes) ────────────────────────────────────────────
+# Sources queried by the non-LLM ingest pipeline: adzuna, remoteok, hn, indeed, wellfound
+INGEST_SOURCES   = [s.strip() for s in os.environ.get("INGEST_SOURCES", "adzuna,remoteok,hn").split(",") if s.strip()]
+INGEST_TOP_N     = int(os.environ.get("INGEST_TOP_N", "5"))          # jobs saved per cycle
+USE_LLM_AGENT    = os.environ.get("USE_LLM_AGENT", "false").lower() == "true"   # old agent loop
+INGEST_SUMMARY   = os.environ.get("INGEST_SUMMARY", "false").lower() == "true"  # one LLM call to summarise
+
+# ─── Local relevance ranking (ranker.py) ───────────────────────────────────────
+RESUME_FILE   = "my_resume.txt"                                 # shared with the AI tools
+PROFILE_FILE  = "search_profile.json"                           # saved by the setup menu
+RANKER_TOP_K  = int(os.environ.get("RANKER_TOP_K", "10"))       # postings the agent LLM gets to see
+RANKER_WEIGHT = float(os.environ.get("RANKER_WEIGHT", "2"))     # resume-fit bonus in ingest ranking
+
+# ─── Bulk match scoring (bulk_score.py) ────────────────────────────────────────
+BULK_SCORE_BATCH    = int(os.environ.get("BULK_SCORE_BATCH", "8"))      # jobs packed into one request
+BULK_SCORE_CHARS    = int(os.environ.get("BULK_SCORE_CHARS", "16000"))  # prompt budget (~4 chars / token)
+BULK_SCORE_JD_CHARS = 1500                                              # per-job description cut-off
+BULK_SCORE_MAX_JOBS = int(os.environ.get("BULK_SCORE_MAX_JOBS", "0"))   # per run, 0 = no cap
+BULK_SCORE_AT       = os.environ.get("BULK_SCORE_AT", "02:00")          # nightly run in cloud_runner
+
+# ─── Job manager (job_manager.py) ──────────────────────────────────────────────
+JOB_PAGE_SIZE = int(os.environ.get("JOB_PAGE_SIZE", "25"))      # table rows per screen
+
+# ─── Startup (bench_startup.py) ────────────────────────────────────────────────
+STARTUP_BUDGET_MS = float(os.environ.get("STARTUP_BUDGET_MS", "300"))  # launch.py → first menu
+STARTUP_RUNS      = int(os.environ.get("STARTUP_RUNS", "5"))           # best of this many
+
+# ─── Storage ───────────────────────────────────────────────────────────────────
+# Set DATA_DIR to a persistent mount (e.g. /mnt/azurefile) in production
+DATA_DIR        = os.environ.get("DATA_DIR", ".")
+JOBS_DB_FILE    = os.path.join(DATA_DIR, "jobs.db")           # SQLite job store
+SAVED_JOBS_FILE = os.path.join(DATA_DIR, "saved_jobs.json")   # legacy import / JSON export
+
+# Jobs already alerted on — append-only log, keys forgotten after SEEN_TTL_DAYS
+SEEN_INDEX_FILE  = os.path.join(DATA_DIR, "seen_jobs.log")
+LEGACY_SEEN_FILE = os.path.join(DATA_DIR, "seen_jobs.json")   # imported once, then unused
+SEEN_TTL_DAYS    = int(os.environ.get("SEEN_TTL_DAYS", "90"))
+
+# ─── HTTP ──────────────────────────────────────────────────────────────────────
+HTTP_TIMEOUT   = float(os.environ.get("HTTP_TIMEOUT", "12"))    # seconds, per request
+HTTP_RETRIES   = int(os.environ.get("HTTP_RETRIES", "2"))       # connect retries per request
+HTTP_POOL_SIZE = int(os.environ.get("HTTP_POOL_SIZE", "10"))    # keep-alive connections per host
+
+# Source retries (exponential backoff, full jitter) and circuit breakers — see resilience.py
+SOURCE_RETRIES       = int(os.environ.get("SOURCE_RETRIES", "3"))   # attempts per fetch
+RETRY_BASE_DELAY     = 0.5                                           # seconds, doubled per attempt
+RETRY_MAX_DELAY      = 4.0
+RETRY_BUDGET         = 10.0                                          # never retry past this many seconds
+BREAKER_THRESHOLD    = int(os.environ.get("BREAKER_THRESHOLD", "3")) # failures in a row before skipping
+BREAKER_COOLDOWN     = 30 * 60                                       # first skip window, doubles after
+BREAKER_MAX_COOLDOWN = 6 * 3600
+BREAKER_FILE         = os.path.join(DATA_DIR, "source_health.json")
+
+# On-disk response cache — how long (seconds) a cached response is served without asking again.
+# After the TTL we revalidate with If-None-Match / If-Modified-Since, so an unchanged feed costs one 304.
+HTTP_CACHE_FILE   = os.path.join(DATA_DIR, "http_cache.db")
+HTTP_CACHE_MAX_MB = float(os.environ.get("HTTP_CACHE_MAX_MB", "50"))
+HTTP_CACHE_TTLS   = {
+    "adzuna":   10 * 60,
+    "remoteok": 15 * 60,
+    "indeed":   15 * 60,
+    "hn":       30 * 60,
+    "careers":  60 * 60,
+}
+
+# Cached career-tool completions (match scores, cover letters, follow-ups, ...)
+LLM_CACHE_FILE     = os.path.join(DATA_DIR, "llm_cache.db")
+LLM_CACHE_TTL_DAYS = float(os.environ.get("LLM_CACHE_TTL_DAYS", "30"))
+LLM_CACHE_MAX_MB   = float(os.environ.get("LLM_CACHE_MAX_MB", "20"))
+
+# ─── Rate limits ───────────────────────────────────────────────────────────────
+# Token buckets per provider: [(requests, per_seconds), ...] — a request needs a token from each.
+# State is kept in RATE_LIMIT_FILE so separate runs share the same quota.
+RATE_LIMIT_FILE     = os.path.join(DATA_DIR, "rate_limits.json")
+RATE_LIMIT_MAX_WAIT = float(os.environ.get("RATE_LIMIT_MAX_WAIT", "30"))   # longer waits fail fast instead
+RATE_LIMITS = {
+    "groq":     [(30, 60), (1000, 24 * 3600)],      # llama-3.3-70b free tier
+    "gemini":   [(15, 60), (1500, 24 * 3600)],      # 1.5 Flash free tier
+    "adzuna":   [(ADZUNA_RATE_PER_MIN, 60), (ADZUNA_RATE_PER_DAY, 24 * 3600)],
+    "maps":     [(10, 1)],
+    "remoteok": [(1, 2)],                           # one feed, be polite
+    "hn":       [(10, 1), (10000, 3600)],           # Algolia public API
+}
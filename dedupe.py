@@ -0,0 +1,214 @@
+"""
+dedupe.py — Spot the Same Posting Across Sources
+=================================================
+• Normalizes titles (punctuation, work-mode tokens, common abbreviations) — seniority
+  is kept: a junior and a senior opening at one company are two postings
+• Normalizes companies (punctuation, legal suffixes like Inc / Ltd / GmbH)
+• Canonicalizes URLs (tracking params, redirect wrappers, Adzuna ad ids)
+• DedupeIndex: exact key and URL lookups, then a fuzzy title match only against
+  titles from the same company that share a rare word (prefix filtering) — no
+  pairwise scan over the history, and no scan over a big company's postings
+
+Usage:
+    index = DedupeIndex()
+    index.add(1, {"title": "Sr. Python Developer", "company": "Acme Inc.", "url": "..."})
+    index.find({"title": "Senior Python Dev (Remote)", "company": "ACME", "url": ""})   # → 1
+"""
+
+import math
+import re
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+# Bump when the normalization below changes — the job store re-keys its rows
+KEY_VERSION = "3"
+
+# Titles whose title-token Jaccard similarity is at least this are the same job
+FUZZY_THRESHOLD = 0.8
+
+_NON_WORD = re.compile(r"[^a-z0-9+#]+")
+
+# Dropped from titles: work-mode noise that varies between boards
+_TITLE_NOISE = {"remote", "hybrid", "onsite", "wfh", "m", "f", "d", "w", "x", "h"}
+# Seniority and level words — kept in the key, and fuzzy matches must agree on them
+_SENIORITY = frozenset({
+    "senior", "junior", "lead", "principal", "staff", "mid", "entry", "intermediate",
+    "i", "ii", "iii", "iv",
+})
+# Sorted last when picking a title's prefix words (see _prefix) — fixed, so it never invalidates the index
+_COMMON_TITLE_WORDS = frozenset("""
+engineer developer software manager analyst data and of the for in to specialist associate consultant
+administrator technician support full stack web application applications systems system technical
+services service product project operations business sales marketing architect scientist designer
+researcher intern
+""".split()) | _SENIORITY
+_TITLE_ABBREVIATIONS = {
+    "dev": "developer", "eng": "engineer", "engr": "engineer", "swe": "software engineer",
+    "sr": "senior", "snr": "senior", "jr": "junior",
+    "mgr": "manager", "admin": "administrator", "sysadmin": "system administrator",
+}
+# Dropped from the end of company names
+_LEGAL_SUFFIXES = {
+    "inc", "incorporated", "llc", "llp", "ltd", "limited", "corp", "corporation",
+    "co", "company", "plc", "gmbh", "ag", "sa", "sas", "bv", "nv", "pty", "srl", "oy", "ab",
+}
+# Query params that only track where a click came from
+_TRACKING_PARAMS = re.compile(r"^(utm_.*|ref|referrer|refid|source|src|gclid|fbclid|mc_.*|trk.*|se|v|cid|from)$")
+# Query params redirect wrappers use to carry the real destination
+_REDIRECT_PARAMS = {"url", "u", "dest", "destination", "redirect", "redirect_url", "target"}
+_ADZUNA_AD_ID    = re.compile(r"/(?:land/ad|details|ad)/(\d+)")
+
+
+# ─── Normalization ─────────────────────────────────────────────────────────────
+def title_tokens(title: str) -> list:
+    words = _NON_WORD.sub(" ", (title or "").lower().replace("&", " and ")).split()
+    out = []
+    for w in words:
+        out.extend(_TITLE_ABBREVIATIONS.get(w, w).split())
+    return [w for w in out if w not in _TITLE_NOISE]
+
+
+def normalize_title(title: str) -> str:
+    """'Sr. Python Dev (Remote)' → 'senior python developer'"""
+    return " ".join(title_tokens(title))
+
+
+def normalize_company(company: str) -> str:
+    """'The Acme Co., Ltd.' → 'acme'"""
+    words = _NON_WORD.sub(" ", (company or "").lower().replace("&", " and ")).split()
+    if words and words[0] == "the":
+        words = words[1:]
+    while len(words) > 1 and words[-1] in _LEGAL_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def job_key(job) -> str:
+    """Fingerprint used to spot the same job twice (normalized title + company)."""
+    return f"{normalize_title(_field(job, 'title'))}::{normalize_company(_field(job, 'company'))}"
+
+
+def legacy_key(job) -> str:
+    """The version-1 key (lower-cased title::company) — also the old seen_jobs.json format."""
+    return f"{_field(job, 'title').lower().strip()}::{_field(job, 'company').lower().strip()}"
+
+
+def canonical_url(url: str) -> str:
+    """
+    Reduce a posting URL to what identifies the posting:
+    unwraps ?url= style redirects, maps any Adzuna ad link to 'adzuna:<id>',
+    drops scheme, www., fragments, trailing slashes and tracking params.
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query)
+
+    for k, v in query:
+        if k.lower() in _REDIRECT_PARAMS and v.startswith(("http://", "https://")):
+            return canonical_url(v)
+
+    host = parts.netloc.lower().removeprefix("www.")
+    if "adzuna." in host:
+        m = _ADZUNA_AD_ID.search(parts.path)
+        if m:
+            return f"adzuna:{m.group(1)}"
+
+    kept = sorted((k, v) for k, v in query if not _TRACKING_PARAMS.match(k.lower()))
+    path = parts.path.rstrip("/")
+    return f"{host}{path}" + (f"?{urlencode(kept)}" if kept else "")
+
+
+def _field(job, name: str) -> str:
+    """job[name] for dicts and sqlite rows alike, '' if missing."""
+    try:
+        return job[name] or ""
+    except (KeyError, IndexError):
+        return ""
+
+
+def _jaccard(a: frozenset, b: frozenset) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _prefix(tokens: frozenset, threshold: float) -> list:
+    """
+    Prefix filtering: with the words in one fixed order, two titles whose Jaccard similarity
+    is >= threshold always share a word among the first len - ceil(threshold * len) + 1.
+    Rare words come first, so a prefix word is shared by only a few titles in the block.
+    """
+    ordered = sorted(tokens, key=lambda w: (w in _COMMON_TITLE_WORDS, w))
+    return ordered[:len(ordered) - math.ceil(threshold * len(ordered) - 1e-9) + 1]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# INDEX
+# ═══════════════════════════════════════════════════════════════════════════════
+class DedupeIndex:
+    """
+    In-memory duplicate finder over {id: job}.
+    Lookups are dict hits plus a fuzzy check against only those jobs from the same
+    (normalized) company that share a prefix word with the title, so cost doesn't
+    grow with history size or with how many postings a company has.
+    """
+
+    def __init__(self, threshold: float = FUZZY_THRESHOLD):
+        self.threshold = threshold
+        self.keys     = {}  # job_key                -> id
+        self.urls     = {}  # canonical url          -> id
+        self.blocks   = {}  # company                -> {id: frozenset(title tokens)}
+        self.prefixes = {}  # (company, prefix word) -> {ids}
+
+    def _parts(self, job) -> tuple:
+        words   = title_tokens(_field(job, "title"))
+        company = normalize_company(_field(job, "company"))
+        return f"{' '.join(words)}::{company}", canonical_url(_field(job, "url")), company, frozenset(words)
+
+    def find(self, job):
+        """Id of an indexed job that `job` duplicates, or None."""
+        key, url, company, tokens = self._parts(job)
+        if key in self.keys:
+            return self.keys[key]
+        if url and url in self.urls:
+            return self.urls[url]
+        block = self.blocks.get(company) if company and tokens else None
+        if block:
+            candidates = set().union(*(self.prefixes.get((company, w), ()) for w in _prefix(tokens, self.threshold)))
+            # |A∩B| >= t(|A|+|B|)/(1+t) is Jaccard >= t without building the union
+            need    = self.threshold / (1 + self.threshold)
+            level   = tokens & _SENIORITY
+            matches = [job_id for job_id in candidates
+                       if len(tokens & block[job_id]) >= need * (len(tokens) + len(block[job_id])) - 1e-9
+                       and block[job_id] & _SENIORITY == level]
+            if matches:
+                return min(matches)     # the earliest saved of several near-duplicates
+        return None
+
+    def add(self, job_id, job):
+        key, url, company, tokens = self._parts(job)
+        self.keys.setdefault(key, job_id)
+        if url:
+            self.urls.setdefault(url, job_id)
+        if company and tokens:
+            self.blocks.setdefault(company, {})[job_id] = tokens
+            for w in _prefix(tokens, self.threshold):
+                self.prefixes.setdefault((company, w), set()).add(job_id)
+
+    def remove(self, job_id, job):
+        key, url, company, _ = self._parts(job)
+        if self.keys.get(key) == job_id:
+            del self.keys[key]
+        if url and self.urls.get(url) == job_id:
+            del self.urls[url]
+        block = self.blocks.get(company)
+        if block is not None and job_id in block:
+            for w in _prefix(block.pop(job_id), self.threshold):
+                ids = self.prefixes.get((company, w))
+                if ids is not None:
+                    ids.discard(job_id)
+                    if not ids:
+                        del self.prefixes[(company, w)]
+            if not block:
+                del self.blocks[company]
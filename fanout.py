@@ -0,0 +1,67 @@
+"""
+fanout.py — Run Independent Calls Concurrently
+================================================
+• Runs every task at once on a thread pool (all our I/O is blocking requests)
+• Per-task deadline and a global deadline — stragglers are reported, not awaited
+• Yields results as they arrive, with latency and error per task
+
+Usage:
+    for r in fan_out({"remoteok": lambda: search_remoteok(kw)}, timeout=15):
+        print(r["name"], r["status"], r["elapsed"])
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+
+def fan_out(tasks: dict, timeout: float = 15, total_timeout: float = None,
+            timeouts: dict = None, max_workers: int = None):
+    """
+    Run `tasks` ({name: zero-arg callable}) concurrently and yield one dict per task:
+    {
+      "name":    str,
+      "status":  "ok" | "error" | "timeout",
+      "result":  return value (None unless ok),
+      "error":   str (empty unless error/timeout),
+      "elapsed": float seconds
+    }
+    Results come back in completion order. `timeouts` overrides `timeout` per task;
+    `total_timeout` caps the whole fan-out (defaults to the largest per-task deadline).
+    """
+    if not tasks:
+        return
+
+    timeouts  = timeouts or {}
+    deadlines = {name: timeouts.get(name, timeout) for name in tasks}
+    total     = total_timeout if total_timeout is not None else max(deadlines.values())
+
+    pool  = ThreadPoolExecutor(max_workers=max_workers or len(tasks), thread_name_prefix="fanout")
+    start = time.monotonic()
+    futures = {pool.submit(fn): name for name, fn in tasks.items()}
+    pending = set(futures)
+
+    try:
+        while pending:
+            now      = time.monotonic() - start
+            next_due = min(min(deadlines[futures[f]] for f in pending), total)
+            done, pending = wait(pending, timeout=max(next_due - now, 0), return_when=FIRST_COMPLETED)
+
+            for f in done:
+                name    = futures[f]
+                elapsed = time.monotonic() - start
+                try:
+                    yield {"name": name, "status": "ok", "result": f.result(), "error": "", "elapsed": elapsed}
+                except Exception as e:
+                    yield {"name": name, "status": "error", "result": None, "error": str(e), "elapsed": elapsed}
+
+            # Give up on anything past its own deadline (or everything, past the global one)
+            elapsed = time.monotonic() - start
+            expired = {f for f in pending if elapsed >= min(deadlines[futures[f]], total)}
+            for f in expired:
+                f.cancel()
+                yield {"name": futures[f], "status": "timeout", "result": None,
+                       "error": f"no response after {elapsed:.1f}s", "elapsed": elapsed}
+            pending -= expired
+    finally:
+        # Don't block on threads still stuck in a slow request — their socket timeout ends them
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -7,6 +7,10 @@ import json
 import logging
 from datetime import datetime
 
+from config import SAVED_JOBS_FILE, USE_LLM_AGENT, INGEST_SUMMARY
+from job_store import get_store, job_key
+from seen_index import get_seen_index
+
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s", datefmt="%H:%M:%S")
 log = logging.getLogger("GHRunner")
 
@@ -14,8 +18,6 @@ SEARCH_KEYWORDS = os.environ.get("SEARCH_KEYWORDS", "software engineer")
 SEARCH_LOCATION = os.environ.get("SEARCH_LOCATION", "")
 SEARCH_INDUSTRY = os.environ.get("SEARCH_INDUSTRY", "tech startup")
 MAX_DAYS_OLD    = int(os.environ.get("MAX_JOB_AGE_DAYS", "1"))
-SAVED_JOBS_FILE = "saved_jobs.json"
-SEEN_JOBS_FILE  = "seen_jobs.json"
 
 
 def ensure_files():
@@ -24,22 +26,17 @@ def ensure_files():
         with open(SAVED_JOBS_FILE, "w") as f:
             json.dump([], f)
         log.info("Created saved_jobs.json")
-    if not os.path.exists(SEEN_JOBS_FILE):
-        with open(SEEN_JOBS_FILE, "w") as f:
-            json.dump([], f)
-        log.info("Created seen_jobs.json")
 
 
 def load_jobs() -> list:
     try:
-        with open(SAVED_JOBS_FILE) as f:
-            return json.load(f)
+        return get_store().all_jobs()
     except Exception:
         return []
 
 
 def make_key(job: dict) -> str:
-    return f"{job.get('title','').lower().strip()}::{job.get('company','').lower().strip()}"
+    return job_key(job)
 
 
 def main():
@@ -54,40 +51,54 @@ def main():
     # Create files on first run
     ensure_files()
 
-    # Verify AI
-    try:
-        from ai_client import get_client
-        ai = get_client()
-        log.info(f"AI providers: {ai.status()}")
-    except Exception as e:
-        log.error(f"AI client failed: {e}")
-        raise SystemExit(1)
+    # Verify AI — only needed for the agent loop or the optional summary
+    if USE_LLM_AGENT or INGEST_SUMMARY:
+        try:
+            from ai_client import get_client
+            ai = get_client()
+            log.info(f"AI providers: {ai.status()}")
+        except Exception as e:
+            log.error(f"AI client failed: {e}")
+            raise SystemExit(1)
 
     # Snapshot before run
-    jobs_before     = load_jobs()
-    seen_keys_before = set(make_key(j) for j in jobs_before)
-    log.info(f"Existing saved jobs: {len(jobs_before)}")
-
-    # Build goal — keep it SHORT to avoid rate limits
-    loc_clause = f" in {SEARCH_LOCATION}" if SEARCH_LOCATION else ""
-    goal = (
-        f"Find new '{SEARCH_KEYWORDS}' jobs{loc_clause} posted today. "
-        f"Search job boards and RemoteOK. Save the top 5 best matches."
-    )
-
-    log.info(f"Goal: {goal}")
+    seen = get_seen_index()
+    if not seen.lines:
+        # First run with the index — jobs saved by earlier runs were already alerted on
+        seen.add_many(make_key(j) for j in load_jobs())
+    cursor = get_store().last_id()   # anything with a higher id was saved by this run
+    log.info(f"Existing saved jobs: {get_store().count()} ({len(seen)} already alerted)")
+
+    if USE_LLM_AGENT:
+        # Build goal — keep it SHORT to avoid rate limits
+        loc_clause = f" in {SEARCH_LOCATION}" if SEARCH_LOCATION else ""
+        goal = (
+            f"Find new '{SEARCH_KEYWORDS}' jobs{loc_clause} posted today. "
+            f"Search job boards and RemoteOK. Save the top 5 best matches."
+        )
+
+        log.info(f"Goal: {goal}")
+
+        # Run agent
+        try:
+            from job_agent import run_agent
+            run_agent(goal, verbose=True)
+        except Exception as e:
+            log.error(f"Agent error: {e}")
+            log.info("Checking if any jobs were saved despite the error...")
+    else:
+        # Direct ingest — sources → dedupe → rank → bulk save, no LLM turns
+        try:
+            from ingest import run_cycle
+            result = run_cycle(SEARCH_KEYWORDS, SEARCH_LOCATION, MAX_DAYS_OLD)
+            if result["summary"]:
+                log.info(f"Summary: {result['summary']}")
+        except Exception as e:
+            log.error(f"Ingest error: {e}")
 
-    # Run agent
-    try:
-        from job_agent import run_agent
-        run_agent(goal, verbose=True)
-    except Exception as e:
-        log.error(f"Agent error: {e}")
-        log.info("Checking if any jobs were saved despite the error...")
-
-    # Find new jobs
-    jobs_after   = load_jobs()
-    new_jobs     = [j for j in jobs_after if make_key(j) not in seen_keys_before]
+    # Find new jobs — saved during this run and not alerted on yet
+    new_jobs     = [j for j in get_store().jobs_since(cursor) if make_key(j) not in seen]
+    seen.add_many(make_key(j) for j in new_jobs)
     log.info(f"New jobs found this run: {len(new_jobs)}")
 
     # Send email if new jobs found
@@ -109,16 +120,21 @@ def main():
         log.info("No new jobs this run")
 
     # Stats
-    counts = {}
-    for job in jobs_after:
-        s = job.get("status", "Saved")
-        counts[s] = counts.get(s, 0) + 1
+    stats = get_store().stats("status")
 
     log.info("─" * 40)
-    log.info(f"Total saved: {len(jobs_after)}")
-    for status, count in counts.items():
+    log.info(f"Total saved: {stats['total']}")
+    for status, count in stats["status"].items():
         log.info(f"  {status}: {count}")
     log.info("─" * 40)
+
+    from http_client import stats_line
+    log.info(stats_line())
+
+    # The workflow commits saved_jobs.json, so mirror the store back to JSON
+    exported = get_store().export_json(SAVED_JOBS_FILE)
+    log.info(f"Exported {exported} job(s) to {SAVED_JOBS_FILE}")
+    seen.wait()   # don't exit mid-compaction
     log.info("✅ Run complete")
 
 
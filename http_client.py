@@ -0,0 +1,268 @@
+"""
+http_client.py — Shared HTTP Session (keep-alive + pooling)
+============================================================
+Every outbound call to a job source goes through one requests.Session:
+
+  • Per-host connection pools with keep-alive — no new TCP/TLS handshake per call
+  • Default browser User-Agent and timeout (see config.py); only failed connects are
+    retried here — status-level retries with jitter live in resilience.py
+  • Optional on-disk response cache per source: TTL, then ETag / Last-Modified
+    revalidation (304 = reuse body), LRU eviction under a size cap
+  • Optional rate limiting per provider (see rate_limit.py) — only requests that
+    actually go to the network take a token; Retry-After on 429/503 is honored
+  • connection_stats() reports new vs reused connections, per host
+
+Usage:
+    from http_client import get
+    resp = get("https://remoteok.com/api", timeout=12, cache="remoteok", limit="remoteok")
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.util.retry import Retry
+
+from rate_limit import acquire, get_limiter, retry_after
+from config import (
+    HTTP_TIMEOUT, HTTP_RETRIES, HTTP_POOL_SIZE,
+    HTTP_CACHE_FILE, HTTP_CACHE_MAX_MB, HTTP_CACHE_TTLS,
+)
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    )
+}
+
+
+def _build_session() -> requests.Session:
+    retry = Retry(
+        total=HTTP_RETRIES,
+        connect=HTTP_RETRIES,       # nothing was sent yet — always safe to try again
+        read=0,
+        status=0,                   # 5xx / 429 go back to the caller (resilience.py retries with jitter)
+        backoff_factor=0.5,
+        allowed_methods=("GET", "HEAD"),
+        raise_on_status=False,      # hand the last response back to the caller
+        respect_retry_after_header=False,   # rate_limit.py owns Retry-After, across threads and runs
+    )
+    adapter = HTTPAdapter(
+        pool_connections=20,        # number of hosts kept warm
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# ─── Singleton ────────────────────────────────────────────────────────────────
+_session = None
+_lock    = threading.Lock()
+
+def get_session() -> requests.Session:
+    """Get or create the shared session."""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def get(url: str, params: dict = None, headers: dict = None, timeout: float = None,
+        cache: str = None, limit: str = None, **kwargs) -> requests.Response:
+    """
+    GET through the shared session. `headers` are added on top of the defaults.
+    Pass cache="<source>" (a key of HTTP_CACHE_TTLS) to serve/revalidate from the disk cache,
+    and limit="<provider>" (a key of RATE_LIMITS) to take a rate-limit token first.
+    """
+    if cache:
+        return _cached_get(url, params, headers, timeout, cache, limit, **kwargs)
+    return _send(url, params, headers, timeout, limit, **kwargs)
+
+
+def _send(url, params, headers, timeout, limit, **kwargs) -> requests.Response:
+    """One network request, after waiting for the provider's rate limit."""
+    if limit:
+        acquire(limit)
+    resp = get_session().get(url, params=params, headers=headers,
+                             timeout=timeout or HTTP_TIMEOUT, **kwargs)
+    if limit and resp.status_code in (429, 503):
+        get_limiter().penalize(limit, retry_after(resp.headers) or (60 if resp.status_code == 429 else None))
+    return resp
+
+
+# ─── Response Cache ───────────────────────────────────────────────────────────
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key            TEXT PRIMARY KEY,
+    url            TEXT NOT NULL,
+    status         INTEGER NOT NULL,
+    headers        TEXT NOT NULL,
+    body           BLOB NOT NULL,
+    size           INTEGER NOT NULL,
+    etag           TEXT,
+    last_modified  TEXT,
+    fetched_at     REAL NOT NULL,
+    last_used      REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_lru ON responses(last_used);
+"""
+
+_cache_conn  = None
+_cache_lock  = threading.Lock()
+_cache_stats = {"fresh": 0, "revalidated": 0, "fetched": 0}    # guarded by _cache_lock — fetch threads share it
+
+def _cache() -> sqlite3.Connection:
+    global _cache_conn
+    if _cache_conn is None:
+        _cache_conn = sqlite3.connect(HTTP_CACHE_FILE, timeout=10, check_same_thread=False)
+        _cache_conn.row_factory = sqlite3.Row
+        _cache_conn.execute("PRAGMA journal_mode=WAL")
+        _cache_conn.executescript(CACHE_SCHEMA)
+    return _cache_conn
+
+
+def _cache_key(url: str, params: dict) -> str:
+    raw = url + "?" + json.dumps(sorted((params or {}).items()), default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _from_cache(row: sqlite3.Row) -> requests.Response:
+    """Rebuild a Response from a cache row so callers can't tell the difference."""
+    resp = requests.Response()
+    resp.status_code = row["status"]
+    resp.url         = row["url"]
+    resp.headers     = CaseInsensitiveDict(json.loads(row["headers"]))
+    resp.encoding    = get_encoding_from_headers(resp.headers)
+    resp._content    = bytes(row["body"])
+    resp.from_cache  = True
+    return resp
+
+
+def _cached_get(url, params, headers, timeout, source, limit, **kwargs) -> requests.Response:
+    ttl = HTTP_CACHE_TTLS.get(source, 0)
+    key = _cache_key(url, params)
+    now = time.time()
+
+    with _cache_lock:
+        row = _cache().execute("SELECT * FROM responses WHERE key = ?", (key,)).fetchone()
+
+    if row and now - row["fetched_at"] < ttl:
+        with _cache_lock, _cache():
+            _cache().execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            _cache_stats["fresh"] += 1
+        return _from_cache(row)
+
+    # Stale or missing — ask the server, conditionally if we have validators
+    send_headers = dict(headers or {})
+    if row and row["etag"]:
+        send_headers["If-None-Match"] = row["etag"]
+    if row and row["last_modified"]:
+        send_headers["If-Modified-Since"] = row["last_modified"]
+
+    resp = _send(url, params, send_headers, timeout, limit, **kwargs)
+
+    if resp.status_code == 304 and row:
+        with _cache_lock, _cache():
+            _cache().execute(
+                "UPDATE responses SET fetched_at = ?, last_used = ? WHERE key = ?", (now, now, key)
+            )
+            _cache_stats["revalidated"] += 1
+        return _from_cache(row)
+
+    with _cache_lock:
+        _cache_stats["fetched"] += 1
+    if resp.status_code == 200:
+        _cache_store(key, url, resp, now)
+    return resp
+
+
+def _cache_store(key: str, url: str, resp: requests.Response, now: float):
+    body     = resp.content
+    max_size = int(HTTP_CACHE_MAX_MB * 1024 * 1024)
+    if len(body) > max_size:
+        return
+
+    keep = {k: v for k, v in resp.headers.items()
+            if k.lower() in ("content-type", "etag", "last-modified", "date")}
+    with _cache_lock, _cache():
+        db = _cache()
+        db.execute(
+            "INSERT OR REPLACE INTO responses "
+            "(key, url, status, headers, body, size, etag, last_modified, fetched_at, last_used) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, url, resp.status_code, json.dumps(keep), body, len(body),
+             resp.headers.get("ETag"), resp.headers.get("Last-Modified"), now, now)
+        )
+        # LRU eviction: drop least-recently-used rows until we're back under the cap
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total > max_size:
+            for old in db.execute("SELECT key, size FROM responses ORDER BY last_used").fetchall():
+                if total <= max_size:
+                    break
+                db.execute("DELETE FROM responses WHERE key = ?", (old["key"],))
+                total -= old["size"]
+
+
+def cache_stats() -> dict:
+    """Cache outcomes since startup: served fresh, revalidated by 304, fetched in full."""
+    with _cache_lock:
+        return dict(_cache_stats)
+
+
+# ─── Connection Stats ─────────────────────────────────────────────────────────
+def connection_stats() -> dict:
+    """
+    New vs reused connections since startup, from urllib3's pool counters:
+    {"new": int, "reused": int, "hosts": {host: {"new": int, "requests": int}}}
+    """
+    stats = {"new": 0, "reused": 0, "hosts": {}}
+    if _session is None:
+        return stats
+
+    seen = set()
+    for adapter in _session.adapters.values():
+        if id(adapter) in seen:
+            continue
+        seen.add(id(adapter))
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = stats["hosts"].setdefault(pool.host, {"new": 0, "requests": 0})
+            host["new"]      += pool.num_connections
+            host["requests"] += pool.num_requests
+
+    for host in stats["hosts"].values():
+        stats["new"]    += host["new"]
+        stats["reused"] += max(host["requests"] - host["new"], 0)
+    return stats
+
+
+def stats_line() -> str:
+    s = connection_stats()
+    c = _cache_stats
+    return (
+        f"HTTP | new connections: {s['new']}  reused: {s['reused']}  hosts: {len(s['hosts'])}"
+        f"  | cache fresh: {c['fresh']}  304: {c['revalidated']}  fetched: {c['fetched']}"
+    )
+
+
+if __name__ == "__main__":
+    for _ in range(3):
+        get("https://hn.algolia.com/api/v1/search_by_date", params={"query": "hiring", "hitsPerPage": 1})
+    print(stats_line())
@@ -0,0 +1,202 @@
+"""
+ingest.py — Deterministic Job Ingest (no LLM in the loop)
+==========================================================
+Used by monitor mode, cloud_runner and github_runner:
+
+  1. Query the configured sources concurrently (one network round per source)
+  2. Normalize + dedupe the records
+  3. Rank them locally — keyword / location / freshness score plus a resume-fit bonus (ranker.py)
+  4. Bulk-insert the top N into the job store in one transaction
+
+The LLM is optional and only used to write a short summary of what was saved.
+
+Run:  python ingest.py "python developer" "Toronto"
+"""
+
+import logging
+import re
+import sys
+from datetime import datetime
+
+from config import INGEST_SOURCES, INGEST_TOP_N, INGEST_SUMMARY, RANKER_WEIGHT
+from fanout import fan_out
+from job_records import to_saved_job
+from dedupe import DedupeIndex
+from job_store import get_store
+from ranker import get_ranker
+from more_sources import fetch_remoteok, fetch_hn_hiring, fetch_indeed, fetch_wellfound
+from tools import crawl_job_boards
+
+log = logging.getLogger("Ingest")
+
+SOURCE_TIMEOUT  = 15
+SOURCE_TIMEOUTS = {"adzuna": 50}    # the Adzuna crawl pages through results
+
+_WORD = re.compile(r"[a-z0-9+#]+")
+
+
+def _tokens(text: str) -> set:
+    return set(_WORD.findall((text or "").lower()))
+
+
+# ─── 1. Fetch ──────────────────────────────────────────────────────────────────
+def fetch_sources(keywords: str, location: str = "", max_days_old: int = 1,
+                  sources: list = None) -> tuple:
+    """
+    Query every source at once. Returns (records, report) where report is
+    {source: {"status", "count", "elapsed", "error"}}.
+    """
+    available = {
+        "adzuna":    lambda: crawl_job_boards(keywords, location, max_days_old),
+        "remoteok":  lambda: fetch_remoteok(keywords),
+        "hn":        lambda: fetch_hn_hiring(keywords),
+        "indeed":    lambda: fetch_indeed(keywords, location),
+        "wellfound": lambda: fetch_wellfound(keywords, location),
+    }
+    tasks = {name: available[name] for name in (sources or INGEST_SOURCES) if name in available}
+
+    records, report = [], {}
+    for r in fan_out(tasks, timeout=SOURCE_TIMEOUT, timeouts=SOURCE_TIMEOUTS):
+        found = r["result"] or []
+        records.extend(found)
+        report[r["name"]] = {"status": r["status"], "count": len(found),
+                             "elapsed": round(r["elapsed"], 2), "error": r["error"]}
+    return records, report
+
+
+# ─── 2. Dedupe ─────────────────────────────────────────────────────────────────
+def dedupe(records: list) -> list:
+    """Drop records without a title and near-duplicates of an earlier record (see dedupe.py)."""
+    out, index = [], DedupeIndex()
+    for rec in records:
+        if not rec["title"] or index.find(rec) is not None:
+            continue
+        index.add(len(out), rec)
+        out.append(rec)
+    return out
+
+
+# ─── 3. Rank ───────────────────────────────────────────────────────────────────
+def score_record(rec: dict, keywords: str, location: str = "", max_days_old: int = 1) -> float:
+    """
+    Cheap relevance score: keyword hits (title counts most), location match and freshness.
+    Returns -1 for postings that match no keyword or are older than max_days_old,
+    so they never make the cut.
+    """
+    terms = _tokens(keywords)
+    if not terms:
+        return 0.0
+
+    title = _tokens(rec["title"])
+    tags  = _tokens(" ".join(rec["tags"]))
+    body  = _tokens(rec["description"])
+    if not terms & (title | tags | body):
+        return -1
+    score = (3 * len(terms & title) + 1.5 * len(terms & tags) + 0.5 * len(terms & body)) / len(terms)
+
+    loc    = rec["location"].lower()
+    places = [p.strip().lower() for p in location.split(";") if p.strip()]
+    if any(p in loc for p in places):
+        score += 1
+    elif "remote" in loc:
+        score += 0.5
+
+    if rec["posted"]:
+        try:
+            age = (datetime.now() - datetime.fromisoformat(rec["posted"])).days
+            if age > max(max_days_old, 0) + 1:
+                return -1
+            score += 1 if age <= 0 else 0.5
+        except ValueError:
+            pass
+    return score
+
+
+def rank(records: list, keywords: str, location: str = "", max_days_old: int = 1) -> list:
+    """
+    Records sorted best-first as (score, record) pairs, stale ones dropped.
+    With a resume / search profile, up to RANKER_WEIGHT is added for fit (BM25, scaled to the best one).
+    """
+    scored = [(score_record(r, keywords, location, max_days_old), r) for r in records]
+    scored = [p for p in scored if p[0] >= 0]
+
+    ranker = get_ranker()
+    if ranker and scored:
+        fit  = ranker.scores([r for _, r in scored])
+        best = fit.max()
+        if best > 0:
+            scored = [(s + RANKER_WEIGHT * float(f / best), r) for (s, r), f in zip(scored, fit)]
+    return sorted(scored, key=lambda p: -p[0])
+
+
+# ─── 4. Ingest ─────────────────────────────────────────────────────────────────
+def ingest(keywords: str, location: str = "", max_days_old: int = 1,
+           top_n: int = INGEST_TOP_N, sources: list = None) -> dict:
+    """
+    Run one full cycle and return:
+    {"saved": [jobs with ids], "duplicates": int, "fetched": int, "report": {...}}
+    """
+    records, report = fetch_sources(keywords, location, max_days_old, sources)
+    unique = dedupe(records)
+    ranked = rank(unique, keywords, location, max_days_old)
+
+    # Skip what's already stored before taking the top N, so a cycle isn't wasted on repeats
+    store = get_store()
+    fresh = [(s, r) for s, r in ranked if store.find_duplicate(r) is None]
+    batch = [
+        {
+            **to_saved_job(rec, notes=f"Auto-ingested · score {score:.1f}"),
+            "saved_at":   datetime.now().isoformat(),
+            "status":     "Saved",
+            "applied":    False,
+            "applied_at": "",
+            "followup_sent": False,
+            "rank_score": round(score, 2),
+        }
+        for score, rec in fresh[:top_n]
+    ]
+    saved, dups = store.add_jobs(batch)
+    already     = len(ranked) - len(fresh) + len(dups)
+
+    for name, r in report.items():
+        log.info(f"  {name:<10} {r['status']:<7} {r['count']:>3} job(s) in {r['elapsed']}s"
+                 + (f"  ({r['error']})" if r["error"] else ""))
+    log.info(f"Ingest: fetched {len(records)}, unique {len(unique)}, "
+             f"already saved {already}, saved {len(saved)}")
+
+    return {"saved": saved, "duplicates": already, "fetched": len(records), "report": report}
+
+
+def summarize(saved: list) -> str:
+    """Optional one-shot LLM summary of the jobs saved this cycle ("" if unavailable)."""
+    if not saved:
+        return ""
+    try:
+        from ai_client import get_client
+        listing = "\n".join(f"- {j['title']} at {j['company']} ({j['location'] or 'n/a'})" for j in saved)
+        response = get_client().chat(
+            [{"role": "user", "content": f"Summarise these new job postings in 2-3 sentences:\n{listing}"}],
+            [], "You are a concise job search assistant."
+        )
+        return response.get("content", "")
+    except Exception as e:
+        log.warning(f"Summary skipped: {e}")
+        return ""
+
+
+def run_cycle(keywords: str, location: str = "", max_days_old: int = 1, summary: bool = INGEST_SUMMARY) -> dict:
+    """ingest() plus the optional LLM summary — the entry point for scheduled runs."""
+    result = ingest(keywords, location, max_days_old)
+    result["summary"] = summarize(result["saved"]) if summary else ""
+    return result
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    kw  = sys.argv[1] if len(sys.argv) > 1 else "software engineer"
+    loc = sys.argv[2] if len(sys.argv) > 2 else ""
+    result = run_cycle(kw, loc)
+    for job in result["saved"]:
+        print(f"✅ #{job['id']} {job['title']} at {job['company']}  (score {job['rank_score']})")
+    if result["summary"]:
+        print(f"\n{result['summary']}")
@@ -6,17 +6,20 @@ Uses Groq (Llama 3.3 70B) + Gemini fallback.
 import json
 import time
 import schedule
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from ai_client import get_client
+from config import USE_LLM_AGENT
+from job_records import render_compact
+from ranker import top_k
 from tools import (
-    search_job_boards, scrape_company_careers,
-    find_startups_on_maps, save_job_to_file,
+    fetch_job_boards, scrape_company_careers,
+    find_startups_on_maps, save_job_to_file, save_jobs_to_store,
     load_seen_jobs, mark_job_seen
 )
 from more_sources import (
-    search_all_sources, search_remoteok,
-    search_wellfound, search_indeed, search_hn_hiring
+    fetch_remoteok, fetch_wellfound, fetch_indeed, fetch_hn_hiring, wellfound_search_url
 )
 
 TOOLS = [
@@ -49,9 +52,36 @@ TOOLS = [
             "required": ["keywords", "source"]
         }
     },
+    {
+        "name": "save_jobs",
+        "description": "IMPORTANT: Save all the good jobs you found in ONE call. "
+                       "Duplicates of already-saved jobs are skipped.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "jobs": {
+                    "type": "array",
+                    "description": "The jobs to save",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "title":    {"type": "string", "description": "Job title"},
+                            "company":  {"type": "string", "description": "Company name"},
+                            "location": {"type": "string", "description": "Job location"},
+                            "url":      {"type": "string", "description": "Link to the job"},
+                            "source":   {"type": "string", "description": "Where found"},
+                            "notes":    {"type": "string", "description": "Any notes"}
+                        },
+                        "required": ["title", "company", "source"]
+                    }
+                }
+            },
+            "required": ["jobs"]
+        }
+    },
     {
         "name": "save_job",
-        "description": "IMPORTANT: Save each good job you find. Call this for every job.",
+        "description": "Save a single job. Prefer save_jobs for several.",
         "input_schema": {
             "type": "object",
             "properties": {
@@ -70,41 +100,67 @@ TOOLS = [
 SYSTEM_PROMPT = """You are a job search agent. Your ONLY job is:
 1. Call search_job_boards once to find jobs
 2. Call search_more_sources with source="remoteok" once
-3. Call save_job for the TOP 5 most relevant jobs you found
+3. Call save_jobs ONCE with the TOP 5 most relevant jobs you found
 4. Stop and give a short summary
 
 RULES:
 - Maximum 3 search calls total — do NOT repeat searches
-- You MUST call save_job at least 3 times before finishing
+- You MUST save at least 3 jobs before finishing
 - Keep it short and focused
 - Do NOT search the same source twice"""
 
 
+# Characters of search results handed to the model per call (Groq token limit).
+# Results are pre-ranked against the resume (ranker.py), cut to RANKER_TOP_K,
+# then one compact line per job and cut at a job boundary, never mid-record.
+JOB_BOARD_BUDGET   = 1200
+MORE_SOURCE_BUDGET = 900
+
+# Tool calls from one model turn run side by side on this many threads.
+# Store writes (save_job) are serialized by the job store's own lock.
+TOOL_WORKERS = 4
+
+
+def search_wellfound_tool(keywords: str, location: str) -> str:
+    """Wellfound rarely scrapes (JS-rendered, often blocked) — fall back to its search link."""
+    try:
+        jobs = fetch_wellfound(keywords, location)
+    except Exception as e:
+        return f"Wellfound unavailable ({e}). Direct search link: {wellfound_search_url(keywords)}"
+    if not jobs:
+        return f"Wellfound returned no scrapable listings. Direct search link: {wellfound_search_url(keywords)}"
+    return render_compact(top_k(jobs), MORE_SOURCE_BUDGET)
+
+
 def execute_tool(name: str, inputs: dict) -> str:
     try:
         if name == "search_job_boards":
-            result = search_job_boards(
+            jobs = fetch_job_boards(
                 inputs["keywords"],
                 inputs.get("location", ""),
                 1  # Always max 1 day old
             )
-            # Truncate to avoid hitting Groq's token limit
-            return result[:800] + "\n[Results truncated — use save_job to save the best ones]" if len(result) > 800 else result
+            if not jobs:
+                return f"No jobs found for '{inputs['keywords']}' in the last day."
+            return render_compact(top_k(jobs), JOB_BOARD_BUDGET)
 
         elif name == "search_more_sources":
             src = inputs.get("source", "remoteok")
             kw  = inputs["keywords"]
             loc = inputs.get("location", "")
-            if src == "remoteok":    result = search_remoteok(kw)
-            elif src == "hackernews":result = search_hn_hiring(kw)
-            elif src == "wellfound": result = search_wellfound(kw, loc)
-            elif src == "indeed":    result = search_indeed(kw, loc)
-            else:                    result = search_remoteok(kw)
-            return result[:600] + "\n[Truncated]" if len(result) > 600 else result
+            if src == "wellfound":
+                return search_wellfound_tool(kw, loc)
+            if src == "hackernews":  jobs = fetch_hn_hiring(kw)
+            elif src == "indeed":    jobs = fetch_indeed(kw, loc)
+            else:                    jobs = fetch_remoteok(kw)
+            return render_compact(top_k(jobs), MORE_SOURCE_BUDGET)
 
         elif name == "save_job":
             return save_job_to_file(inputs)
 
+        elif name == "save_jobs":
+            return save_jobs_to_store(list(inputs.get("jobs") or []))
+
         else:
             return f"Unknown tool: {name}"
 
@@ -112,6 +168,19 @@ def execute_tool(name: str, inputs: dict) -> str:
         return f"Tool error in {name}: {str(e)}"
 
 
+def execute_tools(tool_calls: list) -> list:
+    """
+    Run every tool call from one turn at once and return their results in the same order,
+    so a turn takes as long as its slowest tool rather than the sum of all of them.
+    """
+    if len(tool_calls) == 1:
+        tc = tool_calls[0]
+        return [execute_tool(tc["name"], tc["input"])]
+    with ThreadPoolExecutor(max_workers=min(TOOL_WORKERS, len(tool_calls)),
+                            thread_name_prefix="tool") as pool:
+        return list(pool.map(lambda tc: execute_tool(tc["name"], tc["input"]), tool_calls))
+
+
 def run_agent(goal: str, verbose: bool = True) -> str:
     if verbose:
         print(f"\n{'='*60}\n🎯 GOAL: {goal.strip()[:200]}\n{'='*60}\n")
@@ -149,16 +218,18 @@ def run_agent(goal: str, verbose: bool = True) -> str:
                 })
             messages.append({"role": "assistant", "content": assistant_blocks})
 
-            # Execute tools
-            tool_results = []
-            for tc in tool_calls:
-                if verbose:
+            # Execute tools — concurrently, results kept in call order
+            if verbose:
+                for tc in tool_calls:
                     print(f"🔧 [{tc['name']}] {json.dumps(tc['input'])[:100]}")
-                result = execute_tool(tc["name"], tc["input"])
-                if tc["name"] == "save_job":
-                    jobs_saved += 1
+            results = execute_tools(tool_calls)
+
+            tool_results = []
+            for tc, result in zip(tool_calls, results):
+                if tc["name"] in ("save_job", "save_jobs"):
+                    jobs_saved += result.count("✅ Saved job")
                 if verbose:
-                    print(f"   → {result[:200]}{'...' if len(result) > 200 else ''}\n")
+                    print(f"   ← [{tc['name']}] {result[:200]}{'...' if len(result) > 200 else ''}\n")
                 tool_results.append({
                     "type":        "tool_result",
                     "tool_use_id": tc["id"],
@@ -178,21 +249,34 @@ def run_agent(goal: str, verbose: bool = True) -> str:
 
 
 def monitor_jobs(search_config: dict):
+    """
+    Check for new jobs on a schedule. Uses the direct ingest pipeline (no LLM turns)
+    unless search_config["use_llm"] is set.
+    """
     keywords = search_config.get("keywords", "software engineer")
     location = search_config.get("location", "")
     interval = search_config.get("check_every_minutes", 30)
+    use_llm  = search_config.get("use_llm", USE_LLM_AGENT)
 
     print(f"\n🚨 MONITOR STARTED — '{keywords}' every {interval} min\n")
 
     def check():
         now = datetime.now().strftime("%H:%M:%S")
         print(f"[{now}] 🔍 Checking...")
-        goal = (
-            f"Find new '{keywords}' jobs"
-            f"{' in ' + location if location else ''}. "
-            f"Search job boards and RemoteOK. Save the top 5."
-        )
-        run_agent(goal, verbose=False)
+        if use_llm:
+            goal = (
+                f"Find new '{keywords}' jobs"
+                f"{' in ' + location if location else ''}. "
+                f"Search job boards and RemoteOK. Save the top 5."
+            )
+            run_agent(goal, verbose=False)
+        else:
+            from ingest import run_cycle
+            result = run_cycle(keywords, location)
+            for job in result["saved"]:
+                print(f"   ✅ {job['title']} at {job['company']}")
+            if result["summary"]:
+                print(f"   📝 {result['summary']}")
         print(f"[{now}] ✅ Done. Next in {interval} min.")
 
     check()
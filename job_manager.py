@@ -1,8 +1,8 @@
 """
 job_manager.py — View & Manage Your Saved Jobs
 ================================================
-• Browse all saved jobs in a table
-• Filter by status, company, location, source
+• Browse all saved jobs in a paged table — sort by date, company, match score or status
+• Filter by status, company, location, source — indexed keyword search with field:value terms
 • Mark jobs as: Applied / Saved / Rejected / Interview / Offer
 • Add personal notes to any job
 • Export to CSV
@@ -11,16 +11,22 @@ job_manager.py — View & Manage Your Saved Jobs
 Run:  python job_manager.py
 """
 
-import json
 import os
 import csv
-from datetime import datetime
-from ai_tools import ai_tools_menu
-from reminders import reminders_menu
+from datetime import datetime, timedelta
+from job_store import get_store
+from config import JOB_PAGE_SIZE
 
-SAVED_JOBS_FILE = "saved_jobs.json"
 EXPORT_FILE     = "jobs_export.csv"
 
+# Table orderings, cycled with [O] — keys are job_store.SORTS
+SORT_LABELS = {
+    "saved":   "newest first",
+    "company": "company A–Z",
+    "score":   "best match first",
+    "status":  "status",
+}
+
 # ─── Statuses ──────────────────────────────────────────────────────────────────
 STATUSES = {
     "1": ("💾", "Saved",      "\033[96m"),   # cyan
@@ -63,45 +69,16 @@ def pause():
 
 
 # ─── Data Layer ────────────────────────────────────────────────────────────────
-def load_jobs() -> list:
-    if not os.path.exists(SAVED_JOBS_FILE):
-        return []
-    try:
-        with open(SAVED_JOBS_FILE, "r") as f:
-            jobs = json.load(f)
-        # Ensure all jobs have required fields
-        for i, job in enumerate(jobs):
-            job.setdefault("id", i + 1)
-            job.setdefault("status", "Saved")
-            job.setdefault("notes", "")
-            job.setdefault("saved_at", "")
-            job.setdefault("applied_at", "")
-            job.setdefault("title", "Unknown Role")
-            job.setdefault("company", "Unknown Company")
-            job.setdefault("location", "")
-            job.setdefault("url", "")
-            job.setdefault("source", "")
-        return jobs
-    except Exception as e:
-        print(red(f"  Error loading jobs: {e}"))
-        return []
-
-def save_jobs(jobs: list):
-    # Re-assign sequential IDs
-    for i, job in enumerate(jobs):
-        job["id"] = i + 1
-    with open(SAVED_JOBS_FILE, "w") as f:
-        json.dump(jobs, f, indent=2)
+_STATUS_LABELS = {label: f"{color}{icon} {label}{C.RESET}" for icon, label, color in STATUSES.values()}
 
 def status_label(status: str) -> str:
-    for key, (icon, label, color) in STATUSES.items():
-        if label == status:
-            return f"{color}{icon} {label}{C.RESET}"
-    return gray("💾 Saved")
+    return _STATUS_LABELS.get(status) or gray("💾 Saved")
 
 
 # ─── Display Jobs Table ────────────────────────────────────────────────────────
-def display_jobs(jobs: list, title: str = "All Jobs"):
+def display_jobs(jobs: list, title: str = "All Jobs", total: int = None, page: int = 0,
+                 pages: int = 1, sort: str = "saved"):
+    """Draw a table of `jobs` — one page of a listing `total` jobs long."""
     clear()
     header(title)
 
@@ -149,7 +126,36 @@ def display_jobs(jobs: list, title: str = "All Jobs"):
             f"  {gray(date)}{note_icon}"
         )
 
-    print(f"\n  {gray(f'Total: {len(jobs)} job(s)')}")
+    total = len(jobs) if total is None else total
+    print(f"\n  {gray(f'Page {page + 1}/{pages}  ·  Total: {total} job(s)  ·  Sorted: {SORT_LABELS[sort]}')}")
+
+def load_page(view: dict):
+    """
+    Read the visible page of the current view (filter, sort, page) into view["rows"].
+    Skipped when neither the view nor the store has changed since the last read, so
+    redrawing after "C" or a typo costs no queries — but a write from anywhere
+    (this session, cloud_runner, the agent) shows up on the next redraw.
+    """
+    store = get_store()
+    key   = (store.version(), repr(view["filter"]), view["sort"], view["page"])
+    if key == view.get("loaded"):
+        return
+    spec  = view["filter"] or {}
+    total = store.count(**spec)
+    pages = max(1, -(-total // JOB_PAGE_SIZE))
+    view["page"]  = max(0, min(view["page"], pages - 1))
+    view["rows"]  = store.find_jobs(**spec, sort=view["sort"],
+                                    offset=view["page"] * JOB_PAGE_SIZE, limit=JOB_PAGE_SIZE)
+    view["total"] = total
+    view["pages"] = pages
+    view["loaded"] = key[:3] + (view["page"],)
+
+def display_page(view: dict):
+    """Draw the visible page of the current view, reading it from the store only if it changed."""
+    load_page(view)
+    total = view["total"]
+    title = f"Filtered ({total})" if view["filter"] else f"All Jobs ({total})"
+    display_jobs(view["rows"], title, total, view["page"], view["pages"], view["sort"])
 
 def white_or_gray(text, job):
     """Make active jobs bright, rejected/no-response dim."""
@@ -158,24 +164,24 @@ def white_or_gray(text, job):
 
 
 # ─── Stats Dashboard ───────────────────────────────────────────────────────────
-def show_stats(jobs: list):
+def show_stats():
     clear()
     header("Dashboard")
 
-    if not jobs:
+    stats = get_store().stats("status", "source", "day")
+    total = stats["total"]
+    if not total:
         print(yellow("  No jobs saved yet."))
         pause()
         return
 
-    counts = {}
-    for job in jobs:
-        s = job.get("status", "Saved")
-        counts[s] = counts.get(s, 0) + 1
-
-    total = len(jobs)
+    counts = stats["status"]
 
     print(f"  {bold('📊 Your Job Search Stats')}\n")
-    print(f"  {bold('Total saved:')}  {cyan(str(total))}\n")
+    print(f"  {bold('Total saved:')}  {cyan(str(total))}")
+    week_ago = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+    this_week = sum(n for day, n in stats["day"].items() if day >= week_ago)
+    print(f"  {bold('Last 7 days:')}  {cyan(str(this_week))}\n")
 
     bar_width = 30
     for key, (icon, label, color) in STATUSES.items():
@@ -185,26 +191,16 @@ def show_stats(jobs: list):
         print(f"  {color}{icon} {label.ljust(14)} {bar}  {count}{C.RESET}")
 
     # Sources breakdown
-    sources = {}
-    for job in jobs:
-        s = job.get("source", "Unknown")
-        sources[s] = sources.get(s, 0) + 1
-
     print(f"\n  {bold('📡 Sources:')}")
-    for src, cnt in sorted(sources.items(), key=lambda x: -x[1]):
-        print(f"    {gray('•')} {cyan(src.ljust(25))} {cnt} job(s)")
+    for src, cnt in stats["source"].items():
+        print(f"    {gray('•')} {cyan((src or 'Unknown').ljust(25))} {cnt} job(s)")
 
     # Companies
-    companies = {}
-    for job in jobs:
-        c = job.get("company", "Unknown")
-        companies[c] = companies.get(c, 0) + 1
-
-    if companies:
-        top = sorted(companies.items(), key=lambda x: -x[1])[:5]
+    top = get_store().stats("company", top=5)["company"]
+    if top:
         print(f"\n  {bold('🏢 Top Companies:')}")
-        for co, cnt in top:
-            print(f"    {gray('•')} {cyan(co.ljust(25))} {cnt} role(s)")
+        for co, cnt in top.items():
+            print(f"    {gray('•')} {cyan((co or 'Unknown').ljust(25))} {cnt} role(s)")
 
     pause()
 
@@ -241,7 +237,8 @@ def view_job(job: dict):
 
 
 # ─── Filter Jobs ───────────────────────────────────────────────────────────────
-def filter_menu(jobs: list) -> list:
+def filter_menu() -> dict | None:
+    """Ask for a status and keywords. Returns find_jobs() arguments, or None for no filter."""
     clear()
     header("Filter Jobs")
 
@@ -253,31 +250,18 @@ def filter_menu(jobs: list) -> list:
     print()
     choice = input(f"  {bold('→')} Status filter (0-6): ").strip()
 
-    if choice == "0" or not choice:
-        filtered = jobs
-    elif choice in STATUSES:
-        _, label, _ = STATUSES[choice]
-        filtered = [j for j in jobs if j.get("status", "Saved") == label]
-    else:
-        filtered = jobs
+    status = STATUSES[choice][1] if choice in STATUSES else None
 
-    # Optional keyword filter
+    # Optional keyword filter — all words must match (as word prefixes), field:value narrows a word
     print()
-    kw = input(f"  {bold('→')} Filter by keyword (company/role/location, or Enter to skip): ").strip().lower()
-    if kw:
-        filtered = [
-            j for j in filtered
-            if kw in j.get("title", "").lower()
-            or kw in j.get("company", "").lower()
-            or kw in j.get("location", "").lower()
-            or kw in j.get("notes", "").lower()
-        ]
+    print("  " + gray('e.g.  python remote   ·   company:stripe status:applied   ·   title:"data eng"'))
+    kw = input(f"  {bold('→')} Filter by keyword (company/role/location/notes, or Enter to skip): ").strip()
 
-    return filtered
+    return {"status": status, "query": kw} if status or kw else None
 
 
 # ─── Update Status ─────────────────────────────────────────────────────────────
-def update_status(job: dict, jobs: list) -> list:
+def update_status(job: dict):
     clear()
     header(f"Update Status — {job['title']} @ {job['company']}")
 
@@ -298,21 +282,13 @@ def update_status(job: dict, jobs: list) -> list:
         if label == "Applied" and not job.get("applied_at"):
             job["applied_at"] = datetime.now().isoformat()
 
-        # Find and update in main list
-        for i, j in enumerate(jobs):
-            if j["id"] == job["id"]:
-                jobs[i] = job
-                break
-
-        save_jobs(jobs)
+        get_store().update_job(job["id"], {"status": label, "applied_at": job.get("applied_at", "")})
         print(green(f"\n  ✅ Status updated: {old_status} → {label}"))
         pause()
 
-    return jobs
-
 
 # ─── Edit Notes ────────────────────────────────────────────────────────────────
-def edit_notes(job: dict, jobs: list) -> list:
+def edit_notes(job: dict):
     clear()
     header(f"Notes — {job['title']} @ {job['company']}")
 
@@ -336,26 +312,20 @@ def edit_notes(job: dict, jobs: list) -> list:
         lines.append(line)
 
     job["notes"] = "\n".join(lines)
-    for i, j in enumerate(jobs):
-        if j["id"] == job["id"]:
-            jobs[i] = job
-            break
-
-    save_jobs(jobs)
+    get_store().update_job(job["id"], {"notes": job["notes"]})
     print(green("\n  ✅ Notes saved."))
     pause()
-    return jobs
 
 
 # ─── Delete Job ────────────────────────────────────────────────────────────────
-def delete_job(job: dict, jobs: list) -> list:
+def delete_job(job: dict) -> bool:
     confirm = input(f"\n  {red('Delete')} '{job['title']}' at {job['company']}? {gray('(y/N)')}: ").strip().lower()
     if confirm == "y":
-        jobs = [j for j in jobs if j["id"] != job["id"]]
-        save_jobs(jobs)
+        get_store().delete_job(job["id"])
         print(green("  ✅ Job deleted."))
         pause()
-    return jobs
+        return True
+    return False
 
 
 # ─── Export to CSV ─────────────────────────────────────────────────────────────
@@ -382,7 +352,7 @@ def export_csv(jobs: list):
 
 
 # ─── Bulk Actions ──────────────────────────────────────────────────────────────
-def bulk_actions(jobs: list) -> list:
+def bulk_actions():
     clear()
     header("Bulk Actions")
 
@@ -394,34 +364,24 @@ def bulk_actions(jobs: list) -> list:
     choice = input(f"  {bold('→')} Action: ").strip()
 
     if choice == "1":
-        count = 0
-        for j in jobs:
-            if j.get("status", "Saved") == "Saved":
-                j["status"] = "Applied"
-                j["applied_at"] = datetime.now().isoformat()
-                count += 1
-        save_jobs(jobs)
+        count = get_store().set_status_where("Saved", "Applied", stamp_applied=True)
         print(green(f"\n  ✅ Marked {count} job(s) as Applied."))
 
     elif choice == "2":
-        before = len(jobs)
-        jobs = [j for j in jobs if j.get("status") != "Rejected"]
-        save_jobs(jobs)
-        print(green(f"\n  ✅ Deleted {before - len(jobs)} rejected job(s)."))
+        count = get_store().delete_where_status("Rejected")
+        print(green(f"\n  ✅ Deleted {count} rejected job(s)."))
 
     elif choice == "3":
         confirm = input(red("  ⚠  Delete ALL jobs? This cannot be undone. Type YES to confirm: "))
         if confirm.strip() == "YES":
-            jobs = []
-            save_jobs(jobs)
+            get_store().delete_all()
             print(green("\n  ✅ All jobs deleted."))
 
     pause()
-    return jobs
 
 
 # ─── Add Job Manually ─────────────────────────────────────────────────────────
-def add_job_manually(jobs: list) -> list:
+def add_job_manually() -> dict | None:
     clear()
     header("Add Job Manually")
 
@@ -436,10 +396,9 @@ def add_job_manually(jobs: list) -> list:
     if not title or not company:
         print(red("\n  Title and company are required."))
         pause()
-        return jobs
+        return None
 
     new_job = {
-        "id":         len(jobs) + 1,
         "title":      title,
         "company":    company,
         "location":   location,
@@ -451,24 +410,24 @@ def add_job_manually(jobs: list) -> list:
         "applied_at": ""
     }
 
-    jobs.append(new_job)
-    save_jobs(jobs)
+    saved = get_store().add_job(new_job)
     print(green(f"\n  ✅ Job saved: {title} at {company}"))
     pause()
-    return jobs
+    return saved
 
 
 # ─── Main Loop ─────────────────────────────────────────────────────────────────
 def main():
-    active_filter = None
+    # Session state: what the table shows — find_jobs() filter arguments (None = everything),
+    # sort key and page — plus the rows on screen, cached until the view or the store changes
+    view = {"filter": None, "sort": "saved", "page": 0}
 
     while True:
-        jobs = load_jobs()
-        display_jobs(active_filter if active_filter is not None else jobs,
-                     f"Filtered ({len(active_filter)})" if active_filter is not None else f"All Jobs ({len(jobs)})")
+        display_page(view)
 
         print(f"\n  {bold(blue('─── Actions ─────────────────────────────────────────'))}")
         print(f"  {bold('[#]')}  View/edit a job by its number")
+        print(f"  {bold('[>]')}  Next page   {bold('[<]')}  Previous   {bold('[P#]')}  Go to page   {bold('[O]')}  Sort order")
         print(f"  {bold('[F]')}  Filter jobs          {bold('[A]')}  Add job manually")
         print(f"  {bold('[S]')}  Stats dashboard       {bold('[B]')}  Bulk actions")
         print(f"  {bold('[E]')}  Export to CSV         {bold('[C]')}  Clear filter")
@@ -478,60 +437,71 @@ def main():
 
         cmd = input(f"  {bold('→')} Command: ").strip().upper()
 
-        current_jobs = active_filter if active_filter is not None else jobs
-
         # View by number
         if cmd.isdigit():
             job_id = int(cmd)
-            match = next((j for j in jobs if j["id"] == job_id), None)
+            # Jobs on screen are already loaded — edits below update these same dicts
+            match = next((j for j in view["rows"] if j["id"] == job_id), None) or get_store().get_job(job_id)
             if match:
                 while True:
                     action, match = view_job(match)
                     if action == "S":
-                        jobs = update_status(match, jobs)
-                        active_filter = None
+                        update_status(match)
                     elif action == "N":
-                        jobs = edit_notes(match, jobs)
-                        active_filter = None
+                        edit_notes(match)
                     elif action == "D":
-                        jobs = delete_job(match, jobs)
-                        active_filter = None
+                        delete_job(match)
                         break
                     elif action == "A":
-                        jobs = ai_tools_menu(match, jobs)
-                        active_filter = None
+                        from ai_tools import ai_tools_menu
+                        ai_tools_menu(match)
                     else:
                         break
             else:
                 print(red(f"  Job #{job_id} not found."))
                 pause()
 
+        # Paging — out-of-range pages are clamped by display_page
+        elif cmd == ">":
+            view["page"] += 1
+
+        elif cmd == "<":
+            view["page"] -= 1
+
+        elif cmd.startswith("P") and cmd[1:].strip().isdigit():
+            view["page"] = int(cmd[1:]) - 1
+
+        elif cmd == "O":
+            sorts = list(SORT_LABELS)
+            view["sort"] = sorts[(sorts.index(view["sort"]) + 1) % len(sorts)]
+            view["page"] = 0
+
         elif cmd == "F":
-            result = filter_menu(jobs)
-            active_filter = result
+            view["filter"] = filter_menu()
+            view["page"]   = 0
 
         elif cmd == "C":
-            active_filter = None
+            view["filter"] = None
+            view["page"]   = 0
 
         elif cmd == "A":
-            jobs = add_job_manually(jobs)
-            active_filter = None
+            add_job_manually()
 
         elif cmd == "S":
-            show_stats(jobs)
+            show_stats()
 
         elif cmd == "B":
-            jobs = bulk_actions(jobs)
-            active_filter = None
+            bulk_actions()
 
         elif cmd == "E":
-            export_csv(current_jobs)
+            export_csv(get_store().find_jobs(**(view["filter"] or {}), sort=view["sort"]))
 
         elif cmd == "R":
             print(f"\n  {green('Launching job search agent...')}\n")
             os.system("python menu.py")
 
         elif cmd == "N":
+            from reminders import reminders_menu
             reminders_menu()
 
         elif cmd == "Q":
@@ -0,0 +1,99 @@
+"""
+job_records.py — Normalized Job Records
+========================================
+Every search source returns a list of these instead of formatted text:
+
+    {"title", "company", "location", "url", "posted", "source", "tags", "raw_id", "description"}
+
+Text for humans / the LLM is produced separately by render_jobs() and render_compact(),
+so the pipeline can dedupe, rank and save records without re-parsing prose.
+"""
+
+from typing import TypedDict
+
+
+class JobRecord(TypedDict):
+    title:       str
+    company:     str
+    location:    str
+    url:         str
+    posted:      str    # ISO date (YYYY-MM-DD) or "" if unknown
+    source:      str
+    tags:        list
+    raw_id:      str    # the source's own id for the posting
+    description: str
+
+
+def make_job(title: str = "", company: str = "", location: str = "", url: str = "",
+             posted: str = "", source: str = "", tags: list = None, raw_id="",
+             description: str = "") -> JobRecord:
+    """Build a record, coercing every field to its expected type."""
+    return {
+        "title":       (title or "").strip(),
+        "company":     (company or "").strip(),
+        "location":    (location or "").strip(),
+        "url":         (url or "").strip(),
+        "posted":      (posted or "")[:10],
+        "source":      source,
+        "tags":        [str(t) for t in (tags or []) if t],
+        "raw_id":      str(raw_id or ""),
+        "description": (description or "").strip(),
+    }
+
+
+def to_saved_job(record: JobRecord, notes: str = "") -> dict:
+    """
+    Map a record onto a job-store row. The description is kept for the AI tools
+    (but not exported to saved_jobs.json — see job_store.EXPORT_OMIT).
+    """
+    return {
+        "title":       record["title"],
+        "company":     record["company"],
+        "location":    record["location"],
+        "url":         record["url"],
+        "source":      record["source"],
+        "notes":       notes,
+        "posted":      record["posted"],
+        "tags":        record["tags"],
+        "description": record["description"][:4000],
+    }
+
+
+# ─── Rendering ────────────────────────────────────────────────────────────────
+def render_jobs(records: list, heading: str, footer: str = "", max_results: int = None) -> str:
+    """Full emoji listing, as shown in the terminal."""
+    out = [heading + "\n"]
+    for i, job in enumerate(records[:max_results], 1):
+        lines = [f"{i}. 📌 {job['title'] or 'N/A'}"]
+        if job["company"]:
+            lines.append(f"   Company:  {job['company']}")
+        if job["location"]:
+            lines.append(f"   Location: {job['location']}")
+        if job["tags"]:
+            lines.append(f"   Tags:     {', '.join(job['tags'][:4])}")
+        lines.append(f"   Posted:   {job['posted'] or 'Recently'}")
+        if job["url"]:
+            lines.append(f"   Link:     {job['url']}")
+        out.append("\n".join(lines) + "\n")
+    if footer:
+        out.append(footer)
+    return "\n".join(out)
+
+
+def render_compact(records: list, budget: int = 1200) -> str:
+    """
+    One line per job for the LLM, cut at a record boundary once `budget` chars are used.
+    Lines start with the record's index so the model can refer back to it.
+    """
+    out, used = [], 0
+    for i, job in enumerate(records, 1):
+        line = " | ".join(p for p in (
+            f"[{i}] {job['title']}", job["company"], job["location"],
+            job["posted"], job["source"], job["url"],
+        ) if p)
+        if used + len(line) > budget and out:
+            out.append(f"[{len(records) - i + 1} more not shown]")
+            break
+        out.append(line)
+        used += len(line) + 1
+    return "\n".join(out) if out else "No jobs found."
@@ -0,0 +1,604 @@
+"""
+job_store.py — Embedded SQLite Job Store
+=========================================
+• One row per saved job, stored in jobs.db (WAL mode)
+• Saving, status changes and note edits are single-row writes
+• Near-duplicate detection (see dedupe.py) — the same posting from two boards is saved once
+• Keyword search over an in-memory inverted index (see search_index.py), kept up to date on every write
+• Stable job ids — never renumbered, never reused after a delete
+• Paged, sorted listings (find_jobs) — a screenful is a LIMIT / OFFSET read
+• Ids only grow, so "what's new since X" is a range read (see last_id / jobs_since)
+• Counts by status / source / company / saved day kept in job_counts by triggers,
+  so dashboards read a few rows instead of every job (see stats)
+• A change counter (version) so callers can cache reads until the jobs change —
+  including writes from another process such as cloud_runner.py
+• Safe to share across threads — every call holds the store's lock
+• One-time import from the legacy saved_jobs.json
+• Export back to JSON (used by the GitHub Actions runner)
+
+Run:  python job_store.py export   — write saved_jobs.json from the store
+      python job_store.py import   — add any new jobs from saved_jobs.json
+"""
+
+import functools
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+from datetime import datetime, timedelta
+
+from config import JOBS_DB_FILE, SAVED_JOBS_FILE
+from dedupe import DedupeIndex, KEY_VERSION, job_key, legacy_key
+from search_index import SearchIndex, FIELDS as SEARCH_FIELDS
+
+# Fields stored as real columns — anything else on a job dict goes into `extra`
+COLUMNS = ["title", "company", "location", "url", "source", "notes",
+           "status", "saved_at", "applied_at"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,  -- AUTOINCREMENT: deleted ids are never handed out again
+    title       TEXT NOT NULL DEFAULT '',
+    company     TEXT NOT NULL DEFAULT '',
+    location    TEXT NOT NULL DEFAULT '',
+    url         TEXT NOT NULL DEFAULT '',
+    source      TEXT NOT NULL DEFAULT '',
+    notes       TEXT NOT NULL DEFAULT '',
+    status      TEXT NOT NULL DEFAULT 'Saved',
+    saved_at    TEXT NOT NULL DEFAULT '',
+    applied_at  TEXT NOT NULL DEFAULT '',
+    extra       TEXT NOT NULL DEFAULT '{}',
+    job_key     TEXT NOT NULL DEFAULT ''    -- see job_key(); used for dedupe
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
+CREATE INDEX IF NOT EXISTS idx_jobs_saved ON jobs(saved_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_saved ON jobs(status, saved_at DESC);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_jobs_score ON jobs(json_extract(extra, '$.match_score'));
+
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+-- Materialized counts per dimension, kept current by the triggers below (see stats())
+CREATE TABLE IF NOT EXISTS job_counts (
+    dim    TEXT NOT NULL,
+    value  TEXT NOT NULL,
+    n      INTEGER NOT NULL,
+    PRIMARY KEY (dim, value)
+);
+"""
+
+# Dimensions counted in job_counts: name -> SQL expression over a jobs row ({row} = new / old / jobs)
+COUNT_DIMS = {
+    "status":  "{row}.status",
+    "source":  "{row}.source",
+    "company": "{row}.company",
+    "day":     "substr({row}.saved_at, 1, 10)",     # saved date, YYYY-MM-DD
+}
+COUNTS_VERSION = "1"    # bump when COUNT_DIMS changes — the counts are rebuilt on open
+
+
+def _count_triggers() -> str:
+    """Triggers that move job_counts in the same transaction as every insert, update and delete."""
+    def bump(dim, row, delta):
+        value = COUNT_DIMS[dim].format(row=row)
+        sql = (f"INSERT INTO job_counts (dim, value, n) VALUES ('{dim}', {value}, {delta}) "
+               f"ON CONFLICT(dim, value) DO UPDATE SET n = n + {delta};")
+        if delta < 0:
+            sql += f" DELETE FROM job_counts WHERE dim = '{dim}' AND value = {value} AND n <= 0;"
+        return sql
+
+    inserts = " ".join(bump(dim, "new", 1) for dim in COUNT_DIMS)
+    deletes = " ".join(bump(dim, "old", -1) for dim in COUNT_DIMS)
+    sql = [
+        f"CREATE TRIGGER IF NOT EXISTS trg_counts_insert AFTER INSERT ON jobs BEGIN {inserts} END;",
+        f"CREATE TRIGGER IF NOT EXISTS trg_counts_delete AFTER DELETE ON jobs BEGIN {deletes} END;",
+    ]
+    for dim, expr in COUNT_DIMS.items():
+        column = re.search(r"\{row\}\.(\w+)", expr).group(1)
+        sql.append(
+            f"CREATE TRIGGER IF NOT EXISTS trg_counts_{dim} AFTER UPDATE OF {column} ON jobs "
+            f"WHEN old.{column} IS NOT new.{column} BEGIN {bump(dim, 'old', -1)} {bump(dim, 'new', 1)} END;"
+        )
+    return "\n".join(sql)
+
+
+# Left out of export_json — the export is committed to git every run, and full descriptions
+# (up to 4 KB a job, only used by the local AI tools) would pile up in its history
+EXPORT_OMIT = {"description"}
+
+# Orderings for paged listings (find_jobs) — newest / A-Z / best match / by status
+SORTS = {
+    "saved":   "saved_at DESC, id DESC",
+    "company": "company COLLATE NOCASE, id",
+    "score":   "json_extract(extra, '$.match_score') DESC, id DESC",     # unscored (NULL) sort last
+    "status":  "status, saved_at DESC",
+}
+
+
+# ─── Row <-> dict ──────────────────────────────────────────────────────────────
+def _split(job: dict) -> tuple:
+    """Split a job dict into column values and the JSON `extra` blob."""
+    cols  = {c: ("" if job[c] is None else job[c]) for c in COLUMNS if c in job}
+    extra = {
+        k: v for k, v in job.items()
+        if k not in COLUMNS and k != "id" and not k.startswith("_")  # _days_since etc. are runtime-only
+    }
+    return cols, extra
+
+
+def _to_job(row: sqlite3.Row) -> dict:
+    job = {"id": row["id"]}
+    for c in COLUMNS:
+        job[c] = row[c]
+    job.update(json.loads(row["extra"] or "{}"))
+    return job
+
+
+def _locked(method):
+    """Run a JobStore method while holding the store lock (one writer/reader at a time)."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# JOB STORE
+# ═══════════════════════════════════════════════════════════════════════════════
+class JobStore:
+    """Thin wrapper around a SQLite database holding the saved jobs."""
+
+    def __init__(self, path: str = JOBS_DB_FILE, legacy_json: str = SAVED_JOBS_FILE):
+        self.path = path
+        self.lock = threading.RLock()   # the connection is shared by tool threads
+        self.conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.executescript(_count_triggers())
+        self._dedupe = None     # DedupeIndex, built on first use
+        self._search = None     # SearchIndex, built on first search
+        self._writes = 0        # job writes through this connection — see version()
+        self._data_version = self._external_version()
+        self._migrate()
+        self._import_legacy_once(legacy_json)
+
+    def _migrate(self):
+        """Bring databases created by older versions up to the current schema."""
+        cols = {r["name"] for r in self.conn.execute("PRAGMA table_info(jobs)")}
+        if "job_key" not in cols:
+            with self.conn:
+                self.conn.execute("ALTER TABLE jobs ADD COLUMN job_key TEXT NOT NULL DEFAULT ''")
+        # Re-key every row whenever the key normalization changes
+        if self.get_meta("job_key_version") != KEY_VERSION:
+            rekeyed = []    # (old key, new key)
+            with self.conn:
+                for r in self.conn.execute("SELECT id, title, company, job_key FROM jobs").fetchall():
+                    key = job_key(r)
+                    self.conn.execute("UPDATE jobs SET job_key = ? WHERE id = ?", (key, r["id"]))
+                    rekeyed += [(r["job_key"], key), (legacy_key(r), key)]
+            self._rekey_seen(rekeyed)
+            self.set_meta("job_key_version", KEY_VERSION)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_key ON jobs(job_key)")
+        # Count every existing row once; the triggers keep job_counts current from then on
+        if self.get_meta("counts_version") != COUNTS_VERSION:
+            for r in self.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_counts_%'"
+            ).fetchall():
+                self.conn.execute(f"DROP TRIGGER {r['name']}")
+            self.conn.executescript(_count_triggers())
+            with self.conn:
+                self.conn.execute("DELETE FROM job_counts")
+                for dim, expr in COUNT_DIMS.items():
+                    value = expr.format(row="jobs")
+                    self.conn.execute(
+                        f"INSERT INTO job_counts (dim, value, n) "
+                        f"SELECT ?, {value}, COUNT(*) FROM jobs GROUP BY {value}", (dim,)
+                    )
+            self.set_meta("counts_version", COUNTS_VERSION)
+
+    def _rekey_seen(self, pairs: list):
+        """
+        (old key, new key) pairs: the seen-index holds keys in older formats too — carry
+        them over, or every job already alerted on would be announced again.
+        """
+        if pairs:
+            from seen_index import get_seen_index
+            get_seen_index().rekey(pairs)
+
+    # ── Meta ──────────────────────────────────────────────────
+    @_locked
+    def get_meta(self, key: str, default: str = None) -> str:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else default
+
+    @_locked
+    def set_meta(self, key: str, value: str):
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO meta (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, str(value))
+            )
+
+    # ── Reads ─────────────────────────────────────────────────
+    @_locked
+    def all_jobs(self) -> list:
+        rows = self.conn.execute("SELECT * FROM jobs ORDER BY id").fetchall()
+        return [_to_job(r) for r in rows]
+
+    @_locked
+    def get_job(self, job_id: int) -> dict | None:
+        row = self.conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return _to_job(row) if row else None
+
+    @_locked
+    def count(self, status: str = None, query: str = "") -> int:
+        """Number of jobs, optionally only those with `status` / matching a search `query`."""
+        where, params = self._filter(status, query)
+        if where is None:
+            return 0
+        return self.conn.execute(f"SELECT COUNT(*) FROM jobs{where}", params).fetchone()[0]
+
+    @_locked
+    def stats(self, *dims, top: int = None) -> dict:
+        """
+        Job counts from the materialized job_counts table — no scan of the jobs:
+        {"total": n, dim: {value: count, ...}} for each of `dims` (default: all of
+        COUNT_DIMS), largest first. `top` keeps only the largest few per dimension.
+        """
+        result = {"total": self.conn.execute(
+            "SELECT COALESCE(SUM(n), 0) FROM job_counts WHERE dim = 'status'"
+        ).fetchone()[0]}
+        for dim in dims or COUNT_DIMS:
+            rows = self.conn.execute(
+                "SELECT value, n FROM job_counts WHERE dim = ? ORDER BY n DESC, value LIMIT ?",
+                (dim, -1 if top is None else top)
+            )
+            result[dim] = {r["value"]: r["n"] for r in rows}
+        return result
+
+    @_locked
+    def find_jobs(self, status: str = None, query: str = "", sort: str = "saved",
+                  offset: int = 0, limit: int = None) -> list:
+        """
+        One page of jobs, filtered by `status` and a search `query` (see search()),
+        in SORTS[sort] order. limit=None reads every match.
+        """
+        where, params = self._filter(status, query)
+        if where is None:
+            return []
+        rows = self.conn.execute(
+            f"SELECT * FROM jobs{where} ORDER BY {SORTS[sort]} LIMIT ? OFFSET ?",
+            (*params, -1 if limit is None else limit, offset)
+        ).fetchall()
+        return [_to_job(r) for r in rows]
+
+    def _filter(self, status: str, query: str) -> tuple:
+        """(WHERE clause, params) for find_jobs / count — clause is None when nothing can match."""
+        clauses, params = [], []
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        ids = self._search_index().search(query) if query else None
+        if ids is not None:
+            if not ids:
+                return None, ()
+            # One JSON parameter instead of thousands of placeholders
+            clauses.append("id IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps(list(ids)))
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), tuple(params)
+
+    @_locked
+    def last_id(self) -> int:
+        """High-water mark: the largest id handed out so far (0 for a new store)."""
+        row = self.conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'jobs'").fetchone()
+        return row[0] if row else 0
+
+    @_locked
+    def jobs_since(self, cursor: int) -> list:
+        """Jobs inserted after `cursor` (an earlier last_id()), oldest first."""
+        rows = self.conn.execute("SELECT * FROM jobs WHERE id > ? ORDER BY id", (cursor,)).fetchall()
+        return [_to_job(r) for r in rows]
+
+    @_locked
+    def unscored_jobs(self, after_id: int = 0, limit: int = 100, status: str = "Saved") -> list:
+        """Up to `limit` jobs with no match_score yet and an id above `after_id`, oldest first."""
+        rows = self.conn.execute(
+            "SELECT * FROM jobs WHERE id > ? AND status = ? "
+            "AND json_extract(extra, '$.match_score') IS NULL ORDER BY id LIMIT ?",
+            (after_id, status, limit)
+        ).fetchall()
+        return [_to_job(r) for r in rows]
+
+    @_locked
+    def count_followups_due(self, days: int = 7) -> int:
+        """
+        Applied jobs with applied_at `days`+ days ago and no follow-up sent yet —
+        reminders.get_followup_due() as a single COUNT, for the dashboard.
+        """
+        # julianday() parses the same forms as get_followup_due's fromisoformat(applied_at[:19])
+        # — date-only, "T" or space separator — and gives NULL (not counted) for junk
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM jobs WHERE status = 'Applied' "
+            "AND julianday(substr(applied_at, 1, 19)) <= julianday(?) "
+            "AND COALESCE(json_extract(extra, '$.followup_sent'), 0) IN (0, '')",
+            (cutoff,)
+        ).fetchone()[0]
+
+    # ── Change tracking ───────────────────────────────────────
+    def _external_version(self) -> int:
+        # SQLite bumps data_version when another connection commits — never for our own writes
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _sync(self):
+        """Drop the in-memory indexes if another process has written since we last looked."""
+        version = self._external_version()
+        if version != self._data_version:
+            self._data_version = version
+            self._drop_indexes()
+
+    @_locked
+    def version(self) -> tuple:
+        """Changes whenever the jobs may have — compare two calls to know if cached reads are stale."""
+        self._sync()
+        return (self._data_version, self._writes)
+
+    # ── Duplicates ────────────────────────────────────────────
+    def _index(self) -> DedupeIndex:
+        self._sync()
+        if self._dedupe is None:
+            self._dedupe = DedupeIndex()
+            for r in self.conn.execute("SELECT id, title, company, url FROM jobs"):
+                self._dedupe.add(r["id"], r)
+        return self._dedupe
+
+    @_locked
+    def find_duplicate(self, job: dict) -> int | None:
+        """Id of a saved job that `job` is a (near-)duplicate of, or None."""
+        return self._index().find(job)
+
+    # ── Search ────────────────────────────────────────────────
+    def _search_index(self) -> SearchIndex:
+        self._sync()
+        if self._search is None:
+            rows = self.conn.execute(f"SELECT id, {', '.join(SEARCH_FIELDS)} FROM jobs")
+            self._search = SearchIndex((r["id"], r) for r in rows)
+        return self._search
+
+    def _reindex(self, job_ids):
+        """Refresh the search index for rows that just changed (if it's been built)."""
+        if self._search is None:
+            return
+        for job_id in job_ids:
+            row = self.conn.execute(
+                f"SELECT {', '.join(SEARCH_FIELDS)} FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            if row:
+                self._search.add(job_id, row)
+
+    @_locked
+    def search(self, query: str) -> set | None:
+        """
+        Ids of jobs matching every term of `query` (see search_index.py):
+        word prefixes, optionally scoped — "company:stripe status:applied data eng".
+        None for an empty query.
+        """
+        return self._search_index().search(query)
+
+    # ── Writes ────────────────────────────────────────────────
+    @_locked
+    def add_job(self, job: dict) -> dict:
+        """Insert one job and return it with its new id."""
+        with self.conn:
+            job_id = self._insert(job)
+        return {"id": job_id, **job}
+
+    @_locked
+    def add_jobs(self, jobs: list, skip_duplicates: bool = True) -> tuple:
+        """
+        Insert many jobs in one transaction.
+        Returns (saved, duplicates) — saved jobs carry their new ids.
+        Near-duplicates of saved jobs, or of earlier jobs in the batch, are skipped.
+        """
+        saved, duplicates = [], []
+        try:
+            with self.conn:
+                for job in jobs:
+                    if skip_duplicates and self._index().find(job) is not None:
+                        duplicates.append(job)
+                        continue
+                    saved.append({"id": self._insert(job), **job})
+        except Exception:
+            self._drop_indexes()    # rolled back — indexes may hold rows that aren't there
+            raise
+        return saved, duplicates
+
+    @_locked
+    def update_job(self, job_id: int, fields: dict):
+        """Update one job in place. Unknown keys are merged into `extra`."""
+        with self.conn:
+            changed = self._update(job_id, fields)
+        if {"title", "company", "url"} & changed:
+            self._dedupe = None
+        if changed & set(SEARCH_FIELDS):
+            self._reindex([job_id])
+
+    @_locked
+    def update_jobs(self, updates: dict) -> int:
+        """{job_id: fields} — update many jobs in one transaction. Returns how many were given."""
+        changed, searchable = set(), []
+        with self.conn:
+            for job_id, fields in updates.items():
+                cols = self._update(job_id, fields)
+                changed |= cols
+                if cols & set(SEARCH_FIELDS):
+                    searchable.append(job_id)
+        if {"title", "company", "url"} & changed:
+            self._dedupe = None
+        self._reindex(searchable)
+        return len(updates)
+
+    def _update(self, job_id: int, fields: dict) -> set:
+        """Apply `fields` to one row (caller holds the transaction). Returns the columns written."""
+        self._writes += 1
+        cols, extra = _split(fields)
+        if extra:
+            row = self.conn.execute("SELECT extra FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                return set()
+            merged = {**json.loads(row["extra"] or "{}"), **extra}
+            cols["extra"] = json.dumps(merged)
+        if cols:
+            assignments = ", ".join(f"{c} = ?" for c in cols)
+            self.conn.execute(
+                f"UPDATE jobs SET {assignments} WHERE id = ?",
+                (*cols.values(), job_id)
+            )
+        if "title" in cols or "company" in cols:
+            row = self.conn.execute("SELECT title, company FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row:
+                self.conn.execute("UPDATE jobs SET job_key = ? WHERE id = ?", (job_key(row), job_id))
+        return set(cols)
+
+    @_locked
+    def set_status_where(self, old_status: str, new_status: str, stamp_applied: bool = False) -> int:
+        """Move every job with `old_status` to `new_status`. Returns rows changed."""
+        with self.conn:
+            if stamp_applied:
+                cur = self.conn.execute(
+                    "UPDATE jobs SET status = ?, applied_at = ? WHERE status = ?",
+                    (new_status, datetime.now().isoformat(), old_status)
+                )
+            else:
+                cur = self.conn.execute(
+                    "UPDATE jobs SET status = ? WHERE status = ?", (new_status, old_status)
+                )
+        self._writes += 1
+        self._search = None
+        return cur.rowcount
+
+    @_locked
+    def delete_job(self, job_id: int):
+        with self.conn:
+            row = self.conn.execute("SELECT id, title, company, url FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            self.conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+        self._writes += 1
+        if row and self._dedupe is not None:
+            self._dedupe.remove(job_id, row)
+        if self._search is not None:
+            self._search.remove(job_id)
+
+    @_locked
+    def delete_where_status(self, status: str) -> int:
+        with self.conn:
+            cur = self.conn.execute("DELETE FROM jobs WHERE status = ?", (status,))
+        self._drop_indexes()
+        return cur.rowcount
+
+    @_locked
+    def delete_all(self):
+        with self.conn:
+            self.conn.execute("DELETE FROM jobs")
+        self._drop_indexes()
+
+    def _drop_indexes(self):
+        """Bulk change — rebuild the in-memory indexes on next use."""
+        self._writes += 1
+        self._dedupe = None
+        self._search = None
+
+    def _insert(self, job: dict, job_id: int = None) -> int:
+        cols, extra = _split(job)
+        cols["extra"]   = json.dumps(extra)
+        cols["job_key"] = job_key(job)
+        if job_id is not None:
+            cols = {"id": job_id, **cols}
+        names = ", ".join(cols)
+        marks = ", ".join("?" for _ in cols)
+        cur = self.conn.execute(f"INSERT INTO jobs ({names}) VALUES ({marks})", tuple(cols.values()))
+        self._writes += 1
+        if self._dedupe is not None:
+            self._dedupe.add(cur.lastrowid, job)
+        if self._search is not None:
+            self._search.add(cur.lastrowid, {"status": "Saved", **cols})
+        return cur.lastrowid
+
+    # ── JSON import / export ──────────────────────────────────
+    @_locked
+    def import_json(self, path: str = SAVED_JOBS_FILE) -> int:
+        """Add jobs from a saved_jobs.json list, keeping their ids. Ids already in the store are skipped."""
+        if not os.path.exists(path):
+            return 0
+        with open(path, "r") as f:
+            jobs = json.load(f)
+
+        used  = {r[0] for r in self.conn.execute("SELECT id FROM jobs")}
+        added = 0
+        with self.conn:
+            for job in jobs:
+                job_id = job.get("id")
+                if isinstance(job_id, int):
+                    if job_id in used:
+                        continue
+                    self._insert(job, job_id)
+                    used.add(job_id)
+                else:
+                    used.add(self._insert(job))
+                added += 1
+        return added
+
+    @_locked
+    def export_json(self, path: str = SAVED_JOBS_FILE) -> int:
+        """Write every job to a JSON file (atomic replace), minus EXPORT_OMIT fields."""
+        jobs = [{k: v for k, v in job.items() if k not in EXPORT_OMIT} for job in self.all_jobs()]
+        tmp  = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(jobs, f, indent=2)
+        os.replace(tmp, path)
+        return len(jobs)
+
+    def _import_legacy_once(self, legacy_json: str):
+        if self.get_meta("legacy_imported"):
+            return
+        imported = self.import_json(legacy_json)
+        if imported:
+            # A store created from the legacy JSON missed _migrate's re-key — the old seen
+            # keys (title::company, see legacy_key) still have to map onto the new ones
+            rows = self.conn.execute("SELECT title, company, job_key FROM jobs").fetchall()
+            self._rekey_seen([(legacy_key(r), r["job_key"]) for r in rows])
+        self.set_meta("legacy_imported", f"{datetime.now().isoformat()} ({imported} jobs)")
+
+
+# ─── Singleton ────────────────────────────────────────────────────────────────
+_store      = None
+_store_lock = threading.Lock()
+
+def get_store() -> JobStore:
+    """Get or open the shared job store."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = JobStore()
+    return _store
+
+
+if __name__ == "__main__":
+    cmd = sys.argv[1] if len(sys.argv) > 1 else ""
+    store = get_store()
+    if cmd == "export":
+        print(f"✅ Exported {store.export_json()} job(s) to {SAVED_JOBS_FILE}")
+    elif cmd == "import":
+        print(f"✅ Imported {store.import_json()} job(s) from {SAVED_JOBS_FILE}")
+    else:
+        print(f"{store.count()} job(s) in {store.path}")
+        print("Usage: python job_store.py [export|import]")
@@ -43,17 +43,9 @@ def show_splash():
 
 def count_jobs_by_status() -> dict:
     """Quick stats for the dashboard."""
-    import json
     try:
-        if not os.path.exists("saved_jobs.json"):
-            return {}
-        with open("saved_jobs.json") as f:
-            jobs = json.load(f)
-        counts = {}
-        for job in jobs:
-            s = job.get("status", "Saved")
-            counts[s] = counts.get(s, 0) + 1
-        return counts
+        from job_store import get_store
+        return get_store().stats("status")["status"]
     except Exception:
         return {}
 
@@ -61,9 +53,8 @@ def count_jobs_by_status() -> dict:
 def check_reminders_quick() -> int:
     """Return count of jobs needing follow-up."""
     try:
-        from reminders import load_jobs, get_followup_due
-        jobs = load_jobs()
-        return len(get_followup_due(jobs, days=7))
+        from job_store import get_store
+        return get_store().count_followups_due(days=7)
     except Exception:
         return 0
 
@@ -123,7 +114,7 @@ def main():
             setup_hub()
 
         elif choice == "Q":
-            print(f"\n  {gray('Good luck! 🍀  You got this.\n')}")
+            print("\n  " + gray("Good luck! 🍀  You got this.") + "\n")
             sys.exit(0)
 
         else:
@@ -133,15 +124,14 @@ def main():
 # ─── AI Tools Hub ──────────────────────────────────────────────────────────────
 def ai_tools_hub():
     """Pick a job then run AI tools on it."""
-    import json
     from ai_tools import ai_tools_menu
+    from job_store import get_store
 
     clear()
     print(f"\n{bold(C.CYAN + '  🤖 AI Career Tools' + C.RESET)}\n")
 
     try:
-        with open("saved_jobs.json") as f:
-            jobs = json.load(f)
+        jobs = get_store().find_jobs(limit=15)     # newest first — only what the picker shows
     except Exception:
         print(yellow("  No saved jobs yet. Search for jobs first."))
         input(gray("\n  Press Enter to continue..."))
@@ -153,7 +143,7 @@ def ai_tools_hub():
         return
 
     print(f"  {gray('Pick a job to use AI tools on:')}\n")
-    for job in jobs[:15]:
+    for job in jobs:
         score = f"  {green(str(job.get('match_score')) + '%')}" if job.get("match_score") else ""
         jid = job["id"]
         print(f"    {cyan(f'[{jid}]')} {bold(job['title'])} at {job['company']}{score}")
@@ -163,9 +153,9 @@ def ai_tools_hub():
 
     if choice.isdigit():
         job_id = int(choice)
-        match = next((j for j in jobs if j["id"] == job_id), None)
+        match = get_store().get_job(job_id)
         if match:
-            jobs = ai_tools_menu(match, jobs)
+            ai_tools_menu(match)
         else:
             print(red(f"  Job #{job_id} not found."))
             input(gray("\n  Press Enter to continue..."))
@@ -173,8 +163,8 @@ def ai_tools_hub():
 
 # ─── Stats Hub ─────────────────────────────────────────────────────────────────
 def stats_hub():
-    from job_manager import show_stats, load_jobs
-    show_stats(load_jobs())
+    from job_manager import show_stats
+    show_stats()
 
 
 # ─── Setup Hub ─────────────────────────────────────────────────────────────────
@@ -0,0 +1,139 @@
+"""
+llm_cache.py — Persistent Cache for Career-Tool Completions
+============================================================
+• Match scores, tailored resumes, cover letters, interview prep and follow-up
+  emails are cached on disk, so opening the same job twice costs no quota
+• Key = hash of (model, prompt template + version, resume hash, job description hash,
+  options) — edit the resume or the JD, or bump a template version, and it's a miss
+• Entries expire after LLM_CACHE_TTL_DAYS; least-recently-used ones are dropped
+  once the file passes LLM_CACHE_MAX_MB
+• refresh=True skips the lookup and overwrites the entry (the "Regenerate" paths)
+
+Usage:
+    text = cached_completion("cover_letter", 1, model, lambda: call_model(prompt),
+                             resume=resume, jd=jd, options={"tone": tone})
+
+Run:  python llm_cache.py         — show cache stats
+      python llm_cache.py clear   — empty the cache
+"""
+
+import hashlib
+import json
+import sqlite3
+import sys
+import threading
+import time
+
+from config import LLM_CACHE_FILE, LLM_CACHE_TTL_DAYS, LLM_CACHE_MAX_MB
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS completions (
+    key         TEXT PRIMARY KEY,
+    template    TEXT NOT NULL,
+    model       TEXT NOT NULL,
+    text        TEXT NOT NULL,
+    size        INTEGER NOT NULL,
+    created_at  REAL NOT NULL,
+    last_used   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_completions_lru ON completions(last_used);
+"""
+
+_conn  = None
+_lock  = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "refreshed": 0}
+
+
+def _db() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(LLM_CACHE_FILE, timeout=10, check_same_thread=False)
+        _conn.row_factory = sqlite3.Row
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.executescript(SCHEMA)
+    return _conn
+
+
+def digest(text: str) -> str:
+    return hashlib.sha256((text or "").encode()).hexdigest()
+
+
+def cache_key(template: str, version, model: str, resume: str = "", jd: str = "",
+              options: dict = None) -> str:
+    raw = json.dumps({
+        "template": f"{template}@{version}",
+        "model":    model,
+        "resume":   digest(resume),
+        "jd":       digest(jd),
+        "options":  options or {},
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# LOOKUP
+# ═══════════════════════════════════════════════════════════════════════════════
+def cached_completion(template: str, version, model: str, generate, *, resume: str = "",
+                      jd: str = "", options: dict = None, refresh: bool = False) -> str:
+    """
+    Return the cached text for these inputs, or call generate() and cache what it returns.
+    `generate` takes no arguments and returns the completion text.
+    """
+    key = cache_key(template, version, model, resume, jd, options)
+    now = time.time()
+
+    if not refresh:
+        with _lock, _db():
+            row = _db().execute("SELECT text, created_at FROM completions WHERE key = ?", (key,)).fetchone()
+            if row and now - row["created_at"] < LLM_CACHE_TTL_DAYS * 86400:
+                _db().execute("UPDATE completions SET last_used = ? WHERE key = ?", (now, key))
+                _stats["hits"] += 1
+                return row["text"]
+
+    text = generate()
+    _stats["refreshed" if refresh else "misses"] += 1
+    if text:
+        _store(key, template, model, text, now)
+    return text
+
+
+def _store(key: str, template: str, model: str, text: str, now: float):
+    max_size = int(LLM_CACHE_MAX_MB * 1024 * 1024)
+    size     = len(text.encode())
+    with _lock, _db():
+        db = _db()
+        db.execute(
+            "INSERT OR REPLACE INTO completions (key, template, model, text, size, created_at, last_used) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, template, model, text, size, now, now)
+        )
+        db.execute("DELETE FROM completions WHERE created_at < ?", (now - LLM_CACHE_TTL_DAYS * 86400,))
+        # LRU eviction: drop least-recently-used rows until we're back under the cap
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM completions").fetchone()[0]
+        if total > max_size:
+            for old in db.execute("SELECT key, size FROM completions ORDER BY last_used").fetchall():
+                if total <= max_size:
+                    break
+                db.execute("DELETE FROM completions WHERE key = ?", (old["key"],))
+                total -= old["size"]
+
+
+def clear() -> int:
+    """Drop every cached completion. Returns how many were removed."""
+    with _lock, _db():
+        return _db().execute("DELETE FROM completions").rowcount
+
+
+def cache_stats() -> dict:
+    """Hits / misses / forced refreshes since startup, plus what's on disk."""
+    with _lock:
+        entries, size = _db().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM completions").fetchone()
+    return {**_stats, "entries": entries, "bytes": size}
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["clear"]:
+        print(f"Removed {clear()} cached completion(s).")
+    else:
+        s = cache_stats()
+        print(f"{s['entries']} cached completion(s), {s['bytes'] / 1024:.0f} KB")
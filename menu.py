@@ -8,6 +8,8 @@ import json
 import os
 from datetime import datetime
 
+from config import PROFILE_FILE
+
 
 # ─── Color Helpers ─────────────────────────────────────────────────────────────
 class C:
@@ -86,8 +88,6 @@ def yesno(prompt: str, default: bool = True) -> bool:
 
 
 # ─── Profile Save/Load ─────────────────────────────────────────────────────────
-PROFILE_FILE = "search_profile.json"
-
 def save_profile(filters: dict):
     with open(PROFILE_FILE, "w") as f:
         json.dump(filters, f, indent=2)
@@ -6,65 +6,89 @@ more_sources.py — Extra Job Board Sources
 • Indeed — via scraping (no API needed)
 • GitHub Jobs feed (open source / dev roles)
 • Hacker News "Who is Hiring" thread
+
+Each source has a fetch_*() that returns job records (see job_records.py)
+and a search_*() that renders them as text for the terminal.
 """
 
-import requests
-import json
 import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+import requests
 
-HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0.0.0 Safari/537.36"
-    )
-}
+import http_client
+from fanout import fan_out
+from job_records import make_job, render_jobs
+from resilience import resilient
 
 
 # ─── 1. Wellfound / AngelList (Startup Jobs) ──────────────────────────────────
-def search_wellfound(keywords: str, location: str = "", max_results: int = 15) -> str:
+@resilient("wellfound")
+def fetch_wellfound(keywords: str, location: str = "", max_results: int = 15) -> list:
     """
     Scrape Wellfound (formerly AngelList Talent) for startup jobs.
     These are Y Combinator and venture-backed startups — very early postings.
+    Cards are free text, so title/company are best-effort splits of "A | B | ...".
+    Returns [] when a page loads but has no cards — the usual case, since the listing is
+    rendered with JavaScript (see wellfound_search_url). Raises only when no URL could be
+    fetched (blocked, 5xx, network), so the circuit breaker skips the site while it's down.
     """
-    try:
-        # Wellfound uses a structured URL for searches
-        loc_slug = location.lower().replace(" ", "-").replace(",", "") if location else "remote"
-        role_slug = keywords.lower().replace(" ", "-")
-
-        urls_to_try = [
-            f"https://wellfound.com/role/r/{role_slug}",
-            f"https://wellfound.com/jobs?q={keywords.replace(' ', '+')}&l={location.replace(' ', '+')}",
-        ]
-
-        for url in urls_to_try:
-            try:
-                resp = requests.get(url, headers=HEADERS, timeout=12)
-                if resp.status_code == 200:
-                    soup = BeautifulSoup(resp.text, "html.parser")
-
-                    # Extract job cards
-                    cards = soup.find_all(class_=lambda c: c and "job" in c.lower(), limit=30)
-                    jobs = []
-
-                    for card in cards:
-                        text = card.get_text(separator=" | ", strip=True)
-                        if 30 < len(text) < 500:
-                            jobs.append(text)
-
-                    if jobs:
-                        out = [f"🚀 Wellfound Startup Jobs for '{keywords}':\n"]
-                        for i, j in enumerate(jobs[:max_results], 1):
-                            out.append(f"{i}. {j}")
-                        out.append(f"\n🔗 View more: {url}")
-                        return "\n".join(out)
-            except Exception:
+    role_slug = keywords.lower().replace(" ", "-")
+    urls_to_try = [
+        f"https://wellfound.com/role/r/{role_slug}",
+        f"https://wellfound.com/jobs?q={keywords.replace(' ', '+')}&l={location.replace(' ', '+')}",
+    ]
+
+    from bs4 import BeautifulSoup   # imported on first scrape — it's slow to load
+
+    last_error, loaded = None, False
+    for url in urls_to_try:
+        try:
+            resp = http_client.get(url, timeout=12)
+            if resp.status_code != 200:
+                last_error = requests.HTTPError(f"HTTP {resp.status_code} from {url}", response=resp)
                 continue
+            loaded = True
+            soup = BeautifulSoup(resp.text, "html.parser")
+
+            # Extract job cards
+            cards = soup.find_all(class_=lambda c: c and "job" in c.lower(), limit=30)
+            jobs = []
+            for card in cards:
+                text = card.get_text(separator=" | ", strip=True)
+                if 30 < len(text) < 500:
+                    parts = [p.strip() for p in text.split(" | ")]
+                    jobs.append(make_job(
+                        title=parts[0],
+                        company=parts[1] if len(parts) > 1 else "",
+                        location=location,
+                        url=url,
+                        source="Wellfound",
+                        description=text,
+                    ))
+            if jobs:
+                return jobs[:max_results]
+        except Exception as e:
+            last_error = e
+            continue
+    if loaded:
+        return []
+    raise last_error
+
+
+def wellfound_search_url(keywords: str) -> str:
+    """Wellfound's own search page — what to hand the user when scraping finds nothing."""
+    return f"https://wellfound.com/jobs?q={keywords.replace(' ', '+')}"
+
+
+def search_wellfound(keywords: str, location: str = "", max_results: int = 15) -> str:
+    try:
+        jobs = fetch_wellfound(keywords, location, max_results)
+        if jobs:
+            return render_jobs(jobs, f"🚀 Wellfound Startup Jobs for '{keywords}':",
+                               f"🔗 View more: {jobs[0]['url']}")
 
         # Fallback: return direct search URL
-        search_url = f"https://wellfound.com/jobs?q={keywords.replace(' ', '+')}"
+        search_url = wellfound_search_url(keywords)
         return (
             f"Wellfound search ready. Could not auto-scrape (they use heavy JS).\n"
             f"👉 Open this URL to find startup jobs: {search_url}\n"
@@ -72,167 +96,200 @@ def search_wellfound(keywords: str, location: str = "", max_results: int = 15) -
         )
 
     except Exception as e:
-        return f"Wellfound search error: {str(e)}"
+        search_url = wellfound_search_url(keywords)
+        return f"Wellfound search error: {str(e)}\n👉 Open this URL to find startup jobs: {search_url}"
 
 
 # ─── 2. RemoteOK (Remote-Only Jobs) ──────────────────────────────────────────
-def search_remoteok(keywords: str, max_results: int = 15) -> str:
+@resilient("remoteok")
+def fetch_remoteok(keywords: str, max_results: int = 15) -> list:
     """
     Search RemoteOK.com — remote-only tech jobs, updated frequently.
     They have a public JSON API.
     """
-    try:
-        # RemoteOK has a free public API
-        resp = requests.get(
-            "https://remoteok.com/api",
-            headers={**HEADERS, "Accept": "application/json"},
-            timeout=12
+    # RemoteOK has a free public API
+    resp = http_client.get(
+        "https://remoteok.com/api",
+        headers={"Accept": "application/json"},
+        timeout=12,
+        cache="remoteok",     # one shared feed — every keyword search reuses it
+        limit="remoteok"
+    )
+    resp.raise_for_status()
+    data = resp.json()
+
+    # First item is a legal notice, skip it
+    jobs = [j for j in data if isinstance(j, dict) and j.get("position")]
+
+    # Filter by keywords
+    kw_lower = keywords.lower().split()
+    matched = []
+    for job in jobs:
+        text = f"{job.get('position', '')} {job.get('description', '')} {' '.join(job.get('tags', []))}".lower()
+        if any(kw in text for kw in kw_lower):
+            matched.append(job)
+
+    if not matched:
+        # Return most recent if no keyword match
+        matched = jobs[:max_results]
+
+    return [
+        make_job(
+            title=job.get("position"),
+            company=job.get("company"),
+            location=job.get("location") or "Remote",
+            url=f"https://remoteok.com/remote-jobs/{job.get('id', '')}",
+            posted=job.get("date", ""),
+            source="RemoteOK",
+            tags=job.get("tags", []),
+            raw_id=job.get("id", ""),
+            description=job.get("description", ""),
         )
-        resp.raise_for_status()
-        data = resp.json()
-
-        # First item is a legal notice, skip it
-        jobs = [j for j in data if isinstance(j, dict) and j.get("position")]
-
-        # Filter by keywords
-        kw_lower = keywords.lower().split()
-        matched = []
-        for job in jobs:
-            text = f"{job.get('position', '')} {job.get('description', '')} {' '.join(job.get('tags', []))}".lower()
-            if any(kw in text for kw in kw_lower):
-                matched.append(job)
-
-        if not matched:
-            # Return most recent if no keyword match
-            matched = jobs[:max_results]
-
-        out = [f"🌐 RemoteOK Jobs for '{keywords}' (remote only):\n"]
-        for i, job in enumerate(matched[:max_results], 1):
-            posted = job.get("date", "")[:10] if job.get("date") else "Recently"
-            tags   = ", ".join(job.get("tags", [])[:4])
-            out.append(
-                f"{i}. 📌 {job.get('position', 'N/A')}\n"
-                f"   Company: {job.get('company', 'N/A')}\n"
-                f"   Tags:    {tags}\n"
-                f"   Posted:  {posted}\n"
-                f"   Link:    https://remoteok.com/remote-jobs/{job.get('id', '')}\n"
-            )
+        for job in matched[:max_results]
+    ]
 
-        out.append(f"🔗 Browse more: https://remoteok.com/?q={keywords.replace(' ', '+')}")
-        return "\n".join(out)
+
+def search_remoteok(keywords: str, max_results: int = 15) -> str:
+    try:
+        jobs = fetch_remoteok(keywords, max_results)
+        return render_jobs(jobs, f"🌐 RemoteOK Jobs for '{keywords}' (remote only):",
+                           f"🔗 Browse more: https://remoteok.com/?q={keywords.replace(' ', '+')}")
 
     except Exception as e:
         return f"RemoteOK error: {str(e)}\nBrowse manually: https://remoteok.com"
 
 
 # ─── 3. Indeed (via RSS feed) ─────────────────────────────────────────────────
-def search_indeed(keywords: str, location: str = "", max_results: int = 15) -> str:
+@resilient("indeed")
+def fetch_indeed(keywords: str, location: str = "", max_results: int = 15) -> list:
     """
     Search Indeed via their public RSS feed — no API key needed.
-    Returns freshest postings sorted by date.
+    Returns freshest postings sorted by date. Item titles look like "Role - Company - City".
     """
+    params = {
+        "q":   keywords,
+        "l":   location,
+        "sort": "date",
+        "limit": max_results,
+    }
+    query  = "&".join(f"{k}={v}" for k, v in params.items() if v)
+    rss_url = f"https://www.indeed.com/rss?{query}"
+
+    resp = http_client.get(rss_url, timeout=12, cache="indeed")
+    resp.raise_for_status()
+
+    root = ET.fromstring(resp.content)
+    channel = root.find("channel")
+    items   = channel.findall("item") if channel is not None else []
+
+    jobs = []
+    for item in items[:max_results]:
+        parts = [p.strip() for p in item.findtext("title", "").split(" - ")]
+        desc  = item.findtext("description", "")
+        # Strip HTML from description
+        if desc:
+            from bs4 import BeautifulSoup
+            desc = BeautifulSoup(desc, "html.parser").get_text(separator=" ", strip=True)
+        jobs.append(make_job(
+            title=parts[0],
+            company=parts[1] if len(parts) > 1 else "",
+            location=parts[2] if len(parts) > 2 else location,
+            url=item.findtext("link", ""),
+            posted=_rss_date(item.findtext("pubDate", "")),
+            source="Indeed",
+            raw_id=item.findtext("guid", ""),
+            description=desc,
+        ))
+    return jobs
+
+
+def _rss_date(pub: str) -> str:
+    """RSS pubDate ("Mon, 02 Mar 2026 10:00:00 GMT") → "2026-03-02"."""
+    try:
+        return datetime.strptime(pub[:16], "%a, %d %b %Y").strftime("%Y-%m-%d")
+    except ValueError:
+        return ""
+
+
+def search_indeed(keywords: str, location: str = "", max_results: int = 15) -> str:
     try:
-        params = {
-            "q":   keywords,
-            "l":   location,
-            "sort": "date",
-            "limit": max_results,
-        }
-        query  = "&".join(f"{k}={v}" for k, v in params.items() if v)
-        rss_url = f"https://www.indeed.com/rss?{query}"
-
-        resp = requests.get(rss_url, headers=HEADERS, timeout=12)
-        resp.raise_for_status()
-
-        root = ET.fromstring(resp.content)
-        channel = root.find("channel")
-        items   = channel.findall("item") if channel else []
-
-        if not items:
+        jobs = fetch_indeed(keywords, location, max_results)
+        if not jobs:
             search_url = f"https://www.indeed.com/jobs?q={keywords.replace(' ', '+')}&l={location.replace(' ', '+')}&sort=date"
             return f"Indeed RSS returned no results.\n👉 Try directly: {search_url}"
 
-        out = [f"📋 Indeed Jobs for '{keywords}'" + (f" in '{location}'" if location else "") + ":\n"]
-        for i, item in enumerate(items[:max_results], 1):
-            title   = item.findtext("title", "N/A")
-            link    = item.findtext("link", "")
-            pub     = item.findtext("pubDate", "")[:16] if item.findtext("pubDate") else ""
-            desc    = item.findtext("description", "")
-            # Strip HTML from description
-            if desc:
-                soup = BeautifulSoup(desc, "html.parser")
-                desc = soup.get_text(separator=" ", strip=True)[:150]
-
-            out.append(
-                f"{i}. 📌 {title}\n"
-                f"   Posted: {pub}\n"
-                f"   {gray_plain(desc)}\n"
-                f"   Link:   {link}\n"
-            )
-
         search_url = f"https://www.indeed.com/jobs?q={keywords.replace(' ', '+')}&sort=date"
-        out.append(f"🔗 View all: {search_url}")
-        return "\n".join(out)
+        return render_jobs(jobs, f"📋 Indeed Jobs for '{keywords}'" + (f" in '{location}'" if location else "") + ":",
+                           f"🔗 View all: {search_url}")
 
     except Exception as e:
         search_url = f"https://www.indeed.com/jobs?q={keywords.replace(' ', '+')}&sort=date"
         return f"Indeed RSS error: {str(e)}\n👉 Search directly: {search_url}"
 
-def gray_plain(t): return t  # Plain text version for file output
-
 
 # ─── 4. Hacker News "Who Is Hiring" ──────────────────────────────────────────
-def search_hn_hiring(keywords: str, max_results: int = 15) -> str:
+@resilient("hn")
+def fetch_hn_hiring(keywords: str, max_results: int = 15) -> list:
     """
     Search the Hacker News monthly 'Who Is Hiring?' thread.
     This is where YC founders and startups post jobs directly — very fresh.
-    Uses the official HN Algolia search API.
+    Uses the official HN Algolia search API. Posts follow "Company | Role | Location | ...".
     """
+    # Search HN for "Who is Hiring" posts
+    hn_url = "https://hn.algolia.com/api/v1/search_by_date"
+    # Day-aligned cutoff so the request (and its cache key) is stable within a day
+    since = (datetime.now() - timedelta(days=60)).replace(hour=0, minute=0, second=0, microsecond=0)
+    resp = http_client.get(hn_url, params={
+        "query":       f"who is hiring {keywords}",
+        "tags":        "comment,story",
+        "numericFilters": f"created_at_i>{int(since.timestamp())}",
+        "hitsPerPage": max_results
+    }, timeout=10, cache="hn", limit="hn")
+    resp.raise_for_status()
+
+    data  = resp.json()
+    hits  = data.get("hits", [])
+
+    # Filter to actual job posts
+    job_hits = [
+        h for h in hits
+        if any(kw.lower() in (h.get("comment_text") or h.get("title") or "").lower()
+               for kw in keywords.split())
+        and len(h.get("comment_text") or "") > 100
+    ]
+
+    from bs4 import BeautifulSoup
+
+    jobs = []
+    for hit in job_hits[:max_results]:
+        # Clean HTML
+        text  = BeautifulSoup(hit.get("comment_text") or hit.get("title") or "", "html.parser")
+        text  = text.get_text(separator="\n", strip=True)
+        parts = [p.strip() for p in text.split("\n", 1)[0].split("|")]
+        jobs.append(make_job(
+            title=parts[1] if len(parts) > 1 else parts[0][:80],
+            company=parts[0] if len(parts) > 1 else "",
+            location=parts[2] if len(parts) > 2 else "",
+            url=f"https://news.ycombinator.com/item?id={hit.get('objectID', '')}",
+            posted=hit.get("created_at", ""),
+            source="Hacker News",
+            raw_id=hit.get("objectID", ""),
+            description=text,
+        ))
+    return jobs
+
+
+def search_hn_hiring(keywords: str, max_results: int = 15) -> str:
     try:
-        # Search HN for "Who is Hiring" posts
-        hn_url = "https://hn.algolia.com/api/v1/search_by_date"
-        resp = requests.get(hn_url, params={
-            "query":       f"who is hiring {keywords}",
-            "tags":        "comment,story",
-            "numericFilters": f"created_at_i>{int((datetime.now() - timedelta(days=60)).timestamp())}",
-            "hitsPerPage": max_results
-        }, timeout=10)
-
-        data  = resp.json()
-        hits  = data.get("hits", [])
-
-        # Filter to actual job posts
-        job_hits = [
-            h for h in hits
-            if any(kw.lower() in (h.get("comment_text") or h.get("title") or "").lower()
-                   for kw in keywords.split())
-            and len(h.get("comment_text") or "") > 100
-        ]
-
-        if not job_hits:
+        jobs = fetch_hn_hiring(keywords, max_results)
+        if not jobs:
             return (
                 f"No recent HN hiring posts found for '{keywords}'.\n"
                 f"👉 Check manually: https://news.ycombinator.com/jobs\n"
                 f"👉 Or search: https://hn.algolia.com/?q={keywords.replace(' ', '+')}&type=job"
             )
-
-        out = [f"🟠 Hacker News Jobs for '{keywords}':\n"]
-        for i, hit in enumerate(job_hits[:max_results], 1):
-            text = (hit.get("comment_text") or hit.get("title") or "")[:300]
-            # Clean HTML
-            soup = BeautifulSoup(text, "html.parser")
-            text = soup.get_text(separator=" ", strip=True)
-
-            created = hit.get("created_at", "")[:10]
-            hn_link  = f"https://news.ycombinator.com/item?id={hit.get('objectID', '')}"
-
-            out.append(
-                f"{i}. {text[:200]}...\n"
-                f"   Posted: {created}  |  Link: {hn_link}\n"
-            )
-
-        out.append(f"\n🔗 Browse HN jobs: https://news.ycombinator.com/jobs")
-        return "\n".join(out)
+        return render_jobs(jobs, f"🟠 Hacker News Jobs for '{keywords}':",
+                           "🔗 Browse HN jobs: https://news.ycombinator.com/jobs")
 
     except Exception as e:
         return (
@@ -257,29 +314,49 @@ def search_glassdoor(keywords: str, location: str = "") -> str:
 
 
 # ─── All Sources Combined ─────────────────────────────────────────────────────
+# Each source gets its own deadline; Wellfound may try two URLs so it gets longer
+SOURCE_TIMEOUT     = 15
+SOURCE_TIMEOUTS    = {"Wellfound Startups": 26}
+ALL_SOURCES_BUDGET = 30   # hard cap on the whole multi-source search
+
 def search_all_sources(keywords: str, location: str = "", max_results: int = 10) -> str:
-    """Run all sources and combine results."""
-    results = []
+    """Run all sources concurrently and combine results (wall time ≈ slowest source)."""
+    sources = {
+        "RemoteOK":           lambda: search_remoteok(keywords, max_results),
+        "Indeed":             lambda: search_indeed(keywords, location, max_results),
+        "Wellfound Startups": lambda: search_wellfound(keywords, location, max_results),
+        "Hacker News":        lambda: search_hn_hiring(keywords, max_results),
+        "Glassdoor (link)":   lambda: search_glassdoor(keywords, location),
+    }
+
+    # Collect as they arrive, then print in the usual order
+    done = {}
+    for r in fan_out(sources, timeout=SOURCE_TIMEOUT, timeouts=SOURCE_TIMEOUTS,
+                     total_timeout=ALL_SOURCES_BUDGET):
+        done[r["name"]] = r
 
+    results = []
     results.append("=" * 55)
     results.append(f"🌐 MULTI-SOURCE JOB SEARCH: '{keywords}'")
     results.append("=" * 55 + "\n")
 
-    results.append("── RemoteOK ──────────────────────────────────────────")
-    results.append(search_remoteok(keywords, max_results))
-
-    results.append("\n── Indeed ────────────────────────────────────────────")
-    results.append(search_indeed(keywords, location, max_results))
-
-    results.append("\n── Wellfound Startups ────────────────────────────────")
-    results.append(search_wellfound(keywords, location, max_results))
-
-    results.append("\n── Hacker News ───────────────────────────────────────")
-    results.append(search_hn_hiring(keywords, max_results))
-
-    results.append("\n── Glassdoor (link) ──────────────────────────────────")
-    results.append(search_glassdoor(keywords, location))
-
+    for name in sources:
+        r = done[name]
+        results.append(f"\n── {name} ".ljust(55, "─"))
+        if r["status"] == "ok":
+            results.append(r["result"])
+        elif r["status"] == "timeout":
+            results.append(f"⏱  {name} timed out ({r['error']}) — skipped this run.")
+        else:
+            results.append(f"{name} error: {r['error']}")
+
+    timings = []
+    for name in sources:
+        r = done[name]
+        flag = "" if r["status"] == "ok" else f" ({r['status']})"
+        timings.append(f"{name} {r['elapsed']:.1f}s{flag}")
+    timings = " | ".join(timings)
+    results.append(f"\n⏲  Source timings: {timings}")
     return "\n".join(results)
 
 
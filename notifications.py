@@ -273,17 +273,17 @@ def notify_followup_due(jobs: list) -> bool:
 
 
 # ─── 3. Weekly Digest ─────────────────────────────────────────────────────────
-def notify_weekly_digest(jobs: list) -> bool:
-    """Send a weekly summary of job search progress."""
-    if not jobs:
+def notify_weekly_digest(stats: dict, recent: list) -> bool:
+    """
+    Send a weekly summary of job search progress.
+    stats  = JobStore.stats("status"); recent = a few jobs saved this month, newest first.
+    """
+    if not stats.get("total"):
         return False
 
-    counts = {}
-    for job in jobs:
-        s = job.get("status", "Saved")
-        counts[s] = counts.get(s, 0) + 1
+    counts = stats["status"]
 
-    total       = len(jobs)
+    total       = stats["total"]
     applied     = counts.get("Applied", 0)
     interviews  = counts.get("Interview", 0)
     offers      = counts.get("Offer", 0)
@@ -295,10 +295,6 @@ def notify_weekly_digest(jobs: list) -> bool:
 
     subject = f"📊 Weekly Job Search Digest — {applied} Applied, {interviews} Interviews"
 
-    # Recent activity (last 7 days)
-    recent = [j for j in jobs if j.get("saved_at", "")[:10] >= 
-              (datetime.now().strftime("%Y-%m-%d")[:8] + "01")][:5]
-
     recent_html = "".join([
         f'<div style="padding:8px 0; border-bottom:1px solid #f1f5f9; font-size:13px;">'
         f'<strong>{j.get("title")}</strong> at {j.get("company")} '
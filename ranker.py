@@ -0,0 +1,186 @@
+"""
+ranker.py — Local Relevance Ranker (no LLM, no network)
+========================================================
+• BM25 over each posting's title, tags and description, with your resume
+  (my_resume.txt) and search profile skills / roles (search_profile.json) as the query
+• Vectorized with NumPy: postings become a sparse (row, term, tf) triple list
+  and one bincount adds up the scores — a crawl's worth of postings in tens of milliseconds
+• Used to put the best postings first before anything goes to the LLM, and as a
+  relevance bonus in the ingest ranking
+
+Usage:
+    ranker = get_ranker()                 # None without a resume / profile or NumPy
+    best   = top_k(records, 10)           # records, best first (unchanged if no ranker)
+
+Run:  python ranker.py "python developer"   — rank a live Adzuna search against your resume
+"""
+
+import json
+import logging
+import math
+import os
+import sys
+import threading
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:     # optional — without it, callers keep their own order
+    np = None
+
+from config import RESUME_FILE, PROFILE_FILE, RANKER_TOP_K
+
+log = logging.getLogger("Ranker")
+
+# BM25 parameters — the usual defaults
+K1 = 1.2
+B  = 0.75
+
+# How much a word counts by field (a title word counts as three description words)
+TITLE_WEIGHT = 3
+TAGS_WEIGHT  = 2
+DESC_CHARS   = 1500     # only the opening of a description is read — it carries most of the signal
+
+# Query term weights by where the term came from
+SKILL_WEIGHT = 3.0
+ROLE_WEIGHT  = 2.0
+
+# Anything but letters, digits, + and # separates words ("c++", "c#" survive)
+_SEPARATORS = str.maketrans({chr(c): " " for c in range(128) if not (chr(c).isalnum() or chr(c) in "+#")})
+_STOPWORDS = frozenset("""
+a an and are as at be been but by can for from has have i in is it its my of on or our that the
+their this to was we were will with you your work working team years year experience using used
+""".split())
+
+
+def _words(text: str) -> list:
+    return (text or "").lower().translate(_SEPARATORS).split()
+
+
+def tokenize(text: str) -> list:
+    return [w for w in _words(text) if w not in _STOPWORDS and len(w) > 1]
+
+
+def _term_counts(rec: dict) -> tuple:
+    """(Counter of raw words with field weights applied, document length)."""
+    title = _words(rec.get("title"))
+    tags  = _words(" ".join(rec.get("tags") or []))
+    desc  = _words((rec.get("description") or "")[:DESC_CHARS])
+    counts = Counter(desc)
+    for w in title:
+        counts[w] += TITLE_WEIGHT
+    for w in tags:
+        counts[w] += TAGS_WEIGHT
+    return counts, TITLE_WEIGHT * len(title) + TAGS_WEIGHT * len(tags) + len(desc)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# RANKER
+# ═══════════════════════════════════════════════════════════════════════════════
+class Ranker:
+    """BM25 scorer for one fixed query ({term: weight})."""
+
+    def __init__(self, query: dict):
+        self.terms   = list(query)
+        self.index   = {t: i for i, t in enumerate(self.terms)}
+        self.weights = np.array([query[t] for t in self.terms], dtype=np.float64)
+
+    @classmethod
+    def from_text(cls, resume: str = "", skills: list = (), roles: list = ()) -> "Ranker":
+        # Sub-linear resume term frequency, so a word repeated ten times doesn't drown the rest
+        query = {t: 1 + math.log(n) for t, n in Counter(tokenize(resume)).items()}
+        for phrase, weight in [(s, SKILL_WEIGHT) for s in skills] + [(r, ROLE_WEIGHT) for r in roles]:
+            for t in tokenize(phrase):
+                query[t] = max(query.get(t, 0), weight)
+        return cls(query)
+
+    def scores(self, records: list) -> "np.ndarray":
+        """BM25 score per record, in input order."""
+        n = len(records)
+        if not n or not self.terms:
+            return np.zeros(n)
+
+        rows, cols, freqs, lengths = [], [], [], np.empty(n)
+        index = self.index
+        for i, rec in enumerate(records):
+            counts, lengths[i] = _term_counts(rec)
+            for t in counts.keys() & index.keys():      # set intersection in C, not a token loop
+                rows.append(i)
+                cols.append(index[t])
+                freqs.append(counts[t])
+        if not cols:
+            return np.zeros(n)
+
+        r, c, tf = np.array(rows), np.array(cols), np.array(freqs, dtype=np.float64)
+        df  = np.bincount(c, minlength=len(self.terms))
+        idf = np.log1p((n - df + 0.5) / (df + 0.5))
+        norm = K1 * (1 - B + B * lengths[r] / max(lengths.mean(), 1))
+        contrib = self.weights[c] * idf[c] * tf * (K1 + 1) / (tf + norm)
+        return np.bincount(r, weights=contrib, minlength=n)
+
+    def rank(self, records: list) -> list:
+        """(score, record) pairs, best first."""
+        s = self.scores(records)
+        return [(float(s[i]), records[i]) for i in np.argsort(-s, kind="stable")]
+
+
+# ─── Singleton ────────────────────────────────────────────────────────────────
+_ranker      = None
+_ranker_key  = None
+_ranker_lock = threading.Lock()
+
+def _mtime(path: str) -> float:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0.0
+
+
+def get_ranker() -> Ranker | None:
+    """
+    Ranker for the current resume + search profile, rebuilt when either file changes.
+    None when NumPy isn't installed or there's nothing to rank against.
+    """
+    global _ranker, _ranker_key
+    if np is None:
+        return None
+    key = (_mtime(RESUME_FILE), _mtime(PROFILE_FILE))
+    with _ranker_lock:
+        if key != _ranker_key:
+            resume, profile = "", {}
+            if key[0]:
+                with open(RESUME_FILE, "r") as f:
+                    resume = f.read()
+            if key[1]:
+                try:
+                    with open(PROFILE_FILE, "r") as f:
+                        profile = json.load(f)
+                except (OSError, json.JSONDecodeError) as e:
+                    log.warning(f"Ignoring {PROFILE_FILE}: {e}")
+            ranker = Ranker.from_text(resume, profile.get("skills") or [], profile.get("job_roles") or [])
+            _ranker, _ranker_key = (ranker if ranker.terms else None), key
+        return _ranker
+
+
+def top_k(records: list, k: int = RANKER_TOP_K) -> list:
+    """The k most relevant records, best first — or `records` untouched if there's no ranker."""
+    ranker = get_ranker()
+    if ranker is None or not records:
+        return records
+    return [rec for _, rec in ranker.rank(records)[:k]]
+
+
+if __name__ == "__main__":
+    import time
+    from tools import fetch_job_boards
+
+    ranker = get_ranker()
+    if ranker is None:
+        print(f"Nothing to rank against — add {RESUME_FILE} or {PROFILE_FILE} (and pip install numpy).")
+        sys.exit(1)
+    records = fetch_job_boards(sys.argv[1] if len(sys.argv) > 1 else "software engineer")
+    start   = time.perf_counter()
+    ranked  = ranker.rank(records)
+    print(f"Ranked {len(records)} postings in {(time.perf_counter() - start) * 1000:.1f} ms\n")
+    for score, rec in ranked[:RANKER_TOP_K]:
+        print(f"{score:6.2f}  {rec['title']} at {rec['company']}")
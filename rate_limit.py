@@ -0,0 +1,196 @@
+"""
+rate_limit.py — Shared Token-Bucket Rate Limiter
+=================================================
+One limiter for every outbound provider (Groq, Gemini, Adzuna, Google Maps, RemoteOK, HN):
+
+  • Per-provider token buckets, configured in config.RATE_LIMITS as [(requests, per_seconds), ...]
+  • Callers reserve a token and sleep just long enough — concurrent callers queue up
+    behind each other instead of bursting
+  • Retry-After from a 429/503 blocks the provider until the server says so
+  • Bucket state is saved to rate_limits.json, so back-to-back cron runs
+    (github_runner.py) don't each start with a full quota
+
+Usage:
+    from rate_limit import get_limiter
+    get_limiter().acquire("adzuna")                      # waits if needed
+    get_limiter().penalize("groq", retry_after(resp.headers))
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from config import RATE_LIMITS, RATE_LIMIT_FILE, RATE_LIMIT_MAX_WAIT
+
+SAVE_EVERY = 5      # seconds between state writes (plus one at exit)
+
+
+class RateLimited(RuntimeError):
+    """Raised when a token isn't available within the caller's max_wait."""
+
+    def __init__(self, provider: str, wait: float):
+        super().__init__(f"{provider} rate limit — next slot in {wait:.0f}s")
+        self.provider = provider
+        self.wait     = wait
+
+
+def retry_after(headers) -> float | None:
+    """Seconds from a Retry-After header (delta-seconds or HTTP date), None if absent."""
+    value = (headers or {}).get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """`capacity` requests per `period` seconds. Tokens may go negative — that's the queue."""
+
+    def __init__(self, capacity: int, period: float, tokens: float = None, stamp: float = None):
+        self.capacity = capacity
+        self.rate     = capacity / period
+        self.tokens   = capacity if tokens is None else tokens
+        self.stamp    = stamp or time.time()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.stamp) * self.rate)
+        self.stamp  = now
+
+    def wait_time(self, now: float) -> float:
+        self._refill(now)
+        return max(1 - self.tokens, 0) / self.rate
+
+    def take(self, now: float):
+        self._refill(now)
+        self.tokens -= 1
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# LIMITER
+# ═══════════════════════════════════════════════════════════════════════════════
+class RateLimiter:
+    """Token buckets for every provider in `limits`, persisted to `path`."""
+
+    def __init__(self, limits: dict = RATE_LIMITS, path: str = RATE_LIMIT_FILE):
+        self.path    = path
+        self.lock    = threading.Lock()
+        self.buckets = {name: [TokenBucket(c, p) for c, p in specs] for name, specs in limits.items()}
+        self.blocked = {}       # provider -> wall time it's blocked until (Retry-After)
+        self._saved  = 0.0
+        self._load()
+
+    def acquire(self, provider: str, max_wait: float = None) -> float:
+        """
+        Take one token for `provider`, sleeping until it's available.
+        Raises RateLimited instead if that would take longer than `max_wait` seconds.
+        Returns the seconds waited. Providers without configured limits return at once.
+        """
+        if provider not in self.buckets:
+            return 0.0
+        with self.lock:
+            now  = time.time()
+            wait = max(self.blocked.get(provider, 0) - now, 0)
+            for bucket in self.buckets[provider]:
+                wait = max(wait, bucket.wait_time(now))
+            if max_wait is not None and wait > max_wait:
+                raise RateLimited(provider, wait)
+            for bucket in self.buckets[provider]:
+                bucket.take(now)
+            self._save_if_due(now)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def penalize(self, provider: str, seconds: float | None):
+        """The server said to back off (Retry-After) — block `provider` for `seconds`."""
+        if not seconds:
+            return
+        with self.lock:
+            now = time.time()
+            self.blocked[provider] = max(self.blocked.get(provider, 0), now + seconds)
+            self._save_if_due(now, force=True)
+
+    def status(self) -> dict:
+        """{provider: seconds until the next request may go out}"""
+        with self.lock:
+            now = time.time()
+            return {
+                name: round(max([self.blocked.get(name, 0) - now] + [b.wait_time(now) for b in buckets]), 1)
+                for name, buckets in self.buckets.items()
+            }
+
+    # ── Persistence ───────────────────────────────────────────
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r") as f:
+                state = json.load(f)
+        except Exception:
+            return
+        for name, saved in state.items():
+            buckets = self.buckets.get(name)
+            if not buckets or len(saved.get("buckets", [])) != len(buckets):
+                continue    # limits changed since — start fresh
+            for bucket, (tokens, stamp) in zip(buckets, saved["buckets"]):
+                bucket.tokens, bucket.stamp = min(tokens, bucket.capacity), stamp
+            self.blocked[name] = saved.get("blocked_until", 0)
+
+    def _save_if_due(self, now: float, force: bool = False):
+        if force or now - self._saved >= SAVE_EVERY:
+            self.save()
+
+    def save(self):
+        state = {
+            name: {
+                "buckets":       [[round(b.tokens, 3), b.stamp] for b in buckets],
+                "blocked_until": self.blocked.get(name, 0),
+            }
+            for name, buckets in self.buckets.items()
+        }
+        try:
+            tmp = self.path + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump(state, f, indent=1)
+            os.replace(tmp, self.path)
+            self._saved = time.time()
+        except OSError:
+            pass    # read-only disk — limits still hold for this process
+
+
+# ─── Singleton ────────────────────────────────────────────────────────────────
+_limiter      = None
+_limiter_lock = threading.Lock()
+
+def get_limiter() -> RateLimiter:
+    """Get or load the shared limiter (state is saved again at exit)."""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = RateLimiter()
+                atexit.register(lambda: _limiter.save())
+    return _limiter
+
+
+def acquire(provider: str, max_wait: float = RATE_LIMIT_MAX_WAIT) -> float:
+    """Shortcut for get_limiter().acquire(provider, max_wait)."""
+    return get_limiter().acquire(provider, max_wait)
+
+
+if __name__ == "__main__":
+    for name, wait in get_limiter().status().items():
+        print(f"{name:<10} {'ready' if wait <= 0 else f'next slot in {wait}s'}")
@@ -7,13 +7,13 @@ reminders.py — Follow-up Reminder System
 • Tracks whether follow-up was sent
 """
 
-import json
 import os
 from datetime import datetime, timedelta
-import anthropic
+from job_store import get_store
+from llm_cache import cached_completion
 
-client = anthropic.Anthropic()
-SAVED_JOBS_FILE = "saved_jobs.json"
+MODEL  = "claude-opus-4-6"
+FOLLOWUP_PROMPT_VERSION = 1     # bump when the prompt below changes
 
 class C:
     BOLD="\033[1m"; BLUE="\033[94m"; CYAN="\033[96m"; GREEN="\033[92m"
@@ -35,16 +35,7 @@ def header(sub=""):
 
 
 def load_jobs() -> list:
-    if not os.path.exists(SAVED_JOBS_FILE):
-        return []
-    with open(SAVED_JOBS_FILE, "r") as f:
-        return json.load(f)
-
-def save_jobs(jobs: list):
-    for i, j in enumerate(jobs):
-        j["id"] = i + 1
-    with open(SAVED_JOBS_FILE, "w") as f:
-        json.dump(jobs, f, indent=2)
+    return get_store().all_jobs()
 
 
 # ─── Check Who Needs Follow-Up ─────────────────────────────────────────────────
@@ -78,8 +69,8 @@ def get_followup_due(jobs: list, days: int = 7) -> list:
 
 
 # ─── Generate Follow-Up Email ──────────────────────────────────────────────────
-def generate_followup_email(job: dict) -> str:
-    """Use Claude to write a polite follow-up email."""
+def generate_followup_email(job: dict, refresh: bool = False) -> str:
+    """Use Claude to write a polite follow-up email (cached per job; refresh=True writes a new one)."""
     prompt = f"""Write a short, polite follow-up email for a job application.
 
 Job: {job['title']}
@@ -98,12 +89,18 @@ Rules:
 
 Write the email body only (no subject line)."""
 
-    response = client.messages.create(
-        model="claude-opus-4-6",
-        max_tokens=512,
-        messages=[{"role": "user", "content": prompt}]
-    )
-    return response.content[0].text.strip()
+    def generate():
+        from ai_tools import get_anthropic
+        response = get_anthropic().messages.create(
+            model=MODEL,
+            max_tokens=512,
+            messages=[{"role": "user", "content": prompt}]
+        )
+        return response.content[0].text.strip()
+
+    options = {"title": job["title"], "company": job["company"], "days": job.get("_days_since", 7)}
+    return cached_completion("followup_email", FOLLOWUP_PROMPT_VERSION, MODEL, generate,
+                             options=options, refresh=refresh)
 
 
 # ─── Reminders Menu ────────────────────────────────────────────────────────────
@@ -156,18 +153,18 @@ def reminders_menu():
         for job in due:
             # Snooze by pretending applied 4 days ago
             job["applied_at"] = (datetime.now() - timedelta(days=4)).isoformat()
-        save_jobs(jobs)
+            get_store().update_job(job["id"], {"applied_at": job["applied_at"]})
         print(green("\n  ✅ Snoozed. We'll remind you again in 3 days."))
         pause()
 
 
-def _show_followup_for_job(job: dict, jobs: list):
+def _show_followup_for_job(job: dict, jobs: list, refresh: bool = False):
     """Show follow-up email for one job and handle actions."""
     clear()
     header(f"Follow-Up — {job['title']} @ {job['company']}")
 
     print(f"  {gray('🤖 Writing follow-up email...')}\n")
-    email = generate_followup_email(job)
+    email = generate_followup_email(job, refresh)
 
     print(f"  {bold('📧 Suggested Follow-Up Email:')}\n")
     print(f"  {bold('Subject:')} Following up on {job['title']} Application\n")
@@ -183,17 +180,14 @@ def _show_followup_for_job(job: dict, jobs: list):
     action = input(f"  {bold('→')} Action: ").strip().upper()
 
     if action == "M":
-        for i, j in enumerate(jobs):
-            if j["id"] == job["id"]:
-                jobs[i]["followup_sent"] = True
-                jobs[i]["followup_at"]   = datetime.now().isoformat()
-                break
-        save_jobs(jobs)
+        job["followup_sent"] = True
+        job["followup_at"]   = datetime.now().isoformat()
+        get_store().update_job(job["id"], {"followup_sent": True, "followup_at": job["followup_at"]})
         print(green("  ✅ Marked as followed up."))
         pause()
 
     elif action == "R":
-        _show_followup_for_job(job, jobs)
+        _show_followup_for_job(job, jobs, refresh=True)
 
 
 # ─── Daily Check (for monitor mode) ───────────────────────────────────────────
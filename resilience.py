@@ -0,0 +1,195 @@
+"""
+resilience.py — Retries and Circuit Breakers for Job Sources
+=============================================================
+• Bounded retries with exponential backoff and full jitter — only for errors worth
+  retrying (connection resets, 5xx, 429), and never past a per-call time budget
+• One circuit breaker per source: after BREAKER_THRESHOLD failures in a row the source
+  is skipped outright for a cool-down window (doubling each time it fails again),
+  then a single trial call decides whether it's back
+• Breaker state is saved to source_health.json, so cron runs skip dead sources too
+
+Usage:
+    @resilient("indeed")
+    def fetch_indeed(...): ...
+
+Run:  python resilience.py   — show every breaker
+"""
+
+import functools
+import json
+import os
+import random
+import threading
+import time
+
+import requests
+
+from config import (
+    SOURCE_RETRIES, RETRY_BASE_DELAY, RETRY_MAX_DELAY, RETRY_BUDGET,
+    BREAKER_THRESHOLD, BREAKER_COOLDOWN, BREAKER_MAX_COOLDOWN, BREAKER_FILE,
+)
+from rate_limit import RateLimited
+
+
+class CircuitOpen(RuntimeError):
+    """Raised instead of calling a source whose breaker is open."""
+
+
+def is_transient(err: Exception) -> bool:
+    """Worth another try: dropped connections and 5xx / 429 answers. Timeouts already cost enough."""
+    if isinstance(err, requests.Timeout):
+        return False
+    if isinstance(err, requests.ConnectionError):
+        return True
+    if isinstance(err, requests.HTTPError) and err.response is not None:
+        return err.response.status_code >= 500 or err.response.status_code == 429
+    return False
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full jitter: uniform in [0, min(max, base * 2^attempt)]."""
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+
+
+def retry_call(fn, *args, attempts: int = SOURCE_RETRIES, budget: float = RETRY_BUDGET, **kwargs):
+    """Call fn, retrying transient errors up to `attempts` times within `budget` seconds."""
+    start = time.monotonic()
+    for attempt in range(attempts):
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            if attempt == attempts - 1 or not is_transient(e):
+                raise
+            delay = backoff_delay(attempt)
+            if time.monotonic() - start + delay > budget:
+                raise
+            time.sleep(delay)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CIRCUIT BREAKERS
+# ═══════════════════════════════════════════════════════════════════════════════
+class Breakers:
+    """
+    Per-source breaker state:
+    {source: {"failures": int, "open_until": wall time, "cooldown": seconds, "last_error": str}}
+    """
+
+    def __init__(self, path: str = BREAKER_FILE):
+        self.path   = path
+        self.lock   = threading.Lock()
+        self.state  = {}
+        self.trials = set()     # sources with a half-open trial call in flight
+        self._load()
+
+    def _entry(self, source: str) -> dict:
+        return self.state.setdefault(source, {"failures": 0, "open_until": 0, "cooldown": 0, "last_error": ""})
+
+    def before_call(self, source: str):
+        """Raise CircuitOpen if `source` should be skipped right now."""
+        with self.lock:
+            s   = self._entry(source)
+            now = time.time()
+            if s["open_until"] > now:
+                mins = (s["open_until"] - now) / 60
+                raise CircuitOpen(f"{source} skipped — failed {s['failures']}x in a row "
+                                  f"({s['last_error'][:80]}); next try in {mins:.0f} min")
+            if s["open_until"] and source in self.trials:
+                raise CircuitOpen(f"{source} skipped — trial call in progress")
+            if s["open_until"]:
+                self.trials.add(source)     # half-open: let this one call through
+
+    def record_success(self, source: str):
+        with self.lock:
+            s = self._entry(source)
+            self.trials.discard(source)
+            changed = s["failures"] or s["open_until"]
+            s.update(failures=0, open_until=0, cooldown=0, last_error="")
+            if changed:
+                self.save()
+
+    def record_failure(self, source: str, err: Exception):
+        with self.lock:
+            s = self._entry(source)
+            was_trial = source in self.trials
+            self.trials.discard(source)
+            s["failures"]  += 1
+            s["last_error"] = str(err)
+            if was_trial or s["failures"] >= BREAKER_THRESHOLD:
+                s["cooldown"]   = min(s["cooldown"] * 2 or BREAKER_COOLDOWN, BREAKER_MAX_COOLDOWN)
+                s["open_until"] = time.time() + s["cooldown"]
+            # Saved on every failure, not just on a trip — a cron run calls each source once,
+            # so the count only reaches the threshold if it carries over between processes
+            self.save()
+
+    def release(self, source: str):
+        """A call ended without telling us anything (e.g. rate limited) — free the trial slot."""
+        with self.lock:
+            self.trials.discard(source)
+
+    # ── Persistence ───────────────────────────────────────────
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r") as f:
+                self.state = json.load(f)
+        except Exception:
+            self.state = {}
+
+    def save(self):
+        try:
+            tmp = self.path + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump(self.state, f, indent=1)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+
+# ─── Singleton ────────────────────────────────────────────────────────────────
+_breakers      = None
+_breakers_lock = threading.Lock()
+
+def get_breakers() -> Breakers:
+    """Get or load the shared breaker state."""
+    global _breakers
+    if _breakers is None:
+        with _breakers_lock:
+            if _breakers is None:
+                _breakers = Breakers()
+    return _breakers
+
+
+def resilient(source: str):
+    """
+    Decorator for a source fetch: skip it while its breaker is open, otherwise
+    call it with retries and record the outcome.
+    """
+    def wrap(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            breakers = get_breakers()
+            breakers.before_call(source)
+            try:
+                result = retry_call(fn, *args, **kwargs)
+            except RateLimited:
+                breakers.release(source)    # our own quota, not the source's fault
+                raise
+            except Exception as e:
+                breakers.record_failure(source, e)
+                raise
+            breakers.record_success(source)
+            return result
+        return wrapper
+    return wrap
+
+
+if __name__ == "__main__":
+    now = time.time()
+    state = get_breakers().state
+    if not state:
+        print("No source failures recorded.")
+    for name, s in sorted(state.items()):
+        status = f"OPEN for {(s['open_until'] - now) / 60:.0f} min" if s["open_until"] > now else "closed"
+        print(f"{name:<10} {status:<18} failures={s['failures']}  {s['last_error'][:60]}")
@@ -0,0 +1,137 @@
+"""
+search_index.py — In-Memory Inverted Index for Saved Jobs
+==========================================================
+• token → set of job ids, per field (title, company, location, notes, status, source)
+• Multi-term AND queries, every term matched as a word prefix ("stri" finds Stripe)
+• Field-scoped terms: company:stripe status:applied title:"data engineer"
+• Updated row by row as jobs are saved, edited or deleted — never rescans the table
+• Query cost depends on the matching posting lists, not the number of jobs
+
+Usage:
+    index = SearchIndex()
+    index.add(1, {"title": "Backend Engineer", "company": "Stripe", "status": "Applied"})
+    index.search("company:stri eng")    # → {1}
+"""
+
+import functools
+import re
+import shlex
+from bisect import bisect_left, insort
+
+# Searchable fields; bare terms look in the first four (indexed together under ANY)
+FIELDS         = ("title", "company", "location", "notes", "status", "source")
+DEFAULT_FIELDS = ("title", "company", "location", "notes")
+ANY            = "*"
+FIELD_ALIASES  = {"role": "title", "job": "title", "loc": "location", "note": "notes", "src": "source"}
+
+_WORD = re.compile(r"[a-z0-9+#]+")
+
+
+@functools.lru_cache(maxsize=1 << 16)   # status, source, location and company values repeat a lot
+def tokens(text: str) -> frozenset:
+    return frozenset(_WORD.findall(text.lower()))
+
+
+def _value(job, name: str) -> str:
+    try:
+        return job[name] or ""
+    except (KeyError, IndexError):
+        return ""
+
+
+def parse_query(query: str) -> list:
+    """'company:stripe data eng' → [("company", "stripe"), (None, "data"), (None, "eng")]"""
+    try:
+        parts = shlex.split(query or "")
+    except ValueError:          # unbalanced quote — treat it as text
+        parts = (query or "").replace('"', " ").split()
+    terms = []
+    for part in parts:
+        field, sep, value = part.partition(":")
+        field = FIELD_ALIASES.get(field.lower(), field.lower())
+        if sep and field in FIELDS:
+            terms.extend((field, t) for t in _WORD.findall(value.lower()))
+        else:
+            terms.extend((None, t) for t in _WORD.findall(part.lower()))
+    return terms
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# INDEX
+# ═══════════════════════════════════════════════════════════════════════════════
+class SearchIndex:
+    """Posting lists per field, plus a sorted vocabulary per field for prefix lookups."""
+
+    def __init__(self, rows=()):
+        self.postings = {f: {} for f in FIELDS + (ANY,)}    # field -> token -> {job ids}
+        self.vocab    = {f: [] for f in FIELDS + (ANY,)}    # field -> sorted tokens
+        self.docs     = {}                                  # job id -> {field: tokens}, to undo an add
+        # Bulk load: fill the posting lists first, sort each vocabulary once at the end
+        for job_id, job in rows:
+            self._post(job_id, job, sort=False)
+        for field, postings in self.postings.items():
+            self.vocab[field] = sorted(postings)
+
+    def add(self, job_id: int, job):
+        """Index a job (re-indexes it if it's already there)."""
+        if job_id in self.docs:
+            self.remove(job_id)
+        self._post(job_id, job, sort=True)
+
+    def _post(self, job_id: int, job, sort: bool):
+        doc = {f: tokens(_value(job, f)) for f in FIELDS}
+        doc[ANY] = doc["title"].union(*(doc[f] for f in DEFAULT_FIELDS[1:]))
+        for field, toks in doc.items():
+            postings = self.postings[field]
+            for t in toks:
+                ids = postings.get(t)
+                if ids is None:
+                    postings[t] = ids = set()
+                    if sort:
+                        insort(self.vocab[field], t)
+                ids.add(job_id)
+        self.docs[job_id] = doc
+
+    def remove(self, job_id: int):
+        doc = self.docs.pop(job_id, None)
+        if doc is None:
+            return
+        for field, toks in doc.items():
+            postings = self.postings[field]
+            for t in toks:
+                ids = postings.get(t)
+                if ids is None:
+                    continue
+                ids.discard(job_id)
+                if not ids:
+                    del postings[t]
+                    vocab = self.vocab[field]
+                    del vocab[bisect_left(vocab, t)]
+
+    def _matches(self, field: str, prefix: str) -> set:
+        """Ids with a token in `field` starting with `prefix` (don't modify — may be a posting list)."""
+        postings = self.postings[field]
+        vocab    = self.vocab[field]
+        i = j    = bisect_left(vocab, prefix)
+        while j < len(vocab) and vocab[j].startswith(prefix):
+            j += 1
+        if j - i == 1:
+            return postings[vocab[i]]   # one token — use its list as is, no copy
+        return set().union(*(postings[t] for t in vocab[i:j]))
+
+    def search(self, query: str) -> set | None:
+        """Ids matching every term of `query`. None for an empty query (no filter)."""
+        terms = parse_query(query)
+        if not terms:
+            return None
+        sets = []
+        for field, prefix in terms:
+            sets.append(self._matches(field or ANY, prefix))
+            if not sets[-1]:
+                return set()
+        # Intersect smallest first so the work is bounded by the rarest term
+        sets.sort(key=len)
+        return sets[0].intersection(*sets[1:])
+
+    def __len__(self):
+        return len(self.docs)
@@ -0,0 +1,168 @@
+"""
+seen_index.py — Persistent "Already Alerted" Index
+===================================================
+Remembers which jobs we've already alerted on, so a job is only ever announced once.
+
+• Append-only log (seen_jobs.log) — one "date<TAB>key" line per job, written as it's marked
+• O(1) membership checks against an in-memory dict, loaded once per process
+• Keys older than SEEN_TTL_DAYS are forgotten
+• Compaction (drop expired + repeated lines) runs on a background thread when the log
+  is mostly dead weight, and swaps the file in atomically
+• One-time import of the legacy seen_jobs.json list
+• Re-keying when the job key format changes (see JobStore._migrate), so nothing
+  already alerted on is announced again
+
+Plain text on purpose: the GitHub Actions workflow commits it, and appends diff cleanly.
+
+Run:  python seen_index.py           — show size
+      python seen_index.py compact   — compact now
+"""
+
+import json
+import os
+import sys
+import threading
+from datetime import date, timedelta
+
+from config import SEEN_INDEX_FILE, SEEN_TTL_DAYS, LEGACY_SEEN_FILE
+
+# Compact once dead lines (expired or repeated) outnumber live ones by this factor
+COMPACT_RATIO = 1.0
+
+
+class SeenIndex:
+    """Set-like index of job keys with a first-seen date each."""
+
+    def __init__(self, path: str = SEEN_INDEX_FILE, ttl_days: int = SEEN_TTL_DAYS,
+                 legacy_json: str = LEGACY_SEEN_FILE):
+        self.path     = path
+        self.ttl_days = ttl_days
+        self.lock     = threading.Lock()
+        self.keys     = {}      # key -> ISO date first seen
+        self.lines    = 0       # lines currently in the log file
+        self._compactor = None
+        self._load(legacy_json)
+
+    # ── Loading ───────────────────────────────────────────────
+    def _cutoff(self) -> str:
+        return (date.today() - timedelta(days=self.ttl_days)).isoformat()
+
+    def _load(self, legacy_json: str):
+        if not os.path.exists(self.path):
+            self._import_legacy(legacy_json)
+            return
+
+        cutoff = self._cutoff()
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                self.lines += 1
+                day, _, key = line.rstrip("\n").partition("\t")
+                if key and day >= cutoff:
+                    self.keys.setdefault(key, day)
+
+        if self.lines - len(self.keys) > COMPACT_RATIO * max(len(self.keys), 1):
+            self.compact_in_background()
+
+    def _import_legacy(self, legacy_json: str):
+        """Seed the log from the old seen_jobs.json list (all keys dated today)."""
+        if not legacy_json or not os.path.exists(legacy_json):
+            return
+        try:
+            with open(legacy_json, "r") as f:
+                keys = json.load(f)
+        except Exception:
+            return
+        self.add_many(keys)
+
+    # ── Lookups ───────────────────────────────────────────────
+    def __contains__(self, key: str) -> bool:
+        day = self.keys.get(key)
+        return day is not None and day >= self._cutoff()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    # ── Writes ────────────────────────────────────────────────
+    def add(self, key: str) -> bool:
+        """Mark one key as seen. Returns False if it already was."""
+        return self.add_many([key]) == 1
+
+    def add_many(self, keys) -> int:
+        """Mark several keys as seen with a single append. Returns how many were new."""
+        today = date.today().isoformat()
+        with self.lock:
+            new = [k for k in dict.fromkeys(keys) if k and k not in self]
+            if not new:
+                return 0
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("".join(f"{today}\t{k}\n" for k in new))
+            for k in new:
+                self.keys[k] = today
+            self.lines += len(new)
+        return len(new)
+
+    def rekey(self, pairs) -> int:
+        """
+        (old key, new key) pairs from a change of key format: every new key whose old key
+        is seen gets marked too, keeping the old first-seen date. Returns how many were added.
+        """
+        with self.lock:
+            cutoff = self._cutoff()
+            new = {}
+            for old, key in pairs:
+                day = self.keys.get(old)
+                if day and day >= cutoff and key and key not in self.keys:
+                    new.setdefault(key, day)
+            if not new:
+                return 0
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("".join(f"{d}\t{k}\n" for k, d in new.items()))
+            self.keys.update(new)
+            self.lines += len(new)
+        return len(new)
+
+    # ── Compaction ────────────────────────────────────────────
+    def compact(self) -> int:
+        """Rewrite the log with only live keys (atomic replace). Returns lines dropped."""
+        with self.lock:
+            cutoff = self._cutoff()
+            self.keys = {k: d for k, d in self.keys.items() if d >= cutoff}
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write("".join(f"{d}\t{k}\n" for k, d in self.keys.items()))
+            os.replace(tmp, self.path)
+            dropped, self.lines = self.lines - len(self.keys), len(self.keys)
+        return dropped
+
+    def compact_in_background(self):
+        if self._compactor and self._compactor.is_alive():
+            return
+        self._compactor = threading.Thread(target=self.compact, name="seen-compact", daemon=True)
+        self._compactor.start()
+
+    def wait(self):
+        """Let a running compaction finish (call before a one-shot process exits)."""
+        if self._compactor:
+            self._compactor.join()
+
+
+# ─── Singleton ────────────────────────────────────────────────────────────────
+_index      = None
+_index_lock = threading.Lock()
+
+def get_seen_index() -> SeenIndex:
+    """Get or load the shared seen-index."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = SeenIndex()
+    return _index
+
+
+if __name__ == "__main__":
+    index = get_seen_index()
+    index.wait()
+    if len(sys.argv) > 1 and sys.argv[1] == "compact":
+        print(f"✅ Compacted {index.path} — dropped {index.compact()} line(s)")
+    print(f"{len(index)} seen key(s), {index.lines} line(s) in {index.path}")
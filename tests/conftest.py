@@ -0,0 +1,11 @@
+"""
+Shared test setup: modules are imported from the repo root, and DATA_DIR points at a
+throwaway directory so nothing a test does touches real state files.
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["DATA_DIR"] = tempfile.mkdtemp(prefix="job-agent-tests-")   # before config is imported
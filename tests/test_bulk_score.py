@@ -0,0 +1,81 @@
+import json
+import re
+import sys
+import types
+
+import pytest
+
+import bulk_score
+from job_store import JobStore
+
+
+class FakeClient:
+    """Scores every job in the prompt (except `skip`) and gives out after `fail_after` requests."""
+
+    def __init__(self, fail_after=None, skip=()):
+        self.fail_after, self.skip, self.prompts = fail_after, set(skip), []
+
+    def chat(self, messages, tools, system):
+        if self.fail_after is not None and len(self.prompts) >= self.fail_after:
+            raise RuntimeError("429 quota exhausted\nretry tomorrow")
+        prompt = messages[0]["content"]
+        self.prompts.append(prompt)
+        ids = [int(i) for i in re.findall(r"### JOB (\d+)", prompt)]
+        return {"content": "Here you go:\n" + json.dumps(
+            [{"id": i, "score": 70 + i, "grade": "B", "matched_keywords": ["python"]}
+             for i in ids if i not in self.skip]
+            + [{"id": 999, "score": 100, "grade": "A"}]      # an id the model made up
+        )}
+
+
+@pytest.fixture
+def setup(tmp_path, monkeypatch):
+    store = JobStore(path=str(tmp_path / "jobs.db"), legacy_json=str(tmp_path / "none.json"))
+    ids = [store.add_job({"title": f"Engineer {i}", "company": "Acme", "description": "Python"})["id"]
+           for i in range(5)]
+    resume = tmp_path / "resume.txt"
+    resume.write_text("Python developer")
+    monkeypatch.setattr(bulk_score, "get_store", lambda: store)
+    monkeypatch.setattr(bulk_score, "RESUME_FILE", str(resume))
+    monkeypatch.setattr(bulk_score, "BULK_SCORE_BATCH", 2)
+
+    def use(client):
+        monkeypatch.setitem(sys.modules, "ai_client", types.SimpleNamespace(get_client=lambda: client))
+    return store, ids, use
+
+
+def test_stopped_run_resumes_from_its_checkpoint(setup):
+    store, ids, use = setup
+    use(FakeClient(fail_after=1))
+    first = bulk_score.run()
+    assert first == {"scored": 2, "skipped": 0, "requests": 1, "stopped": "429 quota exhausted"}
+    assert store.get_meta(bulk_score.CHECKPOINT_KEY) == str(ids[1])
+
+    client = FakeClient()
+    use(client)
+    second = bulk_score.run()
+    assert second["scored"] == 3 and second["requests"] == 2
+    assert f"### JOB {ids[0]}\n" not in "".join(client.prompts)     # not sent again
+    assert store.get_job(ids[4])["match_score"] == 70 + ids[4]
+    assert store.get_job(999) is None
+    assert store.unscored_jobs() == []
+
+
+def test_skipped_jobs_wait_for_a_restart(setup):
+    store, ids, use = setup
+    use(FakeClient(skip={ids[2]}))
+    assert bulk_score.run()["skipped"] == 1
+    assert [j["id"] for j in store.unscored_jobs()] == [ids[2]]
+
+    use(FakeClient())
+    assert bulk_score.run()["requests"] == 0            # the checkpoint is past it
+    assert bulk_score.run(restart=True)["scored"] == 1
+    assert store.unscored_jobs() == []
+
+
+def test_pack_respects_batch_size_and_prompt_budget(monkeypatch):
+    monkeypatch.setattr(bulk_score, "BULK_SCORE_BATCH", 3)
+    monkeypatch.setattr(bulk_score, "BULK_SCORE_CHARS", len(bulk_score.SYSTEM) + 400)
+    jobs = [{"id": i, "title": "T", "company": "C", "description": "x" * 150} for i in range(5)]
+    sizes = [len(b) for b in bulk_score.pack(jobs, resume="")]
+    assert sizes == [2, 2, 1]
@@ -0,0 +1,37 @@
+from dedupe import DedupeIndex, canonical_url, job_key
+
+
+def test_exact_duplicate_across_boards():
+    a = {"title": "Senior Data Analyst (Remote)", "company": "Acme Inc.",
+         "url": "https://example.com/jobs/1?utm_source=adzuna"}
+    b = {"title": "Sr. Data Analyst", "company": "ACME", "url": "https://example.com/jobs/1"}
+    assert job_key(a) == job_key(b)
+    assert canonical_url(a["url"]) == canonical_url(b["url"])
+
+    index = DedupeIndex()
+    index.add(1, a)
+    assert index.find(b) == 1
+
+
+def test_near_duplicate_title_at_same_company():
+    index = DedupeIndex()
+    index.add(1, {"title": "Backend Software Engineer Python Django APIs", "company": "Globex"})
+    near = {"title": "Backend Software Engineer Python Django REST APIs", "company": "Globex"}
+    assert index.find(near) == 1
+    assert index.find({**near, "company": "Initech"}) is None
+
+
+def test_different_seniority_is_not_a_duplicate():
+    index = DedupeIndex()
+    index.add(1, {"title": "Senior Data Analyst", "company": "Acme"})
+    assert index.find({"title": "Junior Data Analyst", "company": "Acme"}) is None
+    assert index.find({"title": "Data Analyst", "company": "Acme"}) is None
+
+
+def test_removed_job_no_longer_matches():
+    job   = {"title": "Data Analyst", "company": "Acme", "url": "https://example.com/jobs/7"}
+    index = DedupeIndex()
+    index.add(7, job)
+    index.remove(7, job)
+    assert index.find(job) is None
+    assert not index.blocks and not index.prefixes
@@ -0,0 +1,30 @@
+import time
+
+from fanout import fan_out
+
+
+def boom():
+    raise ValueError("bad response")
+
+
+def test_slow_task_times_out_without_holding_up_the_rest():
+    start   = time.monotonic()
+    results = {r["name"]: r for r in fan_out({
+        "fast": lambda: "done",
+        "slow": lambda: time.sleep(2),
+        "fail": boom,
+    }, timeout=0.3)}
+    elapsed = time.monotonic() - start
+
+    assert results["fast"]["status"] == "ok" and results["fast"]["result"] == "done"
+    assert results["fail"]["status"] == "error" and "bad response" in results["fail"]["error"]
+    assert results["slow"]["status"] == "timeout"
+    assert elapsed < 1     # the stuck thread is abandoned, not joined
+
+
+def test_per_task_deadline_overrides_default():
+    results = {r["name"]: r["status"] for r in fan_out({
+        "patient": lambda: time.sleep(0.2) or "ok",
+        "hasty":   lambda: time.sleep(0.2) or "ok",
+    }, timeout=1, timeouts={"hasty": 0.05})}
+    assert results == {"patient": "ok", "hasty": "timeout"}
@@ -0,0 +1,85 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import http_client
+
+
+class Handler(BaseHTTPRequestHandler):
+    """/etag/<name> answers 304 to a matching If-None-Match; /plain/<name> has no validators."""
+    hits = []
+
+    def do_GET(self):
+        self.hits.append((self.path, self.headers.get("If-None-Match")))
+        body = self.path.encode().ljust(1000, b".")
+        if self.path.startswith("/etag/") and self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        if self.path.startswith("/etag/"):
+            self.send_header("ETag", '"v1"')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    monkeypatch.setattr(http_client, "HTTP_CACHE_FILE", str(tmp_path / "http_cache.db"))
+    monkeypatch.setattr(http_client, "HTTP_CACHE_TTLS", {"fresh": 3600, "stale": 0})
+    monkeypatch.setattr(http_client, "_cache_conn", None)
+    monkeypatch.setattr(http_client, "_cache_stats", {"fresh": 0, "revalidated": 0, "fetched": 0})
+    Handler.hits.clear()
+    yield
+    if http_client._cache_conn is not None:
+        http_client._cache_conn.close()
+
+
+def test_fresh_hit_skips_the_network(server):
+    first  = http_client.get(f"{server}/plain/a", cache="fresh")
+    second = http_client.get(f"{server}/plain/a", cache="fresh")
+    assert second.text == first.text and second.from_cache
+    assert len(Handler.hits) == 1
+    assert http_client.cache_stats() == {"fresh": 1, "revalidated": 0, "fetched": 1}
+
+
+def test_expired_entry_is_revalidated_with_its_etag(server):
+    http_client.get(f"{server}/etag/a", cache="stale")
+    again = http_client.get(f"{server}/etag/a", cache="stale")
+    assert again.status_code == 200 and again.from_cache
+    assert again.text.startswith("/etag/a")
+    assert Handler.hits == [("/etag/a", None), ("/etag/a", '"v1"')]
+    assert http_client.cache_stats()["revalidated"] == 1
+
+
+def test_expired_entry_without_validators_is_fetched_again(server):
+    http_client.get(f"{server}/plain/a", cache="stale")
+    again = http_client.get(f"{server}/plain/a", cache="stale")
+    assert not getattr(again, "from_cache", False)
+    assert len(Handler.hits) == 2
+    assert http_client.cache_stats()["fetched"] == 2
+
+
+def test_least_recently_used_entry_is_evicted_first(server, monkeypatch):
+    monkeypatch.setattr(http_client, "HTTP_CACHE_MAX_MB", 2500 / (1024 * 1024))   # room for two bodies
+    http_client.get(f"{server}/plain/a", cache="fresh")
+    http_client.get(f"{server}/plain/b", cache="fresh")
+    http_client.get(f"{server}/plain/a", cache="fresh")     # a is now more recent than b
+    http_client.get(f"{server}/plain/c", cache="fresh")     # over the cap — b goes
+
+    cached = {r["url"].rsplit("/", 1)[-1] for r in http_client._cache().execute("SELECT url FROM responses")}
+    assert cached == {"a", "c"}
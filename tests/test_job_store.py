@@ -0,0 +1,66 @@
+import json
+
+from job_store import JobStore
+
+
+def make_store(tmp_path):
+    return JobStore(path=str(tmp_path / "jobs.db"), legacy_json=str(tmp_path / "none.json"))
+
+
+def test_counts_follow_adds_updates_and_deletes(tmp_path):
+    store = make_store(tmp_path)
+    a = store.add_job({"title": "Data Analyst", "company": "Acme", "source": "adzuna"})
+    b = store.add_job({"title": "Backend Engineer", "company": "Globex", "source": "remoteok"})
+    store.add_job({"title": "QA Tester", "company": "Initech", "source": "adzuna"})
+
+    stats = store.stats()
+    assert stats["total"] == 3
+    assert stats["status"] == {"Saved": 3}
+    assert stats["source"] == {"adzuna": 2, "remoteok": 1}
+    assert store.count() == 3
+
+    store.update_job(b["id"], {"status": "Applied"})
+    store.delete_job(a["id"])
+
+    stats = store.stats()
+    assert stats["total"] == 2
+    assert stats["status"] == {"Saved": 1, "Applied": 1}
+    assert stats["source"] == {"adzuna": 1, "remoteok": 1}
+    assert store.count(status="Applied") == 1
+    assert store.count(status="Saved") == 1
+
+
+def test_ids_are_never_reused(tmp_path):
+    store = make_store(tmp_path)
+    first = store.add_job({"title": "Data Analyst", "company": "Acme"})
+    store.delete_job(first["id"])
+    second = store.add_job({"title": "Backend Engineer", "company": "Globex"})
+    assert second["id"] > first["id"]
+    assert store.last_id() == second["id"]
+
+
+def test_export_leaves_out_descriptions(tmp_path):
+    store = make_store(tmp_path)
+    store.add_job({"title": "Data Analyst", "company": "Acme", "description": "x" * 4000})
+    out = tmp_path / "saved_jobs.json"
+    assert store.export_json(str(out)) == 1
+    exported = json.loads(out.read_text())
+    assert exported[0]["title"] == "Data Analyst" and "description" not in exported[0]
+    assert store.all_jobs()[0]["description"] == "x" * 4000    # still there for the AI tools
+
+
+def test_fresh_store_from_legacy_json_carries_seen_keys_over(tmp_path, monkeypatch):
+    import seen_index
+    from dedupe import job_key, legacy_key
+
+    job = {"id": 7, "title": "Sr. Data Analyst (Remote)", "company": "Acme Inc."}
+    (tmp_path / "saved_jobs.json").write_text(json.dumps([job]))
+    (tmp_path / "seen_jobs.json").write_text(json.dumps([legacy_key(job)]))
+    seen = seen_index.SeenIndex(path=str(tmp_path / "seen_jobs.log"),
+                                legacy_json=str(tmp_path / "seen_jobs.json"))
+    monkeypatch.setattr(seen_index, "_index", seen)
+    assert legacy_key(job) != job_key(job)
+
+    store = JobStore(path=str(tmp_path / "jobs.db"), legacy_json=str(tmp_path / "saved_jobs.json"))
+    assert store.get_job(7)["title"] == job["title"]
+    assert job_key(job) in seen
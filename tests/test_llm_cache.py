@@ -0,0 +1,70 @@
+import pytest
+
+import llm_cache
+from llm_cache import cached_completion
+
+
+@pytest.fixture(autouse=True)
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(llm_cache, "LLM_CACHE_FILE", str(tmp_path / "llm_cache.db"))
+    monkeypatch.setattr(llm_cache, "_conn", None)
+    monkeypatch.setattr(llm_cache, "_stats", {"hits": 0, "misses": 0, "refreshed": 0})
+    yield
+    if llm_cache._conn is not None:
+        llm_cache._conn.close()
+
+
+def generator(text):
+    calls = []
+    def generate():
+        calls.append(1)
+        return f"{text} #{len(calls)}"
+    return generate, calls
+
+
+def test_same_inputs_hit_and_changed_inputs_miss():
+    generate, calls = generator("letter")
+    first = cached_completion("cover_letter", 1, "m", generate, resume="r", jd="jd")
+    assert cached_completion("cover_letter", 1, "m", generate, resume="r", jd="jd") == first
+    assert len(calls) == 1
+
+    cached_completion("cover_letter", 1, "m", generate, resume="r2", jd="jd")     # resume edited
+    cached_completion("cover_letter", 2, "m", generate, resume="r", jd="jd")      # template bumped
+    cached_completion("cover_letter", 1, "m", generate, resume="r", jd="jd", options={"tone": "warm"})
+    assert len(calls) == 4
+    assert llm_cache.cache_stats()["hits"] == 1 and llm_cache.cache_stats()["misses"] == 4
+
+
+def test_refresh_regenerates_and_overwrites():
+    generate, calls = generator("prep")
+    cached_completion("interview_prep", 1, "m", generate, jd="jd")
+    fresh = cached_completion("interview_prep", 1, "m", generate, jd="jd", refresh=True)
+    assert fresh == "prep #2"
+    assert cached_completion("interview_prep", 1, "m", generate, jd="jd") == "prep #2"
+    assert len(calls) == 2
+
+
+def test_expired_entries_are_regenerated(monkeypatch):
+    generate, calls = generator("score")
+    now = llm_cache.time.time()
+    monkeypatch.setattr(llm_cache.time, "time", lambda: now)
+    cached_completion("match_score", 1, "m", generate, jd="jd")
+    monkeypatch.setattr(llm_cache.time, "time", lambda: now + (llm_cache.LLM_CACHE_TTL_DAYS + 1) * 86400)
+    assert cached_completion("match_score", 1, "m", generate, jd="jd") == "score #2"
+
+
+def test_least_recently_used_entry_is_evicted_first(monkeypatch):
+    monkeypatch.setattr(llm_cache, "LLM_CACHE_MAX_MB", 2500 / (1024 * 1024))   # room for two entries
+    clock = iter(range(1_000_000, 2_000_000))
+    monkeypatch.setattr(llm_cache.time, "time", lambda: next(clock))
+
+    def body(c):
+        return lambda: c * 1000
+
+    cached_completion("t", 1, "m", body("a"), jd="a")
+    cached_completion("t", 1, "m", body("b"), jd="b")
+    cached_completion("t", 1, "m", body("x"), jd="a")        # hit — a is now more recent than b
+    cached_completion("t", 1, "m", body("c"), jd="c")        # over the cap — b goes
+
+    kept = {r[0][0] for r in llm_cache._db().execute("SELECT text FROM completions")}
+    assert kept == {"a", "c"}
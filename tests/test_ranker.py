@@ -0,0 +1,69 @@
+import json
+import math
+
+import pytest
+
+pytest.importorskip("numpy")
+
+import ranker
+from job_records import make_job
+from ranker import B, K1, Ranker, _term_counts
+
+
+def bm25(query: dict, records: list) -> list:
+    """Plain-Python BM25 with the same field weights, to check the vectorized scores against."""
+    docs  = [_term_counts(r) for r in records]
+    avg   = max(sum(n for _, n in docs) / len(docs), 1)
+    out   = []
+    for counts, length in docs:
+        s = 0.0
+        for t, w in query.items():
+            tf = counts.get(t, 0)
+            if not tf:
+                continue
+            df  = sum(1 for c, _ in docs if t in c)
+            idf = math.log1p((len(docs) - df + 0.5) / (df + 0.5))
+            s  += w * idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / avg))
+        out.append(s)
+    return out
+
+
+RECORDS = [
+    make_job(title="Office Manager", company="A", description="Scheduling, invoices and supplies."),
+    make_job(title="Data Engineer", company="B", tags=["python", "spark"],
+             description="Build Python pipelines with Spark and Airflow."),
+    make_job(title="Frontend Developer", company="C", description="React and some Python scripting."),
+    make_job(title="Python Developer", company="D", description="Django APIs."),
+]
+
+
+def test_title_and_tag_matches_rank_first_and_misses_last():
+    r = Ranker.from_text("Python developer, Spark pipelines", skills=["Python"], roles=["Data Engineer"])
+    ranked = [rec["company"] for _, rec in r.rank(RECORDS)]
+    assert ranked[0] in ("B", "D") and ranked[-1] == "A"
+    assert ranked.index("C") > ranked.index("D")      # a description mention counts less than the title
+
+
+def test_scores_match_reference_bm25():
+    r = Ranker.from_text("python spark django react", skills=["airflow"])
+    query = dict(zip(r.terms, r.weights))
+    assert r.scores(RECORDS) == pytest.approx(bm25(query, RECORDS))
+
+
+def test_ties_keep_input_order_and_empty_input_is_fine():
+    r = Ranker.from_text("kubernetes")
+    assert [rec["company"] for _, rec in r.rank(RECORDS)] == ["A", "B", "C", "D"]
+    assert r.rank([]) == []
+
+
+def test_top_k_follows_resume_changes_and_passes_through_without_one(tmp_path, monkeypatch):
+    resume  = tmp_path / "my_resume.txt"
+    profile = tmp_path / "search_profile.json"
+    monkeypatch.setattr(ranker, "RESUME_FILE", str(resume))
+    monkeypatch.setattr(ranker, "PROFILE_FILE", str(profile))
+    monkeypatch.setattr(ranker, "_ranker_key", None)
+
+    assert ranker.top_k(RECORDS, 2) is RECORDS            # nothing to rank against
+
+    profile.write_text(json.dumps({"skills": ["react"], "job_roles": ["frontend developer"]}))
+    assert ranker.top_k(RECORDS, 1)[0]["company"] == "C"
@@ -0,0 +1,43 @@
+import pytest
+
+from rate_limit import RateLimited, RateLimiter, retry_after
+
+LIMITS = {"adzuna": [(2, 60)]}
+
+
+def make_limiter(tmp_path):
+    return RateLimiter(limits=LIMITS, path=str(tmp_path / "rate_limits.json"))
+
+
+def test_bucket_runs_dry_and_stays_dry_across_a_restart(tmp_path):
+    limiter = make_limiter(tmp_path)
+    assert limiter.acquire("adzuna", max_wait=0) == 0
+    assert limiter.acquire("adzuna", max_wait=0) == 0
+    with pytest.raises(RateLimited) as exc:
+        limiter.acquire("adzuna", max_wait=0)
+    assert 0 < exc.value.wait <= 30
+    limiter.save()
+
+    # A fresh process picks up the spent quota instead of starting full
+    with pytest.raises(RateLimited):
+        make_limiter(tmp_path).acquire("adzuna", max_wait=0)
+
+
+def test_penalize_blocks_the_provider(tmp_path):
+    limiter = make_limiter(tmp_path)
+    limiter.penalize("adzuna", 120)
+    assert limiter.status()["adzuna"] > 100
+    with pytest.raises(RateLimited):
+        limiter.acquire("adzuna", max_wait=1)
+    assert make_limiter(tmp_path).status()["adzuna"] > 100     # penalties are saved at once
+
+
+def test_unconfigured_provider_is_not_limited(tmp_path):
+    assert make_limiter(tmp_path).acquire("hn", max_wait=0) == 0
+
+
+def test_retry_after_forms():
+    assert retry_after({"Retry-After": "7"}) == 7.0
+    assert retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0.0    # already past
+    assert retry_after({}) is None
+    assert retry_after({"Retry-After": "soon"}) is None
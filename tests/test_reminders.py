@@ -0,0 +1,31 @@
+from datetime import datetime, timedelta
+
+from job_store import JobStore
+from reminders import get_followup_due
+
+
+def test_dashboard_count_matches_the_followup_list(tmp_path):
+    store   = JobStore(path=str(tmp_path / "jobs.db"), legacy_json=str(tmp_path / "none.json"))
+    old     = datetime.now() - timedelta(days=10)
+    recent  = datetime.now() - timedelta(days=2)
+    applied = [
+        (old.isoformat(), {}),                              # due
+        (old.isoformat(" ", "seconds"), {}),                # due — space separator
+        (old.date().isoformat(), {}),                       # due — date only
+        (old.isoformat() + "+00:00", {}),                   # due — with an offset
+        (old.isoformat(), {"followup_sent": True}),         # already followed up
+        (old.isoformat(), {"followup_sent": False}),        # due
+        (recent.isoformat(), {}),                           # too soon
+        (recent.date().isoformat(), {}),                    # too soon
+        ("", {}),                                           # no date
+        ("last tuesday", {}),                               # unparseable
+    ]
+    for i, (when, extra) in enumerate(applied):
+        store.add_job({"title": f"Job {i}", "company": "Acme", "status": "Applied",
+                       "applied_at": when, **extra})
+    store.add_job({"title": "Not applied", "company": "Acme", "status": "Saved",
+                   "applied_at": old.isoformat()})
+
+    due = get_followup_due(store.all_jobs(), days=7)
+    assert len(due) == 5
+    assert store.count_followups_due(days=7) == len(due)
@@ -0,0 +1,68 @@
+import pytest
+import requests
+
+import resilience
+from config import BREAKER_COOLDOWN, BREAKER_THRESHOLD
+from resilience import Breakers, CircuitOpen, retry_call
+
+
+def load(tmp_path):
+    return Breakers(path=str(tmp_path / "source_health.json"))
+
+
+def test_breaker_trips_across_runs_and_resets_after_a_good_trial(tmp_path):
+    # One failure per "cron run" — the count has to survive each save/load
+    for _ in range(BREAKER_THRESHOLD):
+        breakers = load(tmp_path)
+        breakers.before_call("indeed")
+        breakers.record_failure("indeed", RuntimeError("503 from indeed"))
+
+    breakers = load(tmp_path)
+    with pytest.raises(CircuitOpen, match="503 from indeed"):
+        breakers.before_call("indeed")
+    assert breakers.state["indeed"]["cooldown"] == BREAKER_COOLDOWN
+
+    # Cool-down over: one trial call goes through, a second waits on it
+    breakers.state["indeed"]["open_until"] = 1
+    breakers.save()
+    breakers = load(tmp_path)
+    breakers.before_call("indeed")
+    with pytest.raises(CircuitOpen, match="trial"):
+        breakers.before_call("indeed")
+    breakers.record_success("indeed")
+
+    state = load(tmp_path).state["indeed"]
+    assert state["failures"] == 0 and state["open_until"] == 0
+
+
+def test_failed_trial_reopens_with_a_longer_cooldown(tmp_path):
+    breakers = load(tmp_path)
+    for _ in range(BREAKER_THRESHOLD):
+        breakers.record_failure("hn", RuntimeError("down"))
+    breakers.state["hn"]["open_until"] = 1
+    breakers.before_call("hn")
+    breakers.record_failure("hn", RuntimeError("still down"))
+    assert load(tmp_path).state["hn"]["cooldown"] == 2 * BREAKER_COOLDOWN
+
+
+def test_retry_call_retries_only_transient_errors(monkeypatch):
+    monkeypatch.setattr(resilience.time, "sleep", lambda s: None)
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise requests.ConnectionError("reset")
+        return "ok"
+
+    assert retry_call(flaky, attempts=3) == "ok"
+    assert len(calls) == 3
+
+    def broken():
+        calls.append(1)
+        raise ValueError("bad json")
+
+    calls.clear()
+    with pytest.raises(ValueError):
+        retry_call(broken, attempts=3)
+    assert len(calls) == 1
@@ -0,0 +1,36 @@
+import pytest
+
+import tools
+from job_store import JobStore
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = JobStore(path=str(tmp_path / "jobs.db"), legacy_json=str(tmp_path / "none.json"))
+    monkeypatch.setattr(tools, "get_store", lambda: store)
+    return store
+
+
+def test_saved_duplicate_and_invalid_lines_in_input_order(store):
+    store.add_job({"title": "Data Analyst", "company": "Acme", "source": "Adzuna"})
+    out = tools.save_jobs_to_store([
+        {"title": "Backend Engineer", "company": "Globex", "source": "RemoteOK"},
+        {"title": "Data Analyst", "company": "ACME Inc.", "source": "Indeed"},       # already saved
+        {"title": "  ", "company": "Initech", "source": "HN"},                        # no title
+        "not a job",
+        {"title": "Backend Engineer", "company": "Globex", "source": "HN"},           # repeat in this batch
+        {"title": "QA Tester", "company": "Initech", "source": "Indeed"},
+    ]).splitlines()
+
+    assert out[0].startswith("[1] ✅ Saved job #")
+    assert out[1].startswith("[2] ↩️  duplicate")
+    assert out[2] == "[3] ⚠️  invalid — missing title"
+    assert out[3] == "[4] ⚠️  invalid — missing title, company, source"
+    assert out[4].startswith("[5] ↩️  duplicate")
+    assert out[5].startswith("[6] ✅ Saved job #")
+    assert out[6] == "2 saved, 2 duplicate, 2 invalid."
+    assert store.count() == 3
+
+
+def test_nothing_to_save(store):
+    assert tools.save_jobs_to_store([]) == "No jobs given."
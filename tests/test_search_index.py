@@ -0,0 +1,37 @@
+from search_index import SearchIndex, parse_query
+
+JOBS = {
+    1: {"title": "Backend Engineer", "company": "Stripe", "location": "Dublin", "status": "Applied"},
+    2: {"title": "Data Engineer", "company": "Globex", "location": "Remote", "status": "Saved"},
+    3: {"title": "Data Analyst", "company": "Stripe", "location": "London", "status": "Saved",
+        "notes": "referral from Sam"},
+}
+
+
+def test_prefix_and_field_scoped_terms():
+    index = SearchIndex(JOBS.items())
+    assert index.search("stri eng") == {1}
+    assert index.search("data") == {2, 3}
+    assert index.search("company:stripe status:saved") == {3}
+    assert index.search('title:"data engineer"') == {2}
+    assert index.search("referral") == {3}
+    assert index.search("status:saved") == {2, 3}
+    assert index.search("saved") == set()      # status only matches when asked for by field
+    assert index.search("") is None
+
+
+def test_updates_and_removals_are_reflected():
+    index = SearchIndex(JOBS.items())
+    index.add(2, {**JOBS[2], "company": "Initech"})
+    assert index.search("globex") == set()
+    assert index.search("initech") == {2}
+
+    index.remove(1)
+    assert index.search("backend") == set()
+    assert "backend" not in index.vocab["title"]
+    assert len(index) == 2
+
+
+def test_parse_query_aliases_and_bad_quotes():
+    assert parse_query("src:adzuna role:dev") == [("source", "adzuna"), ("title", "dev")]
+    assert parse_query('"unbalanced data') == [(None, "unbalanced"), (None, "data")]
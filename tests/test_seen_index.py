@@ -0,0 +1,35 @@
+from datetime import date, timedelta
+
+from seen_index import SeenIndex
+
+
+def make_index(tmp_path, **kwargs):
+    return SeenIndex(path=str(tmp_path / "seen_jobs.log"), legacy_json=None, **kwargs)
+
+
+def test_keys_survive_a_reload(tmp_path):
+    index = make_index(tmp_path)
+    assert index.add_many(["a::acme", "b::globex", "a::acme"]) == 2
+    assert not index.add("a::acme")
+
+    reloaded = make_index(tmp_path)
+    assert "a::acme" in reloaded and "b::globex" in reloaded
+    assert "c::initech" not in reloaded
+
+
+def test_expired_keys_are_forgotten_then_compacted_away(tmp_path):
+    old = (date.today() - timedelta(days=40)).isoformat()
+    (tmp_path / "seen_jobs.log").write_text(f"{old}\told::acme\n{date.today().isoformat()}\tnew::acme\n")
+
+    index = make_index(tmp_path, ttl_days=30)
+    assert "old::acme" not in index and "new::acme" in index
+    assert index.compact() == 1
+    assert (tmp_path / "seen_jobs.log").read_text().count("\n") == 1
+
+
+def test_rekey_keeps_the_first_seen_date(tmp_path):
+    index = make_index(tmp_path)
+    index.add("data analyst::acme")
+    assert index.rekey([("data analyst::acme", "analyst data::acme"), ("never seen", "x")]) == 1
+    assert "analyst data::acme" in make_index(tmp_path)
+    assert "x" not in index
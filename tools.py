@@ -2,67 +2,155 @@
 tools.py — All tool implementations for the Job Search Agent
 """
 
-import json
-import os
-import time
+import math
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from datetime import datetime
-from bs4 import BeautifulSoup
-from config import ADZUNA_APP_ID, ADZUNA_APP_KEY, GOOGLE_MAPS_API_KEY
-from more_sources import search_all_sources, search_remoteok, search_wellfound, search_indeed, search_hn_hiring
-
-# File to store seen jobs (avoids duplicate alerts)
-SEEN_JOBS_FILE = "seen_jobs.json"
-SAVED_JOBS_FILE = "saved_jobs.json"
+from datetime import datetime, timedelta
+from config import (
+    ADZUNA_APP_ID, ADZUNA_APP_KEY, GOOGLE_MAPS_API_KEY,
+    ADZUNA_COUNTRIES, ADZUNA_MAX_PAGES, ADZUNA_PAGE_SIZE, ADZUNA_CONCURRENCY
+)
+import http_client
+from fanout import fan_out
+from resilience import resilient
+from job_records import make_job, render_jobs
+from job_store import get_store, job_key
+from seen_index import get_seen_index
 
 
 # ─── TOOL 1: Search Job Boards ─────────────────────────────────────────────────
-def search_job_boards(keywords: str, location: str = "", max_days_old: int = 1) -> str:
+def fetch_job_boards(keywords: str, location: str = "", max_days_old: int = 1) -> list:
     """
-    Search Adzuna job board for fresh job postings.
+    Search Adzuna job board for fresh job postings → list of job records.
     Adzuna has a free API tier: https://developer.adzuna.com/
     """
-    try:
-        # Build API URL — Adzuna supports many countries
-        country = _detect_country(location) or "us"
-        base_url = f"https://api.adzuna.com/v1/api/jobs/{country}/search/1"
-
-        params = {
-            "app_id": ADZUNA_APP_ID,
-            "app_key": ADZUNA_APP_KEY,
-            "results_per_page": 20,
-            "what": keywords,
-            "max_days_old": max_days_old,
-            "sort_by": "date",           # Newest first!
-            "content-type": "application/json"
-        }
+    # Adzuna supports many countries
+    country = _detect_country(location) or "us"
+    return _fetch_adzuna_page(country, keywords, location, max_days_old)[0]
+
+
+# Seconds a whole crawl target (all its pages) may take
+CRAWL_TIMEOUT = 45
+
+@resilient("adzuna")
+def _fetch_adzuna_page(country: str, keywords: str, location: str = "", max_days_old: int = 1,
+                       page: int = 1, per_page: int = 20) -> tuple:
+    """One page of Adzuna results → (records, total matching count)."""
+    base_url = f"https://api.adzuna.com/v1/api/jobs/{country}/search/{page}"
+
+    params = {
+        "app_id": ADZUNA_APP_ID,
+        "app_key": ADZUNA_APP_KEY,
+        "results_per_page": per_page,
+        "what": keywords,
+        "max_days_old": max_days_old,
+        "sort_by": "date",           # Newest first!
+        "content-type": "application/json"
+    }
 
-        if location:
-            params["where"] = location
+    if location:
+        params["where"] = location
+
+    response = http_client.get(base_url, params=params, timeout=10, cache="adzuna", limit="adzuna")
+    response.raise_for_status()
+    data = response.json()
+
+    records = [
+        make_job(
+            title=job.get("title"),
+            company=job.get("company", {}).get("display_name"),
+            location=job.get("location", {}).get("display_name"),
+            url=job.get("redirect_url"),
+            posted=job.get("created", ""),
+            source="Job Board (Adzuna)",
+            tags=[job.get("category", {}).get("label")],
+            raw_id=job.get("id", ""),
+            description=job.get("description", ""),
+        )
+        for job in data.get("results", [])
+    ]
+    return records, data.get("count", len(records))
 
-        response = requests.get(base_url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
 
-        jobs = data.get("results", [])
-        if not jobs:
-            return f"No jobs found for '{keywords}' in '{location}' in the last {max_days_old} day(s)."
+def crawl_job_boards(keywords: str, location: str = "", max_days_old: int = 1,
+                     max_pages: int = ADZUNA_MAX_PAGES) -> list:
+    """
+    Crawler mode: page through Adzuna for every target at once → list of job records.
 
-        # Format results
-        output = []
-        output.append(f"Found {len(jobs)} jobs for '{keywords}':\n")
+    `location` may list several places separated by ";" (e.g. "Toronto; London").
+    With no location, every country in ADZUNA_COUNTRIES is crawled.
+    Targets crawl side by side; each fetches its later pages in waves on a shared pool of
+    ADZUNA_CONCURRENCY workers, and stops early once a page holds nothing newer than
+    max_days_old or only jobs already in the seen index.
+    """
+    places  = [p.strip() for p in location.split(";") if p.strip()]
+    targets = {p: (_detect_country(p), p) for p in places} or {c: (c, "") for c in ADZUNA_COUNTRIES}
 
-        for job in jobs:
-            posted = job.get("created", "Unknown date")
-            output.append(
-                f"📌 {job.get('title', 'N/A')}\n"
-                f"   Company:  {job.get('company', {}).get('display_name', 'N/A')}\n"
-                f"   Location: {job.get('location', {}).get('display_name', 'N/A')}\n"
-                f"   Posted:   {posted[:10] if posted != 'Unknown date' else posted}\n"
-                f"   Link:     {job.get('redirect_url', 'N/A')}\n"
-            )
+    records, errors = [], []
+    pool = ThreadPoolExecutor(max_workers=ADZUNA_CONCURRENCY, thread_name_prefix="adzuna")
+    try:
+        tasks = {
+            name: (lambda t=t: _crawl_target(pool, t, keywords, max_days_old, max_pages))
+            for name, t in targets.items()
+        }
+        for r in fan_out(tasks, timeout=CRAWL_TIMEOUT):
+            if r["status"] == "ok":
+                records.extend(r["result"])
+            else:
+                errors.append(f"{r['name']}: {r['error']}")
+    finally:
+        # Past CRAWL_TIMEOUT, drop the queued page fetches instead of waiting for them
+        # (a `with` block would shutdown(wait=True) and blow the deadline)
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    if errors and not records:
+        raise RuntimeError("; ".join(errors))
+    return records
+
+
+def _crawl_target(pool, target: tuple, keywords: str, max_days_old: int, max_pages: int) -> list:
+    """Every page of one (country, location) target, up to max_pages."""
+    country, where = target
+    found, total = _fetch_adzuna_page(country, keywords, where, max_days_old, 1, ADZUNA_PAGE_SIZE)
+    out   = list(found)
+    pages = min(max_pages, math.ceil(total / ADZUNA_PAGE_SIZE))
+    page  = 2
+
+    while page <= pages and not _crawl_should_stop(found, max_days_old):
+        wave    = range(page, min(page + ADZUNA_CONCURRENCY, pages + 1))
+        futures = [pool.submit(_fetch_adzuna_page, country, keywords, where, max_days_old, p, ADZUNA_PAGE_SIZE)
+                   for p in wave]
+        found, failed = [], False
+        for f in futures:
+            try:
+                found.extend(f.result()[0])
+            except Exception:
+                failed = True   # rate limited / past the last page — keep what we have
+        out.extend(found)
+        if failed:
+            break
+        page += len(wave)
+    return out
+
+
+def _crawl_should_stop(records: list, max_days_old: int) -> bool:
+    """True when a page adds nothing: all postings too old, or all already seen."""
+    if not records:
+        return True
+    cutoff = (datetime.now() - timedelta(days=max_days_old + 1)).date().isoformat()
+    if all(r["posted"] and r["posted"] < cutoff for r in records):
+        return True
+    seen = get_seen_index()
+    return all(job_key(r) in seen for r in records)
 
-        return "\n".join(output)
+
+def search_job_boards(keywords: str, location: str = "", max_days_old: int = 1) -> str:
+    """Adzuna search rendered as text."""
+    try:
+        jobs = fetch_job_boards(keywords, location, max_days_old)
+        if not jobs:
+            return f"No jobs found for '{keywords}' in '{location}' in the last {max_days_old} day(s)."
+        return render_jobs(jobs, f"Found {len(jobs)} jobs for '{keywords}':")
 
     except requests.exceptions.HTTPError as e:
         if "401" in str(e) or "403" in str(e):
@@ -101,17 +189,11 @@ def scrape_company_careers(company_name: str, careers_url: str, keywords: str =
     Scrape a company's career page to find jobs not listed on job boards.
     Uses BeautifulSoup to extract job listings.
     """
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        )
-    }
-
     try:
-        response = requests.get(careers_url, headers=headers, timeout=15)
+        # Browser User-Agent comes from the shared session defaults
+        response = http_client.get(careers_url, timeout=15, cache="careers")
         response.raise_for_status()
+        from bs4 import BeautifulSoup   # imported on first scrape — it's slow to load
         soup = BeautifulSoup(response.text, "html.parser")
 
         # Remove clutter
@@ -186,10 +268,10 @@ def find_startups_on_maps(industry: str, location: str, max_results: int = 10) -
     try:
         # Step 1: Find place coordinates for the city
         geocode_url = "https://maps.googleapis.com/maps/api/geocode/json"
-        geo_resp = requests.get(geocode_url, params={
+        geo_resp = http_client.get(geocode_url, params={
             "address": location,
             "key": GOOGLE_MAPS_API_KEY
-        }, timeout=10)
+        }, timeout=10, limit="maps")
         geo_data = geo_resp.json()
 
         if not geo_data.get("results"):
@@ -200,13 +282,13 @@ def find_startups_on_maps(industry: str, location: str, max_results: int = 10) -
 
         # Step 2: Search for companies in that area
         places_url = "https://maps.googleapis.com/maps/api/place/nearbysearch/json"
-        places_resp = requests.get(places_url, params={
+        places_resp = http_client.get(places_url, params={
             "location": f"{lat},{lng}",
             "radius": 10000,          # 10km radius
             "keyword": industry,
             "type": "establishment",
             "key": GOOGLE_MAPS_API_KEY
-        }, timeout=10)
+        }, timeout=10, limit="maps")
 
         places_data = places_resp.json()
         places = places_data.get("results", [])
@@ -247,19 +329,19 @@ def find_startups_on_maps(industry: str, location: str, max_results: int = 10) -
             # Get website if available (requires Place Details API call)
             if i <= 5:  # Only for top 5 to save API calls
                 try:
-                    details_resp = requests.get(
+                    details_resp = http_client.get(
                         "https://maps.googleapis.com/maps/api/place/details/json",
                         params={
                             "place_id": place_id,
                             "fields": "website",
                             "key": GOOGLE_MAPS_API_KEY
                         },
-                        timeout=5
+                        timeout=5,
+                        limit="maps"
                     )
                     website = details_resp.json().get("result", {}).get("website", "")
                     if website:
                         output[-1] = output[-1].rstrip() + f"\n   Website:  {website}\n"
-                    time.sleep(0.1)  # Rate limiting
                 except Exception:
                     pass
 
@@ -272,15 +354,9 @@ def find_startups_on_maps(industry: str, location: str, max_results: int = 10) -
 
 # ─── TOOL 4: Save Jobs ─────────────────────────────────────────────────────────
 def save_job_to_file(job_data: dict) -> str:
-    """Save a job opportunity to the local saved jobs file."""
+    """Save a job opportunity to the local job store (one row insert, skipped if already saved)."""
     try:
-        jobs = []
-        if os.path.exists(SAVED_JOBS_FILE):
-            with open(SAVED_JOBS_FILE, "r") as f:
-                jobs = json.load(f)
-
-        job_entry = {
-            "id": len(jobs) + 1,
+        saved, duplicates = get_store().add_jobs([{
             "saved_at": datetime.now().isoformat(),
             "title": job_data.get("title", ""),
             "company": job_data.get("company", ""),
@@ -292,33 +368,73 @@ def save_job_to_file(job_data: dict) -> str:
             "applied": False,
             "applied_at": "",
             "followup_sent": False
-        }
+        }])
+        if duplicates:
+            job = duplicates[0]
+            return f"↩️  Already saved: '{job['title']}' at {job['company']}"
 
-        jobs.append(job_entry)
+        job_entry = saved[0]
+        return f"✅ Saved job #{job_entry['id']}: '{job_entry['title']}' at {job_entry['company']}"
+
+    except Exception as e:
+        return f"Error saving job: {str(e)}"
 
-        with open(SAVED_JOBS_FILE, "w") as f:
-            json.dump(jobs, f, indent=2)
 
-        return f"✅ Saved job: '{job_entry['title']}' at {job_entry['company']} to {SAVED_JOBS_FILE}"
+def save_jobs_to_store(jobs: list) -> str:
+    """
+    Save several jobs in one store transaction.
+    Each item is validated (title, company and source required) and checked against
+    the jobs already saved. Returns one result line per item, in input order:
+    saved / duplicate / invalid.
+    """
+    now = datetime.now().isoformat()
+    lines, batch, slots = [None] * len(jobs or []), [], []
+
+    for i, item in enumerate(jobs or []):
+        data    = dict(item) if hasattr(item, "keys") else {}
+        missing = [f for f in ("title", "company", "source") if not str(data.get(f, "")).strip()]
+        if missing:
+            lines[i] = f"[{i + 1}] ⚠️  invalid — missing {', '.join(missing)}"
+            continue
+        batch.append({
+            "saved_at": now,
+            "title":    str(data["title"]).strip(),
+            "company":  str(data["company"]).strip(),
+            "location": str(data.get("location", "")),
+            "url":      str(data.get("url", "")),
+            "source":   str(data["source"]),
+            "notes":    str(data.get("notes", "")),
+            "status":   "Saved",
+            "applied":  False,
+            "applied_at": "",
+            "followup_sent": False
+        })
+        slots.append(i)
 
+    try:
+        saved, duplicates = get_store().add_jobs(batch)
     except Exception as e:
-        return f"Error saving job: {str(e)}"
+        return f"Error saving jobs: {str(e)}"
+
+    # add_jobs keeps input order within each list — walk the batch to line results back up
+    saved_iter, dup_ids = iter(saved), {id(j) for j in duplicates}
+    for slot, job in zip(slots, batch):
+        if id(job) in dup_ids:
+            lines[slot] = f"[{slot + 1}] ↩️  duplicate — '{job['title']}' at {job['company']} is already saved"
+        else:
+            entry = next(saved_iter)
+            lines[slot] = f"[{slot + 1}] ✅ Saved job #{entry['id']}: '{entry['title']}' at {entry['company']}"
+
+    if not lines:
+        return "No jobs given."
+    return "\n".join(lines) + f"\n{len(saved)} saved, {len(duplicates)} duplicate, {len(lines) - len(batch)} invalid."
 
 
-def load_seen_jobs() -> set:
-    """Load the set of already-seen job IDs (for monitoring mode)."""
-    if os.path.exists(SEEN_JOBS_FILE):
-        try:
-            with open(SEEN_JOBS_FILE, "r") as f:
-                return set(json.load(f))
-        except Exception:
-            return set()
-    return set()
+def load_seen_jobs():
+    """The already-seen job IDs (for monitoring mode) — set-like, supports `in` and len()."""
+    return get_seen_index()
 
 
 def mark_job_seen(job_id: str):
-    """Mark a job as seen so we don't alert on it again."""
-    seen = load_seen_jobs()
-    seen.add(job_id)
-    with open(SEEN_JOBS_FILE, "w") as f:
-        json.dump(list(seen), f)
+    """Mark a job as seen so we don't alert on it again (one appended line)."""
+    get_seen_index().add(job_id)